@@ -0,0 +1,255 @@
+"""키워드 도구 모달 차트의 수치 데이터 추출.
+
+스크린샷 대신 모달이 열릴 때 브라우저가 받는 JSON 응답(XHR)이나
+차트 DOM(Highcharts 객체)에서 성별/연령대/월별 PC·모바일 검색량을 읽어
+숫자 데이터로 반환한다.
+
+응답 스키마가 공개되어 있지 않으므로 키 이름 대신 값의 모양으로 판별한다.
+- 월별: period/month 류 키 + PC/모바일 수치 키를 가진 객체 목록
+- 성별: 남/여(male/female, m/f) 라벨에 수치가 붙은 값
+- 연령대: 연령 구간 라벨(0~12, 13-19, 20대 …)에 수치가 붙은 값
+
+결과 형식:
+    {
+        "gender": {"남성": 42.1, "여성": 57.9},
+        "age": {"0~12": 1.2, "13~19": 8.3, ...},
+        "monthly": [{"period": "2025-02", "pc": 1500, "mobile": 12000}, ...],
+    }
+"""
+import re
+
+GENDER_LABELS = {
+    "m": "남성", "male": "남성", "남": "남성", "남성": "남성", "남자": "남성",
+    "f": "여성", "female": "여성", "여": "여성", "여성": "여성", "여자": "여성",
+}
+
+_AGE_LABEL_RE = re.compile(r"^\s*(\d{1,2})\s*(세|대)?\s*([~\-]\s*(\d{1,2})?\s*세?|이상|\+)?\s*$")
+_PERIOD_KEYS = ("period", "month", "monthly", "date", "ym", "label", "name", "category")
+_PC_KEY_RE = re.compile(r"pc", re.IGNORECASE)
+_MOBILE_KEY_RE = re.compile(r"(mobile|mo(?![a-z])|모바일)", re.IGNORECASE)
+
+# 모달의 Highcharts 차트 데이터를 읽는 스크립트
+DOM_CHART_SCRIPT = """
+(sel) => {
+    const root = document.querySelector(sel);
+    if (!root || !window.Highcharts) return [];
+    const charts = (window.Highcharts.charts || []).filter(
+        c => c && c.renderTo && root.contains(c.renderTo));
+    return charts.map(c => ({
+        title: (c.title && c.title.textStr) || '',
+        categories: (c.xAxis && c.xAxis[0] && c.xAxis[0].categories) || [],
+        series: c.series.map(s => ({
+            name: s.name,
+            points: s.points.map(p => ({
+                name: p.name || p.category || '',
+                y: p.y,
+            })),
+        })),
+    }));
+}
+"""
+
+
+def _to_number(value):
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        text = value.strip().replace(",", "").rstrip("%")
+        if text.startswith("<"):
+            return 5.0
+        try:
+            return float(text)
+        except ValueError:
+            return None
+    return None
+
+
+def normalize_age_label(label):
+    """연령 라벨을 '13~19' / '50~' 형식으로 맞춘다. 연령 라벨이 아니면 None."""
+    if not isinstance(label, str):
+        return None
+    text = label.replace("세", "").replace(" ", "")
+    match = _AGE_LABEL_RE.match(text)
+    if not match:
+        return None
+    start = match.group(1)
+    if match.group(2) == "대":
+        return "{}대".format(start)
+    end = match.group(4)
+    tail = match.group(3) or ""
+    if end:
+        return "{}~{}".format(start, end)
+    if tail:
+        return "{}~".format(start)
+    return None
+
+
+def _walk(node):
+    """JSON 트리의 모든 dict/list 노드를 순회한다."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        if isinstance(current, dict):
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+
+
+def _label_value_pairs(node):
+    """{라벨: 값} dict 또는 [{name/label: 라벨, value/ratio/y: 값}] 목록을 (라벨, 숫자) 쌍으로 푼다."""
+    pairs = []
+    if isinstance(node, dict):
+        for key, value in node.items():
+            number = _to_number(value)
+            if number is not None:
+                pairs.append((str(key), number))
+    elif isinstance(node, list):
+        for item in node:
+            if not isinstance(item, dict):
+                continue
+            label = None
+            number = None
+            for key, value in item.items():
+                lower = key.lower()
+                if label is None and isinstance(value, str) and lower in (
+                    "name", "label", "gender", "age", "agegroup", "category", "type",
+                ):
+                    label = value
+                elif number is None and lower in (
+                    "value", "ratio", "y", "rate", "percent", "cnt", "count",
+                ):
+                    number = _to_number(value)
+            if label is not None and number is not None:
+                pairs.append((label, number))
+    return pairs
+
+
+def _as_gender(pairs):
+    result = {}
+    for label, number in pairs:
+        mapped = GENDER_LABELS.get(label.strip().lower())
+        if mapped:
+            result[mapped] = result.get(mapped, 0.0) + number
+    return result if len(result) == 2 else None
+
+
+def _as_age(pairs):
+    result = {}
+    for label, number in pairs:
+        mapped = normalize_age_label(label)
+        if mapped is None:
+            return None
+        result[mapped] = result.get(mapped, 0.0) + number
+    return result if len(result) >= 3 else None
+
+
+def _as_monthly(node):
+    if not isinstance(node, list) or not node:
+        return None
+    rows = []
+    for item in node:
+        if not isinstance(item, dict):
+            return None
+        period = None
+        pc = None
+        mobile = None
+        for key, value in item.items():
+            if period is None and key.lower() in _PERIOD_KEYS and isinstance(value, str):
+                period = value
+            elif pc is None and _PC_KEY_RE.search(key):
+                pc = _to_number(value)
+            elif mobile is None and _MOBILE_KEY_RE.search(key):
+                mobile = _to_number(value)
+        if period is None or pc is None or mobile is None:
+            return None
+        rows.append({"period": period, "pc": int(pc), "mobile": int(mobile)})
+    return rows
+
+
+def _to_percent(values):
+    total = sum(values.values())
+    if total <= 0:
+        return {k: 0.0 for k in values}
+    return {k: round(v / total * 100, 1) for k, v in values.items()}
+
+
+def extract_from_payloads(payloads):
+    """XHR JSON 응답 목록에서 성별/연령대/월별 데이터를 찾는다.
+
+    Args:
+        payloads: 디코딩된 JSON 객체 목록 (모달을 연 뒤 받은 응답들)
+
+    Returns:
+        찾은 항목만 담은 dict (위 모듈 설명의 형식)
+    """
+    found = {}
+    for payload in payloads:
+        for node in _walk(payload):
+            if "monthly" not in found:
+                monthly = _as_monthly(node)
+                if monthly:
+                    found["monthly"] = monthly
+                    continue
+            pairs = _label_value_pairs(node)
+            if not pairs:
+                continue
+            if "gender" not in found:
+                gender = _as_gender(pairs)
+                if gender:
+                    found["gender"] = _to_percent(gender)
+                    continue
+            if "age" not in found:
+                age = _as_age(pairs)
+                if age:
+                    found["age"] = _to_percent(age)
+    return found
+
+
+def extract_from_dom_charts(charts):
+    """DOM_CHART_SCRIPT 결과(Highcharts 차트 목록)에서 데이터를 찾는다."""
+    found = {}
+    for chart in charts:
+        series = chart.get("series", [])
+        if not series:
+            continue
+
+        names = [str(s.get("name", "")) for s in series]
+        pc_series = next((s for s, n in zip(series, names) if _PC_KEY_RE.search(n)), None)
+        mobile_series = next((s for s, n in zip(series, names) if _MOBILE_KEY_RE.search(n)), None)
+        if "monthly" not in found and pc_series and mobile_series:
+            categories = chart.get("categories") or []
+            rows = []
+            for i, (pc_point, mobile_point) in enumerate(
+                zip(pc_series["points"], mobile_series["points"])
+            ):
+                period = pc_point.get("name") or (categories[i] if i < len(categories) else str(i))
+                rows.append({
+                    "period": str(period),
+                    "pc": int(_to_number(pc_point.get("y")) or 0),
+                    "mobile": int(_to_number(mobile_point.get("y")) or 0),
+                })
+            if rows:
+                found["monthly"] = rows
+                continue
+
+        pairs = [
+            (str(p.get("name", "")), _to_number(p.get("y")))
+            for s in series for p in s.get("points", [])
+            if _to_number(p.get("y")) is not None
+        ]
+        if "gender" not in found:
+            gender = _as_gender(pairs) or _as_gender(
+                [(n, sum(_to_number(p.get("y")) or 0 for p in s["points"]))
+                 for s, n in zip(series, names)]
+            )
+            if gender:
+                found["gender"] = _to_percent(gender)
+                continue
+        if "age" not in found:
+            age = _as_age(pairs)
+            if age:
+                found["age"] = _to_percent(age)
+    return found
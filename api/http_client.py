@@ -0,0 +1,138 @@
+"""네이버 API 공용 HTTP 전송 계층.
+
+api.naver.com, openapi.naver.com, ac.search.naver.com 등 호스트별로
+keep-alive 커넥션 풀을 하나씩 프로세스 전체에서 공유하여
+매 요청마다 TCP/TLS 핸드셰이크를 반복하지 않도록 한다.
+
+HTTP2_ENABLED가 켜져 있고 httpx(+h2)가 설치되어 있으면 HTTP/2 클라이언트를,
+그렇지 않으면 requests.Session을 사용한다. 두 경우 모두 반환되는 응답 객체는
+status_code / json() / raise_for_status() / content를 동일하게 제공한다.
+"""
+import importlib.util
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.settings import (
+    HTTP_POOL_MAXSIZE,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+    HTTP2_ENABLED,
+)
+from utils import metrics
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# httpx의 HTTP/2 지원은 h2 패키지가 있어야 동작한다.
+_HTTP2_AVAILABLE = httpx is not None and importlib.util.find_spec("h2") is not None
+
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _use_http2():
+    return HTTP2_ENABLED and _HTTP2_AVAILABLE
+
+
+def _new_session():
+    """호스트 하나를 위한 requests.Session을 만든다."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        pool_block=False,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+
+def _new_http2_client():
+    """호스트 하나를 위한 httpx HTTP/2 클라이언트를 만든다."""
+    return httpx.Client(
+        http2=True,
+        headers=DEFAULT_HEADERS,
+        limits=httpx.Limits(
+            max_connections=HTTP_POOL_MAXSIZE,
+            max_keepalive_connections=HTTP_POOL_MAXSIZE,
+        ),
+        timeout=httpx.Timeout(HTTP_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+    )
+
+
+def get_client(url):
+    """URL의 호스트(scheme://netloc)에 해당하는 공유 클라이언트를 반환한다."""
+    parts = urlsplit(url)
+    key = "{}://{}".format(parts.scheme, parts.netloc)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _new_http2_client() if _use_http2() else _new_session()
+            _clients[key] = client
+        return client
+
+
+def request(method, url, params=None, headers=None, json=None, timeout=None):
+    """공유 커넥션 풀을 통해 HTTP 요청을 보낸다.
+
+    요청마다 "http" 스팬을 남기고(상태 코드, 응답 바이트 수),
+    감싸고 있는 API 호출 스팬의 status/bytes/attempts도 갱신한다.
+
+    Args:
+        timeout: None이면 (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT).
+                 숫자 하나를 주면 연결/응답 모두에 같은 값을 사용한다.
+    """
+    if timeout is None:
+        timeout = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+    elif isinstance(timeout, (int, float)):
+        timeout = (timeout, timeout)
+
+    client = get_client(url)
+    parts = urlsplit(url)
+    with metrics.span("http", method=method, host=parts.netloc, path=parts.path) as span:
+        if _use_http2():
+            connect, read = timeout
+            resp = client.request(
+                method, url, params=params, headers=headers, json=json,
+                timeout=httpx.Timeout(read, connect=connect),
+            )
+        else:
+            resp = client.request(
+                method, url, params=params, headers=headers, json=json, timeout=timeout,
+            )
+        size = len(resp.content)
+        span.set(status=resp.status_code, bytes=size)
+        if span.parent is not None:
+            span.parent.set(status=resp.status_code)
+            span.parent.incr("bytes", size)
+            span.parent.incr("attempts")
+    return resp
+
+
+def get(url, params=None, headers=None, timeout=None):
+    """공유 커넥션 풀을 통한 GET 요청."""
+    return request("GET", url, params=params, headers=headers, timeout=timeout)
+
+
+def post(url, json=None, headers=None, timeout=None):
+    """공유 커넥션 풀을 통한 POST 요청."""
+    return request("POST", url, json=json, headers=headers, timeout=timeout)
+
+
+def close_all():
+    """열려 있는 모든 커넥션 풀을 닫는다. (테스트/종료 시 사용)"""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
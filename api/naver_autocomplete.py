@@ -1,8 +1,23 @@
-from typing import List
+import asyncio
+import string
+from typing import AsyncIterator, List, Optional
+from urllib.parse import urlsplit
 
-import requests
+from api import http_client
+from config.settings import (
+    AUTOCOMPLETE_URL,
+    AUTOCOMPLETE_PARAMS,
+    AUTOCOMPLETE_CACHE_TTL,
+    AUTOCOMPLETE_CRAWL_CONCURRENCY,
+    AUTOCOMPLETE_RATE_PER_SEC,
+)
+from utils.json_codec import decode_response
+from utils.rate_limit import get_limiter
+from utils.response_cache import cached_call, expires_in
 
-from config.settings import AUTOCOMPLETE_URL, AUTOCOMPLETE_PARAMS, REQUEST_TIMEOUT
+# 확장 크롤링에 붙일 접미어: 한글 대표 음절, 영문 소문자, 숫자
+HANGUL_INITIALS = list("가나다라마바사아자차카타파하")
+DEFAULT_SUFFIXES = HANGUL_INITIALS + list(string.ascii_lowercase) + list(string.digits)
 
 
 def fetch_autocomplete_suggestions(keyword: str) -> List[str]:
@@ -21,15 +36,19 @@ def fetch_autocomplete_suggestions(keyword: str) -> List[str]:
         "Referer": "https://www.naver.com",
     }
 
-    try:
-        resp = requests.get(
+    def _fetch():
+        resp = http_client.get(
             AUTOCOMPLETE_URL,
             params=params,
             headers=headers,
-            timeout=REQUEST_TIMEOUT,
         )
         resp.raise_for_status()
-        data = resp.json()
+        return decode_response(resp)
+
+    try:
+        data = cached_call(
+            "autocomplete", params, expires_in(AUTOCOMPLETE_CACHE_TTL), _fetch
+        )
 
         suggestions = []
         for item_group in data.get("items", []):
@@ -42,3 +61,70 @@ def fetch_autocomplete_suggestions(keyword: str) -> List[str]:
 
     except Exception:
         return []
+
+
+async def crawl_autocomplete_iter(
+    seed: str,
+    depth: int = 1,
+    suffixes: Optional[List[str]] = None,
+    max_concurrency: int = AUTOCOMPLETE_CRAWL_CONCURRENCY,
+    saturation: int = 10,
+    max_queries: int = 2000,
+) -> AsyncIterator[str]:
+    """시드 키워드에 접미어를 붙여가며 자동완성을 확장 수집한다. (비동기 제너레이터)
+
+    - 0단계: 시드 자체
+    - 1단계: "시드 + 공백 + 접미어" (가, 나, …, a~z, 0~9)
+    - 2단계 이상: 이전 단계에서 결과가 saturation개 이상 꽉 찬 질의에만
+      접미어를 바로 붙여 더 깊이 들어간다 (결과가 적은 질의는 더 나올 것이 없음).
+
+    요청은 max_concurrency개까지 동시에 실행하고, 자동완성 호스트 공용
+    토큰 버킷(AUTOCOMPLETE_RATE_PER_SEC)으로 속도를 제한한다.
+    새로 발견된 연관검색어는 중복 없이 발견 즉시 내보낸다.
+
+    Args:
+        depth: 확장 단계 수 (0이면 시드만 조회)
+        suffixes: 접미어 목록. None이면 DEFAULT_SUFFIXES
+        saturation: 다음 단계로 확장할 최소 결과 수
+        max_queries: 전체 요청 수 상한
+    """
+    if suffixes is None:
+        suffixes = DEFAULT_SUFFIXES
+    limiter = get_limiter(urlsplit(AUTOCOMPLETE_URL).netloc, AUTOCOMPLETE_RATE_PER_SEC)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    seen = set()
+    queried = set()
+
+    async def _query(q):
+        async with semaphore:
+            await limiter.acquire_async()
+            return q, await asyncio.to_thread(fetch_autocomplete_suggestions, q)
+
+    level = [seed]
+    for level_num in range(depth + 1):
+        level = [q for q in level if q not in queried][:max_queries - len(queried)]
+        if not level:
+            break
+        queried.update(level)
+
+        next_level = []
+        for task in asyncio.as_completed([_query(q) for q in level]):
+            q, suggestions = await task
+            for suggestion in suggestions:
+                if suggestion not in seen:
+                    seen.add(suggestion)
+                    yield suggestion
+            if level_num == 0:
+                next_level.extend(q + " " + suffix for suffix in suffixes)
+            elif len(suggestions) >= saturation:
+                next_level.extend(q + suffix for suffix in suffixes)
+        level = next_level
+
+
+def crawl_autocomplete(seed: str, depth: int = 1, **kwargs) -> List[str]:
+    """동기 래퍼: crawl_autocomplete_iter()의 결과를 발견 순서대로 모아 반환한다."""
+
+    async def _collect():
+        return [s async for s in crawl_autocomplete_iter(seed, depth, **kwargs)]
+
+    return asyncio.run(_collect())
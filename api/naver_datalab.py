@@ -1,9 +1,23 @@
-from datetime import datetime, timedelta
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
-import requests
-
-from config.settings import DATALAB_URL, REQUEST_TIMEOUT
+from api import http_client
+from config.settings import (
+    DATALAB_URL,
+    DATALAB_MAX_WORKERS,
+    DATALAB_MAX_GROUPS,
+    DATALAB_QUOTA_ERROR_CODES,
+    RATE_LIMIT_BACKOFF_SEC,
+    RATE_LIMIT_RETRIES,
+    TREND_OVERLAP_DAYS,
+)
+from utils.json_codec import decode_response
+from utils import metrics
+from utils.errors import AuthenticationFailed, QuotaExceeded, RateLimited
+from utils.quota import get_quota_scheduler
+from utils.response_cache import cached_call, is_cached, next_day_start
+from utils.trend_store import get_trend_store, make_series_key
 
 
 # 연령대를 5단계로 통합 (네이버 데이터랩 기준)
@@ -46,21 +60,55 @@ AGE_GROUPS_V2 = {
 DEVICES = {"pc": "PC", "mo": "모바일"}
 
 
+def _is_daily_quota_error(resp):
+    """429 응답이 일일 한도 소진(errorCode 010)인지 확인한다."""
+    try:
+        error_code = decode_response(resp).get("errorCode")
+    except Exception:
+        return False
+    return str(error_code) in DATALAB_QUOTA_ERROR_CODES
+
+
 def _call_datalab_api(body, client_id, client_secret):
-    """네이버 데이터랩 API 공통 호출 함수."""
-    headers = {
-        "X-Naver-Client-Id": client_id,
-        "X-Naver-Client-Secret": client_secret,
-        "Content-Type": "application/json",
-    }
-    resp = requests.post(DATALAB_URL, json=body, headers=headers, timeout=REQUEST_TIMEOUT)
+    """네이버 데이터랩 API 공통 호출 함수.
+
+    데이터랩은 일 단위로 갱신되므로 같은 요청 본문은 다음 날 0시까지 캐시에서 응답한다.
+    실제 호출은 Client ID별 호출 예산(utils/quota.py)에서 1회씩 차감되며
+    초당 DATALAB_RATE_PER_SEC 이하로 제한된다.
+
+    429 응답 중 일일 한도 소진은 오늘 예산을 0으로 기록하고,
+    초당 한도 초과는 RATE_LIMIT_BACKOFF_SEC부터 2배씩 늘려 가며 재시도한다.
 
-    if resp.status_code == 401:
-        raise Exception("데이터랩 API 인증 실패: Client ID/Secret을 확인해주세요.")
-    if resp.status_code == 429:
-        raise Exception("데이터랩 API 호출 한도 초과: 잠시 후 다시 시도해주세요.")
-    resp.raise_for_status()
-    return resp.json()
+    Raises:
+        QuotaExceeded: 오늘 남은 호출이 없거나 일일 한도 소진 응답을 받았을 때
+        RateLimited: 재시도 후에도 초당 한도 초과 응답을 받았을 때
+    """
+    def _fetch():
+        scheduler = get_quota_scheduler()
+        headers = {
+            "X-Naver-Client-Id": client_id,
+            "X-Naver-Client-Secret": client_secret,
+            "Content-Type": "application/json",
+        }
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            if attempt:
+                time.sleep(RATE_LIMIT_BACKOFF_SEC * 2 ** (attempt - 1))
+            scheduler.acquire("datalab", client_id)
+            resp = http_client.post(DATALAB_URL, json=body, headers=headers)
+            if resp.status_code != 429:
+                break
+            if _is_daily_quota_error(resp):
+                scheduler.mark_exhausted("datalab", client_id)
+                raise QuotaExceeded("datalab")
+
+        if resp.status_code == 401:
+            raise AuthenticationFailed("데이터랩 API 인증 실패: Client ID/Secret을 확인해주세요.")
+        if resp.status_code == 429:
+            raise RateLimited("datalab", RATE_LIMIT_BACKOFF_SEC * 2 ** RATE_LIMIT_RETRIES)
+        resp.raise_for_status()
+        return decode_response(resp)
+
+    return cached_call("datalab", body, next_day_start, _fetch)
 
 
 def _get_date_range_monthly():
@@ -110,7 +158,86 @@ def _extract_ratios_by_group(api_response):
     return result
 
 
-def fetch_demographics(keyword, client_id, client_secret):
+def _extract_series_by_group(api_response):
+    """API 응답에서 keywordGroup별 기간 시계열을 추출한다.
+
+    Returns:
+        {groupName: [{"period": "2025-02-01", "ratio": 85.3}, ...], ...}
+    """
+    result = {}
+    try:
+        for r in api_response.get("results", []):
+            result[r.get("title", "")] = [
+                {"period": d.get("period", ""), "ratio": float(d.get("ratio", 0.0))}
+                for d in r.get("data", [])
+            ]
+    except (IndexError, TypeError, ValueError):
+        pass
+    return result
+
+
+def _fetch_segment(body, client_id, client_secret, extract, default):
+    """요청 1개를 호출해 extract(응답)을 반환한다. 실패 시 default.
+
+    호출 예산 부족(QuotaExceeded), 초당 한도 초과(RateLimited), 인증 실패
+    (AuthenticationFailed)는 default로 바꾸지 않고 그대로 전파한다.
+    키 풀(utils/credential_pool.py)이 이 예외를 보고 다른 키 세트로 다시 시도한다.
+    """
+    try:
+        resp = _call_datalab_api(body, client_id, client_secret)
+        return extract(resp)
+    except (QuotaExceeded, RateLimited, AuthenticationFailed):
+        raise
+    except Exception:
+        return default
+
+
+def _fetch_segments(bodies, client_id, client_secret, extract, default, max_workers=None):
+    """여러 요청을 동시에 실행해 각 응답에 extract를 적용한다.
+
+    Args:
+        bodies: {segment_key: request_body, ...}
+        extract: 응답 dict → 결과값 변환 함수
+        default: 호출/변환 실패 시 사용할 값 (예산/한도/인증 오류는 전파, _fetch_segment 참고)
+        max_workers: 동시 실행 스레드 수. None이면 DATALAB_MAX_WORKERS, 1이면 순차 실행.
+
+    Returns:
+        {segment_key: value, ...} - bodies와 같은 키 순서
+
+    Raises:
+        QuotaExceeded: 캐시에 없는 요청 수만큼 오늘 남은 호출이 없을 때 (호출 전에 확인)
+    """
+    if max_workers is None:
+        max_workers = DATALAB_MAX_WORKERS
+    keys = list(bodies)
+
+    # 일부 세그먼트만 받고 나머지를 0으로 채우지 않도록 시작 전에 예산을 확인한다.
+    cost = sum(1 for key in keys if not is_cached("datalab", bodies[key]))
+    if cost:
+        get_quota_scheduler().admit("datalab", client_id, cost)
+
+    def _run(key):
+        return _fetch_segment(bodies[key], client_id, client_secret, extract, default)
+
+    if max_workers <= 1 or len(keys) <= 1:
+        return {key: _run(key) for key in keys}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+        return dict(zip(keys, executor.map(metrics.bind(_run), keys)))
+
+
+def _fetch_segment_ratio_sums(bodies, client_id, client_secret, max_workers=None):
+    """여러 세그먼트 요청을 동시에 실행해 각 ratio 합계를 구한다.
+
+    Returns:
+        {segment_key: ratio_sum, ...} - bodies와 같은 키 순서, 실패한 세그먼트는 0.0
+    """
+    return _fetch_segments(
+        bodies, client_id, client_secret, _extract_ratio_sum, 0.0, max_workers
+    )
+
+
+def fetch_demographics(keyword, client_id, client_secret, max_workers=None):
     """앵커 정규화 방식으로 정확한 성별/연령대 비중을 구한다.
 
     네이버 데이터랩 API는 호출마다 독립적으로 정규화(max=100)하므로
@@ -133,14 +260,23 @@ def fetch_demographics(keyword, client_id, client_secret):
         (gender_data, age_data)
         gender_data: {"남성": float, "여성": float} - 비율(%)
         age_data: {"10대": float, ...} - 비율(%)
+
+    여러 키 세트를 쓰려면 키 풀로 감싸 호출한다. 401/429로 실패하면 다른 키로
+    다시 시도하며, 이미 받은 세그먼트는 응답 캐시에서 재사용된다.
+        pool_from_credentials(credentials, "datalab").call(fetch_demographics, keyword)
+
+    Raises:
+        QuotaExceeded: 필요한 호출(최대 13회)만큼 오늘 남은 예산이 없을 때
+        RateLimited / AuthenticationFailed: 초당 한도 초과 / 인증 실패 응답을 받았을 때
     """
     start_date, end_date = _get_date_range_monthly()
 
-    # ── 성별 비중 산출 ──
-    # 남성/여성 각각 호출, timeUnit="date"로 일별 데이터 확보 (약 30개 포인트)
-    gender_sums = {}
+    # ── 성별/연령대 세그먼트 요청 구성 ──
+    # 남성/여성 2회 + 11개 개별 연령 코드 11회, timeUnit="date"로 일별 데이터 확보
+    # (약 30개 포인트). 13개 요청은 서로 독립적이므로 한 번에 동시 실행한다.
+    bodies = {}
     for gender_code, gender_label in GENDERS.items():
-        body = {
+        bodies[("gender", gender_label)] = {
             "startDate": start_date,
             "endDate": end_date,
             "timeUnit": "date",
@@ -149,24 +285,8 @@ def fetch_demographics(keyword, client_id, client_secret):
             ],
             "gender": gender_code,
         }
-        try:
-            resp = _call_datalab_api(body, client_id, client_secret)
-            gender_sums[gender_label] = _extract_ratio_sum(resp)
-        except Exception:
-            gender_sums[gender_label] = 0.0
-        time.sleep(0.05)
-
-    gender_total = sum(gender_sums.values())
-    if gender_total > 0:
-        gender_data = {k: round(v / gender_total * 100, 1) for k, v in gender_sums.items()}
-    else:
-        gender_data = {k: 0.0 for k in gender_sums}
-
-    # ── 연령대 비중 산출 ──
-    # 11개 개별 연령 코드로 각각 호출하여 세밀하게 비교 후 5단계로 합산
-    age_code_sums = {}
     for age_code in AGE_CODES_ALL:
-        body = {
+        bodies[("age", age_code)] = {
             "startDate": start_date,
             "endDate": end_date,
             "timeUnit": "date",
@@ -175,14 +295,20 @@ def fetch_demographics(keyword, client_id, client_secret):
             ],
             "ages": [age_code],
         }
-        try:
-            resp = _call_datalab_api(body, client_id, client_secret)
-            age_code_sums[age_code] = _extract_ratio_sum(resp)
-        except Exception:
-            age_code_sums[age_code] = 0.0
-        time.sleep(0.05)
 
-    # 5단계로 합산
+    sums = _fetch_segment_ratio_sums(bodies, client_id, client_secret, max_workers)
+
+    # ── 성별 비중 산출 ──
+    gender_sums = {label: sums[("gender", label)] for label in GENDERS.values()}
+    gender_total = sum(gender_sums.values())
+    if gender_total > 0:
+        gender_data = {k: round(v / gender_total * 100, 1) for k, v in gender_sums.items()}
+    else:
+        gender_data = {k: 0.0 for k in gender_sums}
+
+    # ── 연령대 비중 산출 ──
+    # 11개 개별 연령 코드 결과를 5단계로 합산
+    age_code_sums = {code: sums[("age", code)] for code in AGE_CODES_ALL}
     age_group_sums = {}
     for group_label, codes in AGE_GROUPS.items():
         age_group_sums[group_label] = sum(age_code_sums.get(c, 0.0) for c in codes)
@@ -219,11 +345,13 @@ def fetch_monthly_trend(keyword, client_id, client_secret):
             return []
         data = results[0].get("data", [])
         return [{"period": d.get("period", ""), "ratio": float(d.get("ratio", 0))} for d in data]
+    except (QuotaExceeded, RateLimited, AuthenticationFailed):
+        raise
     except Exception:
         return []
 
 
-def fetch_demographics_by_device(keyword, client_id, client_secret):
+def fetch_demographics_by_device(keyword, client_id, client_secret, max_workers=None):
     """디바이스별(PC/모바일) 성별/연령대 비중을 구한다.
 
     비율 계산 기준:
@@ -234,15 +362,21 @@ def fetch_demographics_by_device(keyword, client_id, client_secret):
         (gender_data, age_data)
         gender_data: {"남성": {"PC": float, "모바일": float}, "여성": {...}}
         age_data: {"0~12": {"PC": float, "모바일": float}, ...}
+
+    fetch_demographics()와 같이 키 풀로 감싸 여러 키 세트에 나눠 호출할 수 있다.
+
+    Raises:
+        QuotaExceeded: 필요한 호출(최대 18회)만큼 오늘 남은 예산이 없을 때
+        RateLimited / AuthenticationFailed: 초당 한도 초과 / 인증 실패 응답을 받았을 때
     """
     start_date, end_date = _get_date_range_monthly()
 
-    # ── 성별 × 디바이스 (4회 호출) ──
-    gender_device_sums = {}
+    # ── 성별 × 디바이스 (4회) + 연령대 × 디바이스 (7그룹 × 2디바이스 = 14회) ──
+    # 18개 요청은 서로 독립적이므로 한 번에 동시 실행한다.
+    bodies = {}
     for gender_code, gender_label in GENDERS.items():
-        gender_device_sums[gender_label] = {}
         for device_code, device_label in DEVICES.items():
-            body = {
+            bodies[("gender", gender_label, device_label)] = {
                 "startDate": start_date,
                 "endDate": end_date,
                 "timeUnit": "date",
@@ -252,12 +386,28 @@ def fetch_demographics_by_device(keyword, client_id, client_secret):
                 "gender": gender_code,
                 "device": device_code,
             }
-            try:
-                resp = _call_datalab_api(body, client_id, client_secret)
-                gender_device_sums[gender_label][device_label] = _extract_ratio_sum(resp)
-            except Exception:
-                gender_device_sums[gender_label][device_label] = 0.0
-            time.sleep(0.05)
+    for group_label, codes in AGE_GROUPS_V2.items():
+        for device_code, device_label in DEVICES.items():
+            bodies[("age", group_label, device_label)] = {
+                "startDate": start_date,
+                "endDate": end_date,
+                "timeUnit": "date",
+                "keywordGroups": [
+                    {"groupName": keyword, "keywords": [keyword]}
+                ],
+                "ages": codes,
+                "device": device_code,
+            }
+
+    sums = _fetch_segment_ratio_sums(bodies, client_id, client_secret, max_workers)
+
+    gender_device_sums = {
+        gender_label: {
+            device_label: sums[("gender", gender_label, device_label)]
+            for device_label in DEVICES.values()
+        }
+        for gender_label in GENDERS.values()
+    }
 
     # 성별 비율: 디바이스별로 각각 100%가 되도록 정규화
     # PC내: 남성% + 여성% = 100%
@@ -278,27 +428,13 @@ def fetch_demographics_by_device(keyword, client_id, client_secret):
             else:
                 gender_data[g_label][device_label] = 0.0
 
-    # ── 연령대 × 디바이스 (7그룹 × 2디바이스 = 14회 호출) ──
-    age_device_sums = {}
-    for group_label, codes in AGE_GROUPS_V2.items():
-        age_device_sums[group_label] = {}
-        for device_code, device_label in DEVICES.items():
-            body = {
-                "startDate": start_date,
-                "endDate": end_date,
-                "timeUnit": "date",
-                "keywordGroups": [
-                    {"groupName": keyword, "keywords": [keyword]}
-                ],
-                "ages": codes,
-                "device": device_code,
-            }
-            try:
-                resp = _call_datalab_api(body, client_id, client_secret)
-                age_device_sums[group_label][device_label] = _extract_ratio_sum(resp)
-            except Exception:
-                age_device_sums[group_label][device_label] = 0.0
-            time.sleep(0.05)
+    age_device_sums = {
+        group_label: {
+            device_label: sums[("age", group_label, device_label)]
+            for device_label in DEVICES.values()
+        }
+        for group_label in AGE_GROUPS_V2
+    }
 
     # 연령대 비율: 디바이스별로 각각 100%가 되도록 정규화
     # PC내: 전연령합 = 100%
@@ -353,9 +489,10 @@ def fetch_monthly_trend_by_device(keyword, client_id, client_secret):
                 ]
             else:
                 result[device_label] = []
+        except (QuotaExceeded, RateLimited, AuthenticationFailed):
+            raise
         except Exception:
             result[device_label] = []
-        time.sleep(0.05)
 
     return result
 
@@ -422,3 +559,217 @@ def estimate_absolute_volume(trend_by_device, pc_monthly, mobile_monthly):
         })
 
     return result
+
+
+def fetch_trends_packed(
+    keywords,
+    anchor,
+    client_id,
+    client_secret,
+    start_date=None,
+    end_date=None,
+    time_unit="date",
+    filters=None,
+    max_workers=None,
+):
+    """앵커 키워드를 끼워 넣어 여러 키워드의 추이를 하나의 스케일로 조회한다.
+
+    데이터랩은 호출마다 독립적으로 정규화하지만, 한 호출 안의 keywordGroups는
+    같은 스케일을 공유한다. 그래서 요청마다 대상 키워드 4개 + 고정 앵커 1개를
+    넣고, 각 묶음의 앵커 ratio 합이 첫 묶음의 앵커 ratio 합과 같아지도록
+    묶음 전체를 재조정한다. N개 키워드를 약 N/4회 호출로 비교할 수 있다.
+
+    Args:
+        keywords: 비교할 키워드 목록 (앵커와 같은 키워드는 앵커 값으로 대체)
+        anchor: 모든 묶음에 공통으로 넣을 기준 키워드 (검색량이 꾸준한 키워드 권장)
+        start_date, end_date: 조회 기간. None이면 최근 1개월
+        time_unit: "date" / "week" / "month"
+        filters: 요청 본문에 그대로 추가할 필터 (예: {"gender": "f", "device": "mo"})
+                 성별/연령/디바이스 세그먼트도 키워드 간 비교가 가능해진다.
+
+    Returns:
+        {keyword: [{"period": "2025-02-01", "ratio": 85.3}, ...], ...}
+        앵커 키워드도 포함된다. 호출이 실패했거나(아래 예외 제외) 앵커 값이 0인
+        묶음의 키워드는 []. 기준 스케일은 앵커 값이 있는 첫 묶음이다.
+
+    Raises:
+        QuotaExceeded: 묶음 수만큼 오늘 남은 호출이 없을 때. 호출 전에 전체를 확인하므로
+                       일부 묶음만 [] 로 채운 결과를 반환하지 않는다.
+        RateLimited / AuthenticationFailed: 초당 한도 초과 / 인증 실패 응답을 받았을 때
+    """
+    if start_date is None or end_date is None:
+        start_date, end_date = _get_date_range_monthly()
+
+    targets = []
+    for keyword in keywords:
+        if keyword != anchor and keyword not in targets:
+            targets.append(keyword)
+
+    per_request = DATALAB_MAX_GROUPS - 1
+    bodies = {}
+    for i in range(0, len(targets), per_request):
+        chunk = targets[i:i + per_request]
+        body = {
+            "startDate": start_date,
+            "endDate": end_date,
+            "timeUnit": time_unit,
+            "keywordGroups": [
+                {"groupName": kw, "keywords": [kw]} for kw in [anchor] + chunk
+            ],
+        }
+        if filters:
+            body.update(filters)
+        bodies[tuple(chunk)] = body
+
+    if not bodies:
+        bodies[()] = {
+            "startDate": start_date,
+            "endDate": end_date,
+            "timeUnit": time_unit,
+            "keywordGroups": [{"groupName": anchor, "keywords": [anchor]}],
+            **(filters or {}),
+        }
+
+    series_by_chunk = _fetch_segments(
+        bodies, client_id, client_secret, _extract_series_by_group, {}, max_workers
+    )
+
+    # 첫 번째로 앵커 값이 있는 묶음을 기준 스케일로 삼는다.
+    reference_sum = 0.0
+    for series in series_by_chunk.values():
+        reference_sum = sum(d["ratio"] for d in series.get(anchor, []))
+        if reference_sum > 0:
+            result = {anchor: series[anchor]}
+            break
+    else:
+        result = {anchor: []}
+
+    for chunk, series in series_by_chunk.items():
+        anchor_sum = sum(d["ratio"] for d in series.get(anchor, []))
+        for kw in chunk:
+            if anchor_sum <= 0 or kw not in series:
+                result[kw] = []
+                continue
+            scale = reference_sum / anchor_sum
+            result[kw] = [
+                {"period": d["period"], "ratio": d["ratio"] * scale}
+                for d in series[kw]
+            ]
+
+    return result
+
+
+def fetch_ratio_sums_packed(keywords, anchor, client_id, client_secret, **kwargs):
+    """fetch_trends_packed() 결과를 키워드별 기간 ratio 합계로 요약한다.
+
+    같은 filters로 조회한 값끼리는 키워드 간 직접 비교가 가능하다.
+
+    Returns:
+        {keyword: ratio_sum, ...}
+    """
+    trends = fetch_trends_packed(keywords, anchor, client_id, client_secret, **kwargs)
+    return {kw: sum(d["ratio"] for d in series) for kw, series in trends.items()}
+
+
+def fetch_daily_trend_incremental(
+    keyword,
+    client_id,
+    client_secret,
+    days=31,
+    overlap_days=TREND_OVERLAP_DAYS,
+    filters=None,
+    store=None,
+):
+    """일별 추이를 저장소에 누적하며 비어 있는 날짜만 받아 갱신한다.
+
+    매번 전체 기간(days일)을 다시 받지 않는다. 저장된 구간과 overlap_days일 겹치도록
+    비어 있는 앞부분(기간 시작 ~ 첫 저장일)이나 뒷부분(마지막 저장일 ~ 어제)만 조회하고,
+    겹치는 구간의 ratio 합 비율로 새 값을 저장된 스케일에 맞춘 뒤 채워 넣는다.
+    저장된 값이 없으면 전체 기간을, 겹치는 구간이 전부 0이면 이 시리즈에 요청된
+    가장 긴 기간을 새로 받아 교체한다.
+
+    Args:
+        days: 반환할 기간 (어제 기준 최근 days일)
+        overlap_days: 스케일 재조정에 사용할 겹침 일수
+        filters: 요청 본문에 추가할 필터 (예: {"device": "mo"})
+        store: TrendStore. None이면 프로세스 공용 저장소
+
+    Returns:
+        [{"period": "2025-02-01", "ratio": 85.3}, ...] - 저장된 스케일 기준
+
+    Raises:
+        QuotaExceeded 등 API 호출 오류: 갱신이 필요한데 호출에 실패했을 때
+    """
+    if store is None:
+        store = get_trend_store()
+    series_key = make_series_key(keyword, filters)
+    max_days = store.note_window(series_key, days)
+
+    end = datetime.now() - timedelta(days=1)
+    window_start = end - timedelta(days=days)
+    end_str = end.strftime("%Y-%m-%d")
+    window_start_str = window_start.strftime("%Y-%m-%d")
+    retain_start_str = (end - timedelta(days=max_days)).strftime("%Y-%m-%d")
+
+    def _request(start_str, end_str):
+        body = {
+            "startDate": start_str,
+            "endDate": end_str,
+            "timeUnit": "date",
+            "keywordGroups": [
+                {"groupName": keyword, "keywords": [keyword]}
+            ],
+        }
+        if filters:
+            body.update(filters)
+        series = _extract_series_by_group(
+            _call_datalab_api(body, client_id, client_secret)
+        )
+        return [(d["period"], d["ratio"]) for d in series.get(keyword, [])]
+
+    def _shift(period, delta):
+        date = datetime.strptime(period, "%Y-%m-%d") + timedelta(days=delta)
+        return date.strftime("%Y-%m-%d")
+
+    stored = store.load(series_key, start=window_start_str, end=end_str)
+
+    if not stored:
+        store.replace(series_key, _request(window_start_str, end_str))
+    else:
+        first_period, last_period = stored[0][0], stored[-1][0]
+        head_missing = first_period > window_start_str
+        tail_missing = last_period < end_str
+        if head_missing or tail_missing:
+            # 앞/뒤 빈 구간과 저장된 구간의 겹침을 한 번에 받는다.
+            # (데이터랩 호출 1회 비용은 기간 길이와 무관하다.)
+            if head_missing:
+                request_start = window_start_str
+            else:
+                request_start = max(_shift(last_period, 1 - overlap_days), window_start_str)
+            if tail_missing:
+                request_end = end_str
+            else:
+                request_end = min(_shift(first_period, overlap_days - 1), end_str)
+            fresh = _request(request_start, request_end)
+
+            stored_map = dict(stored)
+            overlap = [(p, r) for p, r in fresh if p in stored_map]
+            fresh_sum = sum(r for _, r in overlap)
+            stored_sum = sum(stored_map[p] for p, _ in overlap)
+
+            if fresh_sum > 0 and stored_sum > 0:
+                scale = stored_sum / fresh_sum
+                store.save(
+                    series_key,
+                    [(p, r * scale) for p, r in fresh if p not in stored_map],
+                )
+            else:
+                # 겹치는 구간이 전부 0이면 스케일을 맞출 수 없으므로
+                # 다른 호출이 쓰는 더 긴 기간까지 포함해 새로 받는다.
+                store.replace(series_key, _request(retain_start_str, end_str))
+
+    store.prune(series_key, retain_start_str)
+    return [
+        {"period": period, "ratio": ratio}
+        for period, ratio in store.load(series_key, start=window_start_str, end=end_str)
+    ]
@@ -1,11 +1,27 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List
 
-import pandas as pd
-import requests
-
-from config.settings import SEARCHAD_BASE_URL, SEARCHAD_KEYWORD_URI, REQUEST_TIMEOUT
+from api import http_client
+from config.settings import (
+    SEARCHAD_BASE_URL,
+    SEARCHAD_KEYWORD_URI,
+    KEYWORDSTOOL_MAX_HINTS,
+    KEYWORDSTOOL_MAX_WORKERS,
+    RATE_LIMIT_BACKOFF_SEC,
+    RATE_LIMIT_RETRIES,
+)
 from utils.auth import get_searchad_headers
+from utils.errors import AuthenticationFailed, RateLimited
+from utils.json_codec import decode_response
+from utils import metrics
+from utils.quota import get_quota_scheduler
+from utils.response_cache import cached_call, next_month_start
+
+# numpy/pandas는 첫 응답을 파싱할 때 불러온다 (앱 시작 시간 단축).
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def _parse_search_count(value) -> int:
@@ -23,105 +39,260 @@ def _parse_search_count(value) -> int:
     return 0
 
 
-def fetch_related_keywords(
-    keyword: str,
-    api_key: str,
-    secret_key: str,
-    customer_id: str,
-) -> pd.DataFrame:
-    """네이버 검색광고 API로 연관 키워드와 월간 검색량을 조회한다.
+def _parse_search_counts(values):
+    """검색량 값 목록을 한 번에 int32 배열로 변환한다.
+
+    _parse_search_count()의 벡터화 버전. '< 10'은 5로, 쉼표가 들어간 문자열은
+    숫자로, 해석할 수 없는 값은 0으로 처리한다.
 
     Returns:
-        DataFrame with columns: 키워드, PC검색량, 모바일검색량, 총검색량, 경쟁도,
-                                 PC검색량_원본, 모바일검색량_원본
+        (counts, under_ten) - int32 배열, '< 10' 여부 bool 배열
+    """
+    import numpy as np
+    import pandas as pd
+
+    text = (
+        pd.Series(values, dtype=object)
+        .astype(str)
+        .str.strip()
+        .str.replace(",", "", regex=False)
+    )
+    under_ten = text.str.startswith("<").to_numpy(dtype=bool)
+    counts = pd.to_numeric(text, errors="coerce").fillna(0).to_numpy(dtype=np.int32)
+    counts = np.where(under_ten, np.int32(5), counts)
+    return counts, under_ten
+
+
+RELATED_KEYWORD_COLUMNS = [
+    "키워드", "PC검색량", "모바일검색량", "총검색량", "경쟁도",
+    "PC검색량_원본", "모바일검색량_원본", "PC검색량_10미만", "모바일검색량_10미만",
+]
+
+
+def _normalize_keyword(keyword: str) -> str:
+    """키워드 비교용 정규화 (소문자, 공백 제거)."""
+    return keyword.lower().replace(" ", "")
+
+
+class KeywordToolResult:
+    """/keywordstool 응답을 한 번만 파싱해 열 단위 배열로 보관한다.
+
+    연관 키워드 표(to_dataframe)와 힌트 키워드의 정확 일치 검색량(volume_of)을
+    같은 응답에서 제공하므로 두 값을 위해 API를 두 번 호출할 필요가 없다.
+
+    행마다 dict를 만들지 않고 검색량은 int32 배열, 경쟁도는 범주형으로 저장하며
+    '< 10' 여부는 bool 배열로 기억한다.
+
+    DataFrame의 '_원본' 열은 API 원문 문자열이 아니라 '< 10'을 결측(<NA>)으로 둔
+    정수(Int64) 열이다. '< 10' 여부는 '_10미만' bool 열에 따로 남기므로 CSV로 내보내도
+    정보가 사라지지 않는다. 천 단위 구분 기호와 '< 10' 표시는 화면에 그릴 때만 붙인다.
+    DataFrame은 UI에서 필요할 때 to_dataframe()으로만 생성한다.
+    """
+
+    __slots__ = (
+        "keywords", "pc", "mobile", "pc_under_ten", "mobile_under_ten",
+        "comp_idx", "_index",
+    )
+
+    def __init__(self, keyword_list, dedupe=False):
+        keywords = [item.get("relKeyword", "") for item in keyword_list]
+
+        # 정규화 키워드 → 첫 번째 행 번호
+        index = {}
+        keep = []
+        for i, keyword in enumerate(keywords):
+            normalized = _normalize_keyword(keyword)
+            if normalized in index:
+                if dedupe:
+                    continue
+            else:
+                index[normalized] = len(keep)
+            keep.append(i)
+
+        if len(keep) != len(keyword_list):
+            keyword_list = [keyword_list[i] for i in keep]
+            keywords = [keywords[i] for i in keep]
+
+        self.keywords = keywords
+        self._index = index
+        self.pc, self.pc_under_ten = _parse_search_counts(
+            [item.get("monthlyPcQcCnt", 0) for item in keyword_list]
+        )
+        self.mobile, self.mobile_under_ten = _parse_search_counts(
+            [item.get("monthlyMobileQcCnt", 0) for item in keyword_list]
+        )
+        import pandas as pd
+
+        self.comp_idx = pd.Categorical(
+            [item.get("compIdx", "") for item in keyword_list]
+        )
+
+    def __len__(self):
+        return len(self.keywords)
+
+    @property
+    def total(self):
+        """PC + 모바일 검색량 배열."""
+        return self.pc + self.mobile
+
+    def volume_of(self, keyword: str) -> dict:
+        """키워드의 PC/모바일 월간 검색량을 반환한다. 없으면 0.
+
+        Returns:
+            {"pc": 1500, "mobile": 12000}
+        """
+        i = self._index.get(_normalize_keyword(keyword))
+        if i is None:
+            return {"pc": 0, "mobile": 0}
+        return {"pc": int(self.pc[i]), "mobile": int(self.mobile[i])}
+
+    def top_keywords(self, n: int) -> List[str]:
+        """총검색량 상위 n개 키워드를 반환한다."""
+        import numpy as np
+
+        order = np.argsort(-self.total, kind="stable")[:n]
+        return [self.keywords[i] for i in order]
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """연관 키워드 표를 총검색량 내림차순 DataFrame으로 반환한다."""
+        import pandas as pd
+
+        if not self.keywords:
+            return pd.DataFrame(columns=RELATED_KEYWORD_COLUMNS)
+        df = pd.DataFrame({
+            "키워드": self.keywords,
+            "PC검색량": self.pc,
+            "모바일검색량": self.mobile,
+            "총검색량": self.total,
+            "경쟁도": self.comp_idx,
+            "PC검색량_원본": pd.array(self.pc, dtype="Int64"),
+            "모바일검색량_원본": pd.array(self.mobile, dtype="Int64"),
+            "PC검색량_10미만": self.pc_under_ten,
+            "모바일검색량_10미만": self.mobile_under_ten,
+        })
+        # '< 10'은 실제 값을 알 수 없으므로 결측으로 둔다.
+        df.loc[self.pc_under_ten, "PC검색량_원본"] = pd.NA
+        df.loc[self.mobile_under_ten, "모바일검색량_원본"] = pd.NA
+        df = df.sort_values("총검색량", ascending=False, kind="stable").reset_index(drop=True)
+        return df
+
+
+def _request_keywordstool(hints, api_key, secret_key, customer_id):
+    """/keywordstool을 1회 호출해 keywordList를 반환한다.
+
+    hints는 최대 KEYWORDSTOOL_MAX_HINTS개까지 쉼표로 묶어 한 요청에 보낸다.
+    실제 호출은 API 키별 호출 예산(utils/quota.py)을 거친다.
+    검색광고 API에는 일일 한도가 없으므로 429는 초당 한도 초과로 보고
+    RATE_LIMIT_BACKOFF_SEC부터 2배씩 늘려 가며 재시도한다.
+
     Raises:
-        Exception: API 호출 실패 시
+        RateLimited: 재시도 후에도 429 응답을 받았을 때 (잠시 후 다시 시도 가능)
     """
     url = SEARCHAD_BASE_URL + SEARCHAD_KEYWORD_URI
-    headers = get_searchad_headers("GET", SEARCHAD_KEYWORD_URI, api_key, secret_key, customer_id)
     params = {
-        "hintKeywords": keyword,
+        "hintKeywords": ",".join(hints),
         "showDetail": "1",
     }
 
-    resp = requests.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
-
-    if resp.status_code == 401:
-        raise Exception("검색광고 API 인증 실패: API 키를 확인해주세요.")
-    if resp.status_code == 429:
-        raise Exception("검색광고 API 호출 한도 초과: 잠시 후 다시 시도해주세요.")
-    resp.raise_for_status()
-
-    data = resp.json()
-    keyword_list = data.get("keywordList", [])
-
-    if not keyword_list:
-        return pd.DataFrame(columns=["키워드", "PC검색량", "모바일검색량", "총검색량", "경쟁도",
-                                      "PC검색량_원본", "모바일검색량_원본"])
-
-    rows = []
-    for item in keyword_list:
-        pc_raw = item.get("monthlyPcQcCnt", 0)
-        mobile_raw = item.get("monthlyMobileQcCnt", 0)
-        pc = _parse_search_count(pc_raw)
-        mobile = _parse_search_count(mobile_raw)
-        rows.append({
-            "키워드": item.get("relKeyword", ""),
-            "PC검색량": pc,
-            "모바일검색량": mobile,
-            "총검색량": pc + mobile,
-            "경쟁도": item.get("compIdx", ""),
-            "PC검색량_원본": str(pc_raw),
-            "모바일검색량_원본": str(mobile_raw),
-        })
+    def _fetch():
+        scheduler = get_quota_scheduler()
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            if attempt:
+                time.sleep(RATE_LIMIT_BACKOFF_SEC * 2 ** (attempt - 1))
+            scheduler.acquire("searchad", api_key)
+            # 서명에 타임스탬프가 들어가므로 재시도마다 새로 만든다.
+            headers = get_searchad_headers(
+                "GET", SEARCHAD_KEYWORD_URI, api_key, secret_key, customer_id
+            )
+            resp = http_client.get(url, headers=headers, params=params)
+            if resp.status_code != 429:
+                break
+
+        if resp.status_code == 401:
+            raise AuthenticationFailed("검색광고 API 인증 실패: API 키를 확인해주세요.")
+        if resp.status_code == 429:
+            raise RateLimited("searchad", RATE_LIMIT_BACKOFF_SEC * 2 ** RATE_LIMIT_RETRIES)
+        resp.raise_for_status()
+        return decode_response(resp)
 
-    df = pd.DataFrame(rows)
-    df = df.sort_values("총검색량", ascending=False).reset_index(drop=True)
-    return df
+    # keywordstool은 월이 끝나야 값이 바뀌므로 다음 달 1일까지 캐시한다.
+    data = cached_call("keywordstool", params, next_month_start, _fetch)
+    return data.get("keywordList", [])
 
 
-def fetch_current_search_volume(
+def fetch_keywordstool(
     keyword: str,
     api_key: str,
     secret_key: str,
     customer_id: str,
-) -> dict:
-    """검색광고 API로 현재 월 PC/모바일 절대 검색량을 조회한다.
+) -> KeywordToolResult:
+    """검색광고 /keywordstool을 1회 호출하고 파싱된 결과를 반환한다.
 
-    /keywordstool은 항상 직전 완료월 기준 검색량만 반환하므로
-    1회 호출로 현재 기준값을 가져온다.
+    연관 키워드 표는 결과의 to_dataframe()으로, 키워드 자체의 현재 PC/모바일
+    검색량은 volume_of(keyword)로 읽는다. 둘 다 필요해도 호출은 한 번이면 된다.
+    (/keywordstool은 항상 직전 완료월 기준 검색량을 반환한다.)
 
-    Returns:
-        {"pc": 1500, "mobile": 12000}
+    Raises:
+        Exception: API 호출 실패 시
     """
-    url = SEARCHAD_BASE_URL + SEARCHAD_KEYWORD_URI
-    headers = get_searchad_headers(
-        "GET", SEARCHAD_KEYWORD_URI, api_key, secret_key, customer_id
-    )
-    params = {
-        "hintKeywords": keyword,
-        "showDetail": "1",
-    }
+    keyword_list = _request_keywordstool([keyword], api_key, secret_key, customer_id)
+    return KeywordToolResult(keyword_list)
 
-    resp = requests.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
-    if resp.status_code == 429:
-        time.sleep(1)
-        headers = get_searchad_headers(
-            "GET", SEARCHAD_KEYWORD_URI, api_key, secret_key, customer_id
-        )
-        resp = requests.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
-    resp.raise_for_status()
-
-    data = resp.json()
-    keyword_list = data.get("keywordList", [])
-
-    keyword_lower = keyword.lower().replace(" ", "")
-    for item in keyword_list:
-        rel_kw = item.get("relKeyword", "").lower().replace(" ", "")
-        if rel_kw == keyword_lower:
-            return {
-                "pc": _parse_search_count(item.get("monthlyPcQcCnt", 0)),
-                "mobile": _parse_search_count(item.get("monthlyMobileQcCnt", 0)),
-            }
-
-    return {"pc": 0, "mobile": 0}
+
+def fetch_keywordstool_batch(
+    keywords: List[str],
+    api_key: str,
+    secret_key: str,
+    customer_id: str,
+    max_workers: int = KEYWORDSTOOL_MAX_WORKERS,
+) -> KeywordToolResult:
+    """여러 키워드를 KEYWORDSTOOL_MAX_HINTS개씩 묶어 /keywordstool을 조회한다.
+
+    힌트 키워드는 공백/쉼표를 제거하고 중복을 없앤 뒤 묶는다.
+    묶음 요청은 최대 max_workers개까지 동시에 보낸다. (1이면 순차 실행)
+    여러 힌트에서 겹치는 연관 키워드는 하나로 합쳐지며,
+    각 입력 키워드의 정확 일치 검색량은 반환값의 volume_of()로 조회한다.
+
+    Raises:
+        Exception: 묶음 중 하나라도 API 호출에 실패한 경우
+    """
+    hints = []
+    seen = set()
+    for keyword in keywords:
+        hint = _normalize_keyword(keyword).replace(",", "")
+        if hint and hint not in seen:
+            seen.add(hint)
+            hints.append(hint)
+
+    chunks = [
+        hints[i:i + KEYWORDSTOOL_MAX_HINTS]
+        for i in range(0, len(hints), KEYWORDSTOOL_MAX_HINTS)
+    ]
+
+    def _request(chunk):
+        return _request_keywordstool(chunk, api_key, secret_key, customer_id)
+
+    if len(chunks) <= 1 or max_workers <= 1:
+        responses = [_request(chunk) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            responses = list(executor.map(metrics.bind(_request), chunks))
+
+    # 묶음 순서대로 이어 붙이므로 겹치는 연관 키워드는 앞 묶음의 행이 남는다.
+    keyword_list = [item for response in responses for item in response]
+    return KeywordToolResult(keyword_list, dedupe=True)
+
+
+def fetch_search_volumes(
+    keywords: List[str],
+    api_key: str,
+    secret_key: str,
+    customer_id: str,
+) -> Dict[str, dict]:
+    """여러 키워드의 현재 PC/모바일 월간 검색량을 묶음 요청으로 조회한다.
+
+    Returns:
+        {"캠핑": {"pc": 1500, "mobile": 12000}, ...} - 입력 키워드 순서 유지
+    """
+    result = fetch_keywordstool_batch(keywords, api_key, secret_key, customer_id)
+    return {keyword: result.volume_of(keyword) for keyword in keywords}
@@ -5,12 +5,37 @@ Playwright를 사용하여 네이버 로그인 → 검색광고 → 키워드 
 로그인 입력은 macOS osascript를 사용하여 실제 키보드 입력으로 처리 (봇 감지 우회).
 """
 import asyncio
+import hashlib
+import json
 import os
 import subprocess
 import traceback
+import uuid
 from io import BytesIO
 
-from PIL import Image
+from api.chart_extract import DOM_CHART_SCRIPT, extract_from_dom_charts, extract_from_payloads
+from api.scraper_waits import (
+    StepTimer,
+    wait_chart_painted,
+    wait_focused,
+    wait_hidden,
+    wait_input_value,
+    wait_scroll_settled,
+    wait_url,
+    wait_url_contains,
+    wait_visible,
+)
+from config.settings import (
+    SCRAPER_ADS_URL,
+    SCRAPER_STATE_DIR,
+    SCRAPER_STEP_TIMEOUT_MS,
+    SCRAPER_LOGIN_TIMEOUT_MS,
+    SCRAPER_SLOW_MO,
+    SCRAPER_HEADLESS,
+    SCRAPER_POPUP_PROBE_MS,
+    SCRAPER_PARALLEL_PAGES,
+)
+from utils.image_store import get_image_store
 
 
 def _type_with_applescript(text):
@@ -52,11 +77,168 @@ def _press_tab_with_applescript():
 
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 SCREENSHOT_DIR = os.path.join(BASE_DIR, "screenshots")
-os.makedirs(SCREENSHOT_DIR, exist_ok=True)
 
 
-async def _scrape_keyword_charts(keyword, naver_id, naver_pw, num_keywords=3, progress_callback=None):
-    """네이버 검색광고 키워드 도구에서 차트를 스크래핑한다."""
+def _storage_state_path(naver_id):
+    """계정별 브라우저 세션 저장 파일 경로. (아이디는 해시로만 남긴다)"""
+    digest = hashlib.sha256(naver_id.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(SCRAPER_STATE_DIR, "storage_state_{}.json".format(digest))
+
+
+def clear_saved_session(naver_id):
+    """저장된 로그인 세션을 삭제한다. 다음 실행 시 로그인부터 다시 진행한다."""
+    path = _storage_state_path(naver_id)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+async def _new_context(browser, state_path, log):
+    """저장된 세션이 있으면 불러와서 브라우저 컨텍스트를 만든다."""
+    if os.path.exists(state_path):
+        try:
+            context = await browser.new_context(storage_state=state_path)
+            log("   저장된 로그인 세션을 불러왔습니다.")
+            return context
+        except Exception as e:
+            log("   저장된 세션을 불러오지 못했습니다 ({}). 새로 로그인합니다.".format(e))
+            os.remove(state_path)
+    return await browser.new_context()
+
+
+async def _save_session(context, state_path, log):
+    """현재 컨텍스트의 쿠키/로컬 스토리지를 저장한다.
+
+    로그인 쿠키가 들어 있으므로 소유자만 읽을 수 있게(0600) 만들고,
+    임시 파일에 쓴 뒤 교체해 중간에 끊겨도 깨진 파일이 남지 않게 한다.
+    """
+    try:
+        os.makedirs(os.path.dirname(state_path), mode=0o700, exist_ok=True)
+        state = await context.storage_state()
+        tmp_path = state_path + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.chmod(tmp_path, 0o600)  # 이미 있던 임시 파일의 권한도 바로잡는다.
+        os.replace(tmp_path, state_path)
+        log("   로그인 세션 저장 완료 (다음 실행 시 로그인 생략)")
+    except Exception as e:
+        log("   로그인 세션 저장 실패: {}".format(e))
+
+
+LOGIN_BUTTON_SELECTOR = "a.AccountBox_login__No4av"
+LOGIN_HOST = "nid.naver.com"
+
+
+def _is_login_page(url):
+    """네이버 로그인 페이지(nid.naver.com)로 이동된 URL인지 확인한다."""
+    return LOGIN_HOST in url
+
+
+async def _needs_login(page, state_path, log):
+    """광고 사이트 헤더의 로그인 버튼으로 로그인이 필요한지 확인한다.
+
+    저장된 세션을 불러왔는데도 로그인이 필요하면 만료된 것이므로 파일을 지운다.
+    """
+    await wait_visible(page, "#header")
+    login_btn = await page.query_selector(LOGIN_BUTTON_SELECTOR)
+    need_login = False
+    if login_btn:
+        btn_text = await login_btn.text_content()
+        need_login = "로그인" in (btn_text or "")
+    if need_login and os.path.exists(state_path):
+        log("   저장된 로그인 세션이 만료되었습니다.")
+        os.remove(state_path)
+    return need_login
+
+
+async def _submit_login_form(page, naver_id, naver_pw, log):
+    """로그인 페이지의 아이디/비밀번호를 입력하고 로그인 페이지를 벗어날 때까지 기다린다."""
+    await wait_visible(page, "#id")
+
+    # 아이디/비밀번호 입력 (macOS osascript — 실제 키보드 입력으로 봇 감지 완전 우회)
+    log("4. 로그인 정보 입력 (OS 키보드 방식)...")
+    await _paste_into(page, "#id", naver_id)
+    await _paste_into(page, "#pw", naver_pw)
+
+    log("5. 로그인 중...")
+    login_url = page.url
+    await page.click("#log\\.login")
+
+    # 로그인 페이지를 벗어날 때까지 대기 (2단계 인증 시간 포함)
+    log("   로그인 처리 대기 중...")
+    await wait_url(
+        page,
+        lambda url: url != login_url and not _is_login_page(url),
+        timeout=SCRAPER_LOGIN_TIMEOUT_MS,
+    )
+
+
+# 수집 방식: "image"(스크린샷), "data"(수치 데이터), "both"
+CAPTURE_MODES = ("image", "data", "both")
+# 모달 데이터로 간주할 XHR 응답 호스트
+CHART_DATA_HOST = "manage.searchad.naver.com"
+
+POPUP_SELECTOR = "button.Button_btn___t8GZ.primary"
+MODAL_SELECTOR = "div.modal.fade.show"
+RESULT_ROW_SELECTOR = "table tbody tr td:nth-child(2) div span"
+
+
+async def _dismiss_primary_popups(page, log=None, max_popups=3):
+    """'확인' 류의 안내 팝업을 최대 max_popups개까지 닫는다.
+
+    팝업이 없는 경우가 대부분이므로, DOM에 버튼이 없으면 SCRAPER_POPUP_PROBE_MS만
+    짧게 기다려 보고 나타나지 않으면 바로 끝낸다.
+    """
+    for i in range(max_popups):
+        try:
+            if await page.locator(POPUP_SELECTOR).count():
+                button = await wait_visible(page, POPUP_SELECTOR, timeout=2000)
+            else:
+                button = await wait_visible(page, POPUP_SELECTOR, timeout=SCRAPER_POPUP_PROBE_MS)
+            await button.click()
+            await button.wait_for_element_state("hidden", timeout=2000)
+            if log:
+                log("   팝업 {} 닫기 완료".format(i + 1))
+        except Exception:
+            break
+
+
+async def _paste_into(page, selector, text):
+    """OS 키보드(osascript)로 입력창 내용을 지우고 text를 붙여넣는다."""
+    await page.click(selector)
+    await wait_focused(page, selector)
+
+    # Cmd+A → Delete로 기존 내용 지우기
+    _cmd_a_with_applescript()
+    _press_delete_with_applescript()
+    await wait_input_value(page, selector, empty=True)
+
+    # pbcopy + Cmd+V로 붙여넣기
+    _set_clipboard(text)
+    _cmd_v_with_applescript()
+    await wait_input_value(page, selector, empty=False)
+
+
+async def _scrape_keyword_charts(
+    keyword, naver_id, naver_pw, num_keywords=3, progress_callback=None, capture="image",
+    parallel_pages=None,
+):
+    """네이버 검색광고 키워드 도구에서 차트를 스크래핑한다.
+
+    각 단계는 고정 대기 없이 실제 조건(요소 표시, URL 변경, 차트 렌더링)을 기다리며,
+    단계별 소요 시간은 마지막에 진행 로그로 남긴다.
+
+    Args:
+        capture: "image"이면 모달 스크린샷, "data"이면 성별/연령대/월별 수치,
+                 "both"이면 둘 다 수집한다.
+        parallel_pages: 조회 결과 행을 나눠 캡처할 탭 수. None이면 SCRAPER_PARALLEL_PAGES
+
+    Returns:
+        [{"keyword": str, "image_key": str?, "data": dict?}, ...]
+        data 형식은 api.chart_extract 참고
+    """
+    if capture not in CAPTURE_MODES:
+        raise ValueError("capture는 {} 중 하나여야 합니다.".format(", ".join(CAPTURE_MODES)))
     from playwright.async_api import async_playwright
 
     def log(msg):
@@ -64,198 +246,165 @@ async def _scrape_keyword_charts(keyword, naver_id, naver_pw, num_keywords=3, pr
             progress_callback(msg)
 
     results = []
+    state_path = _storage_state_path(naver_id)
+    timer = StepTimer()
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False, slow_mo=100)
-        context = await browser.new_context()
+        browser = await p.chromium.launch(headless=SCRAPER_HEADLESS, slow_mo=SCRAPER_SLOW_MO)
+        context = await _new_context(browser, state_path, log)
         page = await context.new_page()
 
         try:
             # 1. 네이버 광고 사이트 접속
             log("1. 네이버 광고 사이트 접속...")
-            await page.goto("https://ads.naver.com/")
-            await page.wait_for_load_state("networkidle")
+            with timer.step("접속"):
+                await page.goto(SCRAPER_ADS_URL, wait_until="domcontentloaded")
 
             # 2. 팝업 처리
             log("2. 팝업 처리 중...")
-            for _ in range(3):
-                try:
-                    popup_selector = "button.Button_btn___t8GZ.primary"
-                    await page.wait_for_selector(popup_selector, timeout=2000)
-                    await page.click(popup_selector)
-                    await asyncio.sleep(0.5)
-                except Exception:
-                    break
-
-            # 모든 종류의 팝업/오버레이 닫기
-            await page.evaluate("""
-                () => {
-                    // 닫기/확인/X 버튼 클릭
-                    const btns = document.querySelectorAll('button, a');
-                    for (let b of btns) {
-                        const t = b.textContent.trim();
-                        if ((t === '닫기' || t === '확인' || t === '다음에 하기'
-                             || t === '건너뛰기' || t === 'X')
-                            && b.offsetParent !== null) {
-                            b.click();
+            with timer.step("팝업"):
+                await _dismiss_primary_popups(page)
+
+                # 모든 종류의 팝업/오버레이 닫기
+                await page.evaluate("""
+                    () => {
+                        // 닫기/확인/X 버튼 클릭
+                        const btns = document.querySelectorAll('button, a');
+                        for (let b of btns) {
+                            const t = b.textContent.trim();
+                            if ((t === '닫기' || t === '확인' || t === '다음에 하기'
+                                 || t === '건너뛰기' || t === 'X')
+                                && b.offsetParent !== null) {
+                                b.click();
+                            }
                         }
+                        // close 버튼
+                        document.querySelectorAll(
+                            'button.close, [aria-label="Close"], [aria-label="닫기"], button[class*="close"]'
+                        ).forEach(b => { if (b.offsetParent !== null) b.click(); });
                     }
-                    // close 버튼
-                    document.querySelectorAll(
-                        'button.close, [aria-label="Close"], [aria-label="닫기"], button[class*="close"]'
-                    ).forEach(b => { if (b.offsetParent !== null) b.click(); });
-                }
-            """)
-            await asyncio.sleep(1)
+                """)
 
             # 3. 로그인 여부 확인
             log("3. 로그인 상태 확인...")
-            login_btn = await page.query_selector("a.AccountBox_login__No4av")
-            need_login = False
-            if login_btn:
-                btn_text = await login_btn.text_content()
-                if "로그인" in (btn_text or ""):
-                    need_login = True
+            with timer.step("로그인 확인"):
+                need_login = await _needs_login(page, state_path, log)
 
             if need_login:
-                # 로그인 필요 — 로그인 버튼 클릭
-                log("   로그인 필요. 로그인 버튼 클릭...")
-                await page.click("a.AccountBox_login__No4av")
-                await page.wait_for_load_state("networkidle")
-                await asyncio.sleep(1)
-
-                # 4. 아이디 입력 (macOS osascript — 실제 키보드 입력으로 봇 감지 완전 우회)
-                log("4. 로그인 정보 입력 (OS 키보드 방식)...")
-                await page.click("#id")
-                await asyncio.sleep(0.3)
-
-                # Cmd+A → Delete로 기존 내용 지우기
-                _cmd_a_with_applescript()
-                await asyncio.sleep(0.1)
-                _press_delete_with_applescript()
-                await asyncio.sleep(0.1)
-
-                # pbcopy + Cmd+V로 아이디 붙여넣기
-                _set_clipboard(naver_id)
-                await asyncio.sleep(0.1)
-                _cmd_v_with_applescript()
-                await asyncio.sleep(0.5)
-
-                # 5. 비밀번호 입력 (OS 키보드)
-                await page.click("#pw")
-                await asyncio.sleep(0.3)
-
-                _cmd_a_with_applescript()
-                await asyncio.sleep(0.1)
-                _press_delete_with_applescript()
-                await asyncio.sleep(0.1)
-
-                _set_clipboard(naver_pw)
-                await asyncio.sleep(0.1)
-                _cmd_v_with_applescript()
-                await asyncio.sleep(0.5)
-
-                # 6. 로그인 버튼 클릭
-                log("5. 로그인 중...")
-                await page.click("#log\\.login")
-
-                log("   로그인 처리 대기 중 (15초)...")
-                await asyncio.sleep(15)
-                await page.wait_for_load_state("networkidle")
-
-                # 로그인 후 팝업 처리
-                log("6. 로그인 후 팝업 처리...")
-                for i in range(3):
-                    try:
-                        popup_selector = "button.Button_btn___t8GZ.primary"
-                        await page.wait_for_selector(popup_selector, timeout=2000)
-                        await page.click(popup_selector)
-                        log("   팝업 {} 닫기 완료".format(i + 1))
-                        await asyncio.sleep(0.5)
-                    except Exception:
-                        break
+                with timer.step("로그인"):
+                    # 로그인 필요 — 로그인 버튼 클릭
+                    log("   로그인 필요. 로그인 버튼 클릭...")
+                    await page.click(LOGIN_BUTTON_SELECTOR)
+                    await _submit_login_form(page, naver_id, naver_pw, log)
+                    await wait_visible(page, "#header")
+
+                    # 로그인 후 팝업 처리
+                    log("6. 로그인 후 팝업 처리...")
+                    await _dismiss_primary_popups(page, log)
 
             else:
                 log("   이미 로그인되어 있습니다. 로그인 건너뜀.")
 
             # 8. 광고 플랫폼 버튼 클릭
             log("7. 광고 플랫폼 메뉴 클릭...")
-            await page.click(
+            platform_box = (
                 "#header > div > div > div > section > "
                 "div.PlatformBox_btn_platform_box__CgdxY."
                 "PlatformBox_header_responsive__wUiWz."
                 "PlatformBox_userProfile__w4ler."
-                "PlatformBox_sticky__c3QNi > a"
+                "PlatformBox_sticky__c3QNi"
             )
-            await asyncio.sleep(1)
+            searchad_link = platform_box + ".PlatformBox_on__t6H_v > ul > li:nth-child(1) > a"
 
-            # 9. 검색 광고 버튼 클릭 (새 탭 열림 감지)
-            log("8. 검색 광고 선택 (새 탭 감지)...")
+            with timer.step("검색광고 진입"):
+                await page.click(platform_box + " > a")
+                await wait_visible(page, searchad_link)
 
-            async with context.expect_page() as new_page_info:
-                await page.click(
-                    "#header > div > div > div > section > "
-                    "div.PlatformBox_btn_platform_box__CgdxY."
-                    "PlatformBox_header_responsive__wUiWz."
-                    "PlatformBox_userProfile__w4ler."
-                    "PlatformBox_sticky__c3QNi."
-                    "PlatformBox_on__t6H_v > ul > li:nth-child(1) > a"
-                )
-                log("   검색 광고 클릭, 새 탭 대기 중...")
+                # 9. 검색 광고 버튼 클릭 (새 탭 열림 감지)
+                log("8. 검색 광고 선택 (새 탭 감지)...")
+
+                async with context.expect_page() as new_page_info:
+                    await page.click(searchad_link)
+                    log("   검색 광고 클릭, 새 탭 대기 중...")
 
-            new_page = await new_page_info.value
-            log("   새 탭 열림: {}".format(new_page.url))
+                new_page = await new_page_info.value
+                log("   새 탭 열림: {}".format(new_page.url))
 
-            page = new_page
-            await page.wait_for_load_state("networkidle")
-            await asyncio.sleep(2)
+                page = new_page
+                await wait_url_contains(page, [
+                    "searchad.naver.com/membership/select-account",
+                    "manage.searchad.naver.com/customers",
+                    LOGIN_HOST,
+                ])
 
             current_url = page.url
             log("   현재 URL: {}".format(current_url))
 
+            # 광고 사이트 세션은 살아 있어도 검색광고 세션이 만료되면 로그인 페이지로 이동한다.
+            # 저장된 세션을 지우고 이 탭에서 바로 로그인한다. (로그인 후 검색광고로 돌아옴)
+            if _is_login_page(current_url):
+                log("   검색광고 세션이 만료되었습니다. 다시 로그인합니다.")
+                clear_saved_session(naver_id)
+                with timer.step("로그인"):
+                    await _submit_login_form(page, naver_id, naver_pw, log)
+                    await wait_url_contains(page, [
+                        "searchad.naver.com/membership/select-account",
+                        "manage.searchad.naver.com/customers",
+                    ])
+                current_url = page.url
+                log("   현재 URL: {}".format(current_url))
+
             # 10. 광고 계정 선택
             log("9. 광고 계정 선택...")
 
             if "searchad.naver.com/membership/select-account" in current_url:
                 log("   계정 선택 페이지 진입")
 
-                await asyncio.sleep(8)
-                await page.wait_for_load_state("domcontentloaded")
-                await page.wait_for_load_state("networkidle")
+                with timer.step("계정 선택"):
+                    try:
+                        await page.wait_for_function(
+                            """() => {
+                                const root = document.querySelector('marvel-root');
+                                const wrap = root && root.querySelector('.scroll-wrap.text-body');
+                                return !!(wrap && wrap.querySelector('a'));
+                            }""",
+                            timeout=SCRAPER_STEP_TIMEOUT_MS,
+                        )
+                    except Exception:
+                        pass  # 아래 evaluate에서 구체적인 실패 사유를 확인한다.
 
-                try:
-                    result_acc = await page.evaluate("""
-                        () => {
-                            const marvelRoot = document.querySelector('marvel-root');
-                            if (!marvelRoot) return {success: false, message: 'marvel-root not found'};
+                    try:
+                        result_acc = await page.evaluate("""
+                            () => {
+                                const marvelRoot = document.querySelector('marvel-root');
+                                if (!marvelRoot) return {success: false, message: 'marvel-root not found'};
 
-                            const scrollWrap = marvelRoot.querySelector('.scroll-wrap.text-body');
-                            if (!scrollWrap) return {success: false, message: 'scroll-wrap not found'};
+                                const scrollWrap = marvelRoot.querySelector('.scroll-wrap.text-body');
+                                if (!scrollWrap) return {success: false, message: 'scroll-wrap not found'};
 
-                            const links = scrollWrap.querySelectorAll('a');
-                            if (links.length === 0) return {success: false, message: 'no links found'};
+                                const links = scrollWrap.querySelectorAll('a');
+                                if (links.length === 0) return {success: false, message: 'no links found'};
 
-                            const firstLink = links[0];
-                            const accountName = firstLink.textContent.trim();
-                            firstLink.click();
+                                const firstLink = links[0];
+                                const accountName = firstLink.textContent.trim();
+                                firstLink.click();
 
-                            return {success: true, accountName: accountName, linkCount: links.length};
-                        }
-                    """)
+                                return {success: true, accountName: accountName, linkCount: links.length};
+                            }
+                        """)
 
-                    if result_acc["success"]:
-                        log("   계정 선택: {}".format(result_acc["accountName"]))
-                        await page.wait_for_load_state("networkidle")
-                        await asyncio.sleep(5)
-                    else:
-                        log("   계정 선택 실패: {}".format(result_acc["message"]))
-                        raise Exception("광고 계정을 자동 선택할 수 없습니다: " + result_acc["message"])
+                        if result_acc["success"]:
+                            log("   계정 선택: {}".format(result_acc["accountName"]))
+                            await wait_url_contains(page, ["manage.searchad.naver.com/customers"])
+                        else:
+                            log("   계정 선택 실패: {}".format(result_acc["message"]))
+                            raise Exception("광고 계정을 자동 선택할 수 없습니다: " + result_acc["message"])
 
-                except Exception as e:
-                    if "자동 선택" in str(e):
-                        raise
-                    log("   계정 선택 오류: {}".format(e))
-                    raise Exception("광고 계정 선택 오류: " + str(e))
+                    except Exception as e:
+                        if "자동 선택" in str(e):
+                            raise
+                        log("   계정 선택 오류: {}".format(e))
+                        raise Exception("광고 계정 선택 오류: " + str(e))
 
             elif "manage.searchad.naver.com/customers" in current_url:
                 log("   이미 대시보드에 진입되어 있습니다.")
@@ -269,264 +418,503 @@ async def _scrape_keyword_charts(keyword, naver_id, naver_pw, num_keywords=3, pr
                 raise Exception("campaigns 페이지로 이동 실패. URL: " + final_url)
 
             log("   campaigns 페이지 도달")
+            await _save_session(context, state_path, log)
 
             # 11. 도구 메뉴 클릭
             log("10. 도구 메뉴 클릭...")
-            await page.click(
-                "#root > div.sc-jwrfVR.jiHXTj > div.header > div > "
-                "div:nth-child(1) > div.header-second-row > div > div > "
-                "div:nth-child(1) > ul > li:nth-child(4) > div > a"
-            )
-            await asyncio.sleep(1)
-
-            # 12. 키워드 도구 클릭
-            log("11. 키워드 도구 클릭...")
-            keyword_tool_clicked = False
-
-            selectors_to_try = [
-                "#root > div.sc-jwrfVR.jiHXTj > div.header > div > "
-                "div:nth-child(1) > div.header-second-row > div > div > "
-                "div:nth-child(1) > ul > li.nav-item.active > div > div > "
-                "div:nth-child(5) > a > button",
-
-                "#root > div.sc-jwrfVR.jiHXTj > div.header > div > "
-                "div:nth-child(1) > div.header-second-row > div > div > "
-                "div:nth-child(1) > ul > li.nav-item.active > div > div > "
-                "div:nth-child(5) > a > button > span",
-
-                "#root > div.sc-jwrfVR.jiHXTj > div.header > div > "
-                "div:nth-child(1) > div.header-second-row > div > div > "
-                "div:nth-child(1) > ul > li.nav-item.active > div > div > "
-                "div:nth-child(5) > a",
-            ]
-
-            for selector in selectors_to_try:
-                try:
-                    await page.wait_for_selector(selector, timeout=3000)
-                    await page.click(selector)
-                    log("   키워드 도구 클릭 성공")
-                    keyword_tool_clicked = True
-                    break
-                except Exception:
-                    continue
-
-            if not keyword_tool_clicked:
-                await page.evaluate("""
-                    () => {
-                        const buttons = document.querySelectorAll('button');
-                        for (let btn of buttons) {
-                            if (btn.textContent.includes('키워드')) {
-                                btn.click();
-                                return;
-                            }
-                        }
-                    }
-                """)
-                log("   JavaScript로 키워드 도구 클릭 완료")
-
-            await page.wait_for_load_state("networkidle")
-            await asyncio.sleep(2)
-
-            # 13. 키워드 입력
-            log("12. 키워드 '{}' 입력...".format(keyword))
-
-            try:
-                await page.wait_for_selector("#keyword-hint", timeout=5000)
-                await page.click("#keyword-hint")
-                await page.fill("#keyword-hint", keyword)
-                log("   키워드 입력 완료")
-            except Exception:
-                await page.evaluate(
-                    """(kw) => {
-                        const input = document.querySelector('#keyword-hint');
-                        if (input) {
-                            input.value = kw;
-                            input.dispatchEvent(new Event('input', { bubbles: true }));
-                        }
-                    }""",
-                    keyword,
+            with timer.step("키워드 도구"):
+                await page.click(
+                    "#root > div.sc-jwrfVR.jiHXTj > div.header > div > "
+                    "div:nth-child(1) > div.header-second-row > div > div > "
+                    "div:nth-child(1) > ul > li:nth-child(4) > div > a"
                 )
-                log("   JavaScript로 입력 완료")
-
-            await asyncio.sleep(1)
 
-            # 14. 조회하기 버튼 클릭
-            log("13. 조회하기 클릭...")
-            search_button_selector = (
-                "#root > div.sc-jwrfVR.jiHXTj > div.sc-goWbiw.hgIphO > div > div > "
-                "div.row > div.col-sm-9.col-keyword-query > div:nth-child(1) > "
-                "div.card-footer > button"
-            )
-
-            try:
-                await page.wait_for_selector(search_button_selector, timeout=5000)
-                await page.click(search_button_selector)
-                log("   조회하기 버튼 클릭 완료")
-            except Exception:
-                await page.evaluate("""
-                    () => {
-                        const buttons = document.querySelectorAll('button');
-                        for (let btn of buttons) {
-                            if (btn.textContent.includes('조회')) {
-                                btn.click();
-                                return;
-                            }
-                        }
-                    }
-                """)
-                log("   JavaScript로 조회하기 클릭 완료")
+                # 12. 키워드 도구 클릭
+                log("11. 키워드 도구 클릭...")
+                keyword_tool_clicked = False
 
-            await page.wait_for_load_state("networkidle")
-            await asyncio.sleep(3)
+                selectors_to_try = [
+                    "#root > div.sc-jwrfVR.jiHXTj > div.header > div > "
+                    "div:nth-child(1) > div.header-second-row > div > div > "
+                    "div:nth-child(1) > ul > li.nav-item.active > div > div > "
+                    "div:nth-child(5) > a > button",
 
-            # 15~20. 각 키워드 차트 캡처
-            for keyword_num in range(1, num_keywords + 1):
-                keyword_label = "{}번째".format(keyword_num)
-                log("{} 키워드 클릭...".format(keyword_label))
+                    "#root > div.sc-jwrfVR.jiHXTj > div.header > div > "
+                    "div:nth-child(1) > div.header-second-row > div > div > "
+                    "div:nth-child(1) > ul > li.nav-item.active > div > div > "
+                    "div:nth-child(5) > a > button > span",
 
-                keyword_selector = (
-                    "#root > div.sc-jwrfVR.jiHXTj > div.sc-goWbiw.hgIphO > div > div > "
-                    "div.row > div.col-sm-9.col-keyword-query > div:nth-child(2) > "
-                    "div.card-body > div > div.sc-dlWCHZ.taunU > table > tbody > "
-                    "tr:nth-child({}) > td:nth-child(2) > div > span".format(keyword_num)
-                )
+                    "#root > div.sc-jwrfVR.jiHXTj > div.header > div > "
+                    "div:nth-child(1) > div.header-second-row > div > div > "
+                    "div:nth-child(1) > ul > li.nav-item.active > div > div > "
+                    "div:nth-child(5) > a",
+                ]
 
-                kw_name = ""
-                try:
-                    el = await page.wait_for_selector(keyword_selector, timeout=5000)
-                    kw_name = (await el.text_content() or "").strip()
-                    await page.click(keyword_selector)
-                    log("   {} 키워드 '{}' 클릭 성공".format(keyword_label, kw_name))
-                except Exception:
+                for selector in selectors_to_try:
                     try:
-                        kw_name = await page.evaluate(
-                            """(num) => {
-                                const table = document.querySelector('table tbody');
-                                if (table) {
-                                    const row = table.querySelector(
-                                        'tr:nth-child(' + num + ') td:nth-child(2) div span');
-                                    if (row) { row.click(); return row.textContent.trim(); }
-                                }
-                                return '';
-                            }""",
-                            keyword_num,
-                        )
-                        log("   JavaScript로 클릭 완료")
+                        await page.wait_for_selector(selector, timeout=3000)
+                        await page.click(selector)
+                        log("   키워드 도구 클릭 성공")
+                        keyword_tool_clicked = True
+                        break
                     except Exception:
-                        log("   {} 키워드를 찾을 수 없습니다.".format(keyword_label))
                         continue
 
-                if not kw_name:
-                    kw_name = "keyword_{}".format(keyword_num)
-
-                # 모달 캡처
-                try:
-                    log("   모달 스크린샷 캡처 시도...")
-
-                    modal_selector = "div.modal.fade.show"
-                    await page.wait_for_selector(modal_selector, timeout=5000, state="visible")
-                    await asyncio.sleep(2)
-
-                    # 모달 바디에 포커스, 스크롤 맨 위로
+                if not keyword_tool_clicked:
                     await page.evaluate("""
                         () => {
-                            const modal = document.querySelector('div.modal.fade.show');
-                            if (modal) {
-                                const modalBody = modal.querySelector('.modal-body');
-                                if (modalBody) {
-                                    modalBody.focus();
-                                    modalBody.scrollTop = 0;
+                            const buttons = document.querySelectorAll('button');
+                            for (let btn of buttons) {
+                                if (btn.textContent.includes('키워드')) {
+                                    btn.click();
+                                    return;
                                 }
                             }
                         }
                     """)
-                    await asyncio.sleep(1)
-
-                    # 위쪽 차트 캡처
-                    top_bytes = await page.screenshot(full_page=False)
-                    top_image = Image.open(BytesIO(top_bytes))
-
-                    # PageDown 후 아래쪽 캡처
-                    await page.keyboard.press("PageDown")
-                    await asyncio.sleep(1)
-
-                    middle_bytes = await page.screenshot(full_page=False)
-                    middle_image = Image.open(BytesIO(middle_bytes))
-
-                    # 두 이미지 합치기 (중복 30% 제거)
-                    overlap_remove = int(middle_image.height * 0.3)
-                    middle_cropped = middle_image.crop(
-                        (0, overlap_remove, middle_image.width, middle_image.height)
-                    )
-
-                    total_height = top_image.height + middle_cropped.height
-                    total_width = max(top_image.width, middle_image.width)
-
-                    combined_image = Image.new("RGB", (total_width, total_height), color="white")
-                    combined_image.paste(top_image, (0, 0))
-                    combined_image.paste(middle_cropped, (0, top_image.height))
-
-                    # 저장
-                    safe_name = kw_name.replace("/", "_").replace(" ", "_")
-                    img_path = os.path.join(
-                        SCREENSHOT_DIR,
-                        "chart_{}_{}.png".format(safe_name, keyword_num),
-                    )
-                    combined_image.save(img_path)
-
-                    results.append({"keyword": kw_name, "image_path": img_path})
-                    log("   스크린샷 저장: {} ({}x{}px)".format(
-                        kw_name, combined_image.width, combined_image.height
-                    ))
-
-                except Exception as e:
-                    log("   {} 키워드 모달 캡처 실패: {}".format(keyword_label, e))
-
-                # 팝업 닫기
-                log("   {} 키워드 팝업 닫는 중...".format(keyword_label))
-                try:
-                    await page.keyboard.press("Escape")
-                    await asyncio.sleep(1)
-
-                    modal_visible = await page.is_visible("div.modal.fade.show")
-                    if not modal_visible:
-                        log("   {} 키워드 팝업 닫기 완료".format(keyword_label))
-                    else:
-                        try:
-                            await page.click(".modal.fade.show .close")
-                            log("   X 버튼으로 닫기 완료")
-                        except Exception:
-                            log("   X 버튼 찾기 실패")
-
-                    await asyncio.sleep(1)
-
-                except Exception as e:
-                    log("   팝업 닫기 실패: {}".format(e))
+                    log("   JavaScript로 키워드 도구 클릭 완료")
+
+            # 13. 키워드 입력
+            log("12. 키워드 '{}' 입력...".format(keyword))
+            with timer.step("키워드 조회"):
+                await _search_keyword(page, keyword, log)
+
+            # 15~20. 각 키워드 차트 캡처 (여러 탭에서 병렬)
+            if parallel_pages is None:
+                parallel_pages = SCRAPER_PARALLEL_PAGES
+            results = await _capture_rows_parallel(
+                context, page, keyword, num_keywords, parallel_pages, log, capture, timer,
+            )
 
             log("모든 작업 완료! ({}개 차트 캡처)".format(len(results)))
 
         except Exception as e:
             log("오류 발생: {}".format(e))
-            err_path = os.path.join(SCREENSHOT_DIR, "error_screenshot.png")
+            # 여러 사용자의 작업이 동시에 실행되므로 실행마다 다른 파일에 저장하고,
+            # 경로를 예외에 붙여 작업 레코드(services/job_runner.py)가 가져가게 한다.
+            err_path = os.path.join(SCREENSHOT_DIR, "error_{}.png".format(uuid.uuid4().hex))
             try:
+                os.makedirs(SCREENSHOT_DIR, exist_ok=True)
                 await page.screenshot(path=err_path, full_page=True)
+                e.screenshot_path = err_path
                 log("오류 스크린샷 저장됨")
             except Exception:
                 pass
             raise
 
         finally:
+            log("단계별 소요 시간: {}".format(timer.summary()))
             await browser.close()
 
     return results
 
 
-def scrape_keyword_charts(keyword, naver_id, naver_pw, num_keywords=3, progress_callback=None):
+def _record_json_responses(page, payloads):
+    """페이지가 받는 검색광고 JSON 응답을 payloads 목록에 쌓는다."""
+
+    async def _on_response(response):
+        if CHART_DATA_HOST not in response.url:
+            return
+        if "json" not in (response.headers.get("content-type") or ""):
+            return
+        try:
+            payloads.append(await response.json())
+        except Exception:
+            pass
+
+    page.on("response", _on_response)
+
+
+async def _extract_chart_data(page, payloads):
+    """모달 차트 수치를 XHR 응답에서 찾고, 빠진 항목은 차트 DOM에서 보충한다."""
+    data = extract_from_payloads(payloads)
+    if not all(k in data for k in ("gender", "age", "monthly")):
+        try:
+            charts = await page.evaluate(DOM_CHART_SCRIPT, MODAL_SELECTOR)
+        except Exception:
+            charts = []
+        for key, value in extract_from_dom_charts(charts).items():
+            data.setdefault(key, value)
+    return data
+
+
+async def _search_keyword(page, keyword, log):
+    """키워드 도구 화면에서 키워드를 입력하고 조회 결과가 나올 때까지 기다린다."""
+    try:
+        await wait_visible(page, "#keyword-hint")
+        await page.click("#keyword-hint")
+        await page.fill("#keyword-hint", keyword)
+        log("   키워드 입력 완료")
+    except Exception:
+        await page.evaluate(
+            """(kw) => {
+                const input = document.querySelector('#keyword-hint');
+                if (input) {
+                    input.value = kw;
+                    input.dispatchEvent(new Event('input', { bubbles: true }));
+                }
+            }""",
+            keyword,
+        )
+        log("   JavaScript로 입력 완료")
+
+    # 14. 조회하기 버튼 클릭
+    log("13. 조회하기 클릭...")
+    search_button_selector = (
+        "#root > div.sc-jwrfVR.jiHXTj > div.sc-goWbiw.hgIphO > div > div > "
+        "div.row > div.col-sm-9.col-keyword-query > div:nth-child(1) > "
+        "div.card-footer > button"
+    )
+
+    try:
+        await page.wait_for_selector(search_button_selector, timeout=5000)
+        await page.click(search_button_selector)
+        log("   조회하기 버튼 클릭 완료")
+    except Exception:
+        await page.evaluate("""
+            () => {
+                const buttons = document.querySelectorAll('button');
+                for (let btn of buttons) {
+                    if (btn.textContent.includes('조회')) {
+                        btn.click();
+                        return;
+                    }
+                }
+            }
+        """)
+        log("   JavaScript로 조회하기 클릭 완료")
+
+    # 조회 결과 첫 행이 나타날 때까지 대기
+    await wait_visible(page, RESULT_ROW_SELECTOR)
+
+
+async def _capture_rows_parallel(
+    context, page, keyword, num_keywords, parallel_pages, log, capture, timer,
+):
+    """조회 결과 상위 num_keywords개 행을 여러 탭에서 나눠 캡처한다.
+
+    첫 탭은 이미 조회가 끝난 page를 그대로 쓰고, 나머지 탭은 같은 로그인
+    컨텍스트에서 키워드 도구 URL을 열어 같은 키워드로 조회한 뒤 합류한다.
+    행 번호는 공유 대기열에서 하나씩 가져가므로 먼저 준비된 탭이 더 많이 처리한다.
+    탭 하나의 준비/캡처 실패는 해당 탭이나 행에만 영향을 준다.
+
+    Returns:
+        행 번호 순서의 캡처 결과 목록
+    """
+    queue = asyncio.Queue()
+    for keyword_num in range(1, num_keywords + 1):
+        queue.put_nowait(keyword_num)
+    captured = {}
+    tool_url = page.url
+
+    async def _drain(worker_page, payloads):
+        while True:
+            try:
+                keyword_num = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                with timer.step("캡처 {}".format(keyword_num)):
+                    item = await _capture_row(worker_page, keyword_num, log, capture, payloads)
+            except Exception as e:
+                log("   {}번째 키워드 캡처 중 오류: {}".format(keyword_num, e))
+                item = None
+            if item:
+                captured[keyword_num] = item
+
+    async def _main_worker():
+        # 모달이 열리며 받는 JSON 응답 (수치 데이터 추출용)
+        payloads = []
+        if capture != "image":
+            _record_json_responses(page, payloads)
+        await _drain(page, payloads)
+
+    async def _extra_worker(tab_num):
+        worker_page = None
+        try:
+            worker_page = await context.new_page()
+            payloads = []
+            if capture != "image":
+                _record_json_responses(worker_page, payloads)
+            await worker_page.goto(tool_url, wait_until="domcontentloaded")
+            await _search_keyword(worker_page, keyword, lambda msg: None)
+            log("   탭 {} 준비 완료".format(tab_num + 1))
+            await _drain(worker_page, payloads)
+        except Exception as e:
+            log("   탭 {} 준비 실패: {}".format(tab_num + 1, e))
+        finally:
+            if worker_page is not None:
+                await worker_page.close()
+
+    extra_tabs = max(0, min(parallel_pages, num_keywords) - 1)
+    await asyncio.gather(_main_worker(), *[_extra_worker(i) for i in range(1, extra_tabs + 1)])
+    return [captured[n] for n in sorted(captured)]
+
+
+async def _capture_row(page, keyword_num, log, capture="image", payloads=None):
+    """조회 결과의 keyword_num번째 행을 클릭해 모달 차트를 캡처하고 닫는다.
+
+    Returns:
+        {"keyword": str, "image_key": str?, "data": dict?} 또는 실패 시 None
+    """
+    if payloads is None:
+        payloads = []
+    keyword_label = "{}번째".format(keyword_num)
+    log("{} 키워드 클릭...".format(keyword_label))
+
+    keyword_selector = (
+        "#root > div.sc-jwrfVR.jiHXTj > div.sc-goWbiw.hgIphO > div > div > "
+        "div.row > div.col-sm-9.col-keyword-query > div:nth-child(2) > "
+        "div.card-body > div > div.sc-dlWCHZ.taunU > table > tbody > "
+        "tr:nth-child({}) > td:nth-child(2) > div > span".format(keyword_num)
+    )
+
+    kw_name = ""
+    # 이전 행 모달에서 받은 응답이 섞이지 않도록 비운다.
+    payloads.clear()
+    try:
+        el = await page.wait_for_selector(keyword_selector, timeout=5000)
+        kw_name = (await el.text_content() or "").strip()
+        await page.click(keyword_selector)
+        log("   {} 키워드 '{}' 클릭 성공".format(keyword_label, kw_name))
+    except Exception:
+        try:
+            kw_name = await page.evaluate(
+                """(num) => {
+                    const table = document.querySelector('table tbody');
+                    if (table) {
+                        const row = table.querySelector(
+                            'tr:nth-child(' + num + ') td:nth-child(2) div span');
+                        if (row) { row.click(); return row.textContent.trim(); }
+                    }
+                    return '';
+                }""",
+                keyword_num,
+            )
+            log("   JavaScript로 클릭 완료")
+        except Exception:
+            log("   {} 키워드를 찾을 수 없습니다.".format(keyword_label))
+            return None
+
+    if not kw_name:
+        kw_name = "keyword_{}".format(keyword_num)
+
+    item = None
+
+    # 모달 캡처
+    try:
+        await wait_visible(page, MODAL_SELECTOR, timeout=5000)
+        await wait_chart_painted(page, MODAL_SELECTOR)
+        item = {"keyword": kw_name}
+
+        if capture != "image":
+            item["data"] = await _extract_chart_data(page, list(payloads))
+            log("   수치 데이터 추출: {}".format(", ".join(sorted(item["data"])) or "없음"))
+
+        if capture != "data":
+            log("   모달 스크린샷 캡처 시도...")
+            item["image_key"] = await get_image_store().put_async(await _screenshot_modal(page))
+            log("   스크린샷 저장: {}".format(kw_name))
+
+    except Exception as e:
+        log("   {} 키워드 모달 캡처 실패: {}".format(keyword_label, e))
+        if item and "data" not in item:
+            item = None
+
+    # 팝업 닫기
+    log("   {} 키워드 팝업 닫는 중...".format(keyword_label))
+    try:
+        await page.keyboard.press("Escape")
+
+        if await wait_hidden(page, MODAL_SELECTOR, timeout=3000):
+            log("   {} 키워드 팝업 닫기 완료".format(keyword_label))
+        else:
+            try:
+                await page.click(".modal.fade.show .close")
+                await wait_hidden(page, MODAL_SELECTOR, timeout=3000)
+                log("   X 버튼으로 닫기 완료")
+            except Exception:
+                log("   X 버튼 찾기 실패")
+
+    except Exception as e:
+        log("   팝업 닫기 실패: {}".format(e))
+
+    return item
+
+
+MODAL_BODY_SELECTOR = MODAL_SELECTOR + " .modal-body"
+
+# 모달 바디를 스크롤 높이만큼 펼치고, 원래 스타일과 펼친 높이를 돌려준다.
+_EXPAND_MODAL_SCRIPT = """
+    (sel) => {
+        const modal = document.querySelector(sel);
+        const body = modal && modal.querySelector('.modal-body');
+        if (!body) return null;
+        const saved = {maxHeight: body.style.maxHeight, height: body.style.height,
+                       overflow: body.style.overflow};
+        body.scrollTop = 0;
+        body.style.maxHeight = 'none';
+        body.style.height = body.scrollHeight + 'px';
+        body.style.overflow = 'visible';
+        const content = modal.querySelector('.modal-content') || body;
+        const rect = content.getBoundingClientRect();
+        return {saved: saved, bottom: Math.ceil(rect.top + window.scrollY + rect.height)};
+    }
+"""
+
+_RESTORE_MODAL_SCRIPT = """
+    ([sel, saved]) => {
+        const body = document.querySelector(sel + ' .modal-body');
+        if (!body || !saved) return;
+        body.style.maxHeight = saved.maxHeight;
+        body.style.height = saved.height;
+        body.style.overflow = saved.overflow;
+    }
+"""
+
+
+async def _screenshot_modal(page):
+    """열린 모달을 요소 단위로 한 번에 캡처해 PNG 바이트로 반환한다.
+
+    모달 바디를 스크롤 높이만큼 펼친 뒤 .modal-content 요소만 잘라 찍는다.
+    펼친 모달이 뷰포트보다 길면 캡처하는 동안만 뷰포트를 늘린다.
+    요소 캡처가 실패하면 스크롤 캡처 후 겹치는 픽셀 행을 찾아 이어 붙인다.
+    """
+    viewport = page.viewport_size
+    expanded = None
+    try:
+        expanded = await page.evaluate(_EXPAND_MODAL_SCRIPT, MODAL_SELECTOR)
+        if not expanded:
+            raise Exception("모달 바디를 찾을 수 없습니다.")
+        if viewport and expanded["bottom"] > viewport["height"]:
+            await page.set_viewport_size(
+                {"width": viewport["width"], "height": expanded["bottom"]}
+            )
+        await wait_chart_painted(page, MODAL_SELECTOR)
+
+        content = page.locator(MODAL_SELECTOR + " .modal-content").first
+        if not await content.count():
+            content = page.locator(MODAL_BODY_SELECTOR).first
+        return await content.screenshot(animations="disabled")
+    except Exception:
+        pass
+    finally:
+        if viewport and page.viewport_size != viewport:
+            await page.set_viewport_size(viewport)
+        if expanded:
+            await page.evaluate(_RESTORE_MODAL_SCRIPT, [MODAL_SELECTOR, expanded["saved"]])
+
+    return await _screenshot_modal_stitched(page)
+
+
+async def _screenshot_modal_stitched(page):
+    """모달 바디를 스크롤하며 캡처하고 스크롤 이동량만큼만 새 행을 이어 붙인다."""
+    from PIL import Image
+
+    body = page.locator(MODAL_BODY_SELECTOR).first
+    await page.evaluate(
+        "(sel) => { const b = document.querySelector(sel); if (b) b.scrollTop = 0; }",
+        MODAL_BODY_SELECTOR,
+    )
+    await wait_scroll_settled(page, MODAL_BODY_SELECTOR)
+
+    combined = Image.open(BytesIO(await body.screenshot())).convert("RGB")
+    while True:
+        scrolled = await page.evaluate(
+            """(sel) => {
+                const b = document.querySelector(sel);
+                if (!b) return null;
+                const before = b.scrollTop;
+                b.scrollTop = before + b.clientHeight;
+                return {delta: b.scrollTop - before, clientHeight: b.clientHeight};
+            }""",
+            MODAL_BODY_SELECTOR,
+        )
+        if not scrolled or scrolled["delta"] <= 0:
+            break
+        await wait_scroll_settled(page, MODAL_BODY_SELECTOR)
+        await wait_chart_painted(page, MODAL_SELECTOR)
+        part = Image.open(BytesIO(await body.screenshot())).convert("RGB")
+        expected = _expected_overlap(part.height, scrolled["delta"], scrolled["clientHeight"])
+        combined = _stitch_vertical(combined, part, expected)
+
+    out = BytesIO()
+    combined.save(out, format="PNG")
+    return out.getvalue()
+
+
+def _expected_overlap(part_height, delta, client_height):
+    """스크롤 이동량(CSS px)으로 새 캡처에서 이전 캡처와 겹치는 이미지 행 수를 구한다.
+
+    캡처 이미지 높이는 clientHeight × devicePixelRatio이므로 같은 비율로 환산한다.
+    한 화면 전체를 스크롤했으면 0, 마지막처럼 덜 스크롤됐으면 남은 만큼 겹친다.
+    """
+    if client_height <= 0:
+        return 0
+    new_rows = delta * part_height / client_height
+    return max(0, min(part_height, int(round(part_height - new_rows))))
+
+
+def _find_row_overlap(upper, lower, expected, tolerance=2):
+    """스크롤 이동량으로 구한 겹침(expected)을 픽셀 행 비교로 확인한다.
+
+    반올림 오차를 감안해 expected ± tolerance 범위에서 upper 끝 k행과
+    lower 앞 k행이 같은 k를 찾는다 (expected에 가까운 값 우선).
+    빈 행이나 반복되는 행이 많아도 겹침이 이 범위를 벗어나지 않으므로 행이 빠지지 않는다.
+    확인되지 않으면(렌더링 차이 등) expected를 그대로 쓴다.
+    """
+    import numpy as np
+
+    if expected <= 0:
+        return 0
+    top = np.asarray(upper)
+    bottom = np.asarray(lower)
+    if top.shape[1:] != bottom.shape[1:]:
+        return expected
+
+    def _row_hashes(pixels):
+        rows = pixels.reshape(pixels.shape[0], -1)
+        return [hash(row.tobytes()) for row in rows]
+
+    top_rows = _row_hashes(top)
+    bottom_rows = _row_hashes(bottom)
+    limit = min(len(top_rows), len(bottom_rows))
+    candidates = sorted(
+        range(max(1, expected - tolerance), min(limit, expected + tolerance) + 1),
+        key=lambda k: abs(k - expected),
+    )
+    for k in candidates:
+        if top_rows[-k:] == bottom_rows[:k]:
+            return k
+    return min(expected, len(bottom_rows))
+
+
+def _stitch_vertical(upper, lower, expected_overlap):
+    """겹친 행을 한 번만 남기고 두 이미지를 세로로 이어 붙인다."""
+    from PIL import Image
+
+    overlap = _find_row_overlap(upper, lower, expected_overlap)
+    if overlap >= lower.height:
+        return upper
+    width = max(upper.width, lower.width)
+    combined = Image.new("RGB", (width, upper.height + lower.height - overlap), color="white")
+    combined.paste(upper, (0, 0))
+    combined.paste(lower.crop((0, overlap, lower.width, lower.height)), (0, upper.height))
+    return combined
+
+
+def scrape_keyword_charts(
+    keyword, naver_id, naver_pw, num_keywords=3, progress_callback=None, capture="image",
+    parallel_pages=None,
+):
     """동기 래퍼: Playwright 비동기 함수를 동기적으로 실행한다."""
     loop = asyncio.new_event_loop()
     try:
         return loop.run_until_complete(
-            _scrape_keyword_charts(keyword, naver_id, naver_pw, num_keywords, progress_callback)
+            _scrape_keyword_charts(
+                keyword, naver_id, naver_pw, num_keywords, progress_callback, capture,
+                parallel_pages,
+            )
         )
     finally:
         loop.close()
@@ -0,0 +1,158 @@
+"""검색광고 스크래퍼용 조건 대기 유틸리티.
+
+고정된 asyncio.sleep 대신 실제 조건(셀렉터 표시/숨김, URL 변경, 입력값 반영,
+차트 렌더링 완료, 스크롤 정지)을 기다린다. 모든 대기는 단계별 타임아웃을 갖고,
+StepTimer로 단계마다 걸린 시간을 기록한다.
+"""
+import itertools
+import time
+from contextlib import contextmanager
+
+from config.settings import SCRAPER_STEP_TIMEOUT_MS
+
+
+# 대기마다 다른 이름의 DOM 속성에 직전 프레임 값을 기록한다. 같은 요소(키워드마다
+# 재사용되는 모달 등)에 남은 이전 대기의 값과 비교해 바로 통과하는 일을 막는다.
+_wait_ids = itertools.count()
+
+
+def _frame_key(prefix):
+    return "{}_{}".format(prefix, next(_wait_ids))
+
+
+class StepTimer:
+    """스크래핑 단계별 소요 시간을 기록한다."""
+
+    def __init__(self, log=None):
+        self.records = []
+        self._log = log
+
+    @contextmanager
+    def step(self, name):
+        """with 블록 실행 시간을 name 단계로 기록한다. (실패한 단계도 기록)"""
+        started = time.monotonic()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            elapsed = time.monotonic() - started
+            self.records.append({"step": name, "seconds": round(elapsed, 2), "ok": ok})
+
+    def summary(self):
+        """'단계 1.23s, ...' 형식의 요약 문자열."""
+        return ", ".join(
+            "{} {:.2f}s{}".format(r["step"], r["seconds"], "" if r["ok"] else "(실패)")
+            for r in self.records
+        )
+
+
+async def wait_visible(page, selector, timeout=SCRAPER_STEP_TIMEOUT_MS):
+    """셀렉터가 화면에 보일 때까지 기다리고 요소를 반환한다."""
+    return await page.wait_for_selector(selector, state="visible", timeout=timeout)
+
+
+async def wait_hidden(page, selector, timeout=SCRAPER_STEP_TIMEOUT_MS):
+    """셀렉터가 사라지거나 숨겨질 때까지 기다린다. 시간 내에 사라지면 True."""
+    try:
+        await page.wait_for_selector(selector, state="hidden", timeout=timeout)
+        return True
+    except Exception:
+        return False
+
+
+async def wait_url(page, predicate, timeout=SCRAPER_STEP_TIMEOUT_MS):
+    """page.url이 predicate(url)을 만족할 때까지 기다린다."""
+    await page.wait_for_url(lambda url: predicate(str(url)), timeout=timeout)
+
+
+async def wait_url_contains(page, fragments, timeout=SCRAPER_STEP_TIMEOUT_MS):
+    """URL에 fragments 중 하나가 포함될 때까지 기다린다."""
+    await wait_url(page, lambda url: any(f in url for f in fragments), timeout)
+
+
+async def wait_focused(page, selector, timeout=SCRAPER_STEP_TIMEOUT_MS):
+    """selector 요소가 포커스를 받을 때까지 기다린다."""
+    await page.wait_for_function(
+        "(sel) => document.activeElement === document.querySelector(sel)",
+        arg=selector,
+        timeout=timeout,
+    )
+
+
+async def wait_input_value(page, selector, empty, timeout=SCRAPER_STEP_TIMEOUT_MS):
+    """입력창 값이 비었는지(empty=True) 또는 채워졌는지(False) 반영될 때까지 기다린다."""
+    await page.wait_for_function(
+        """([sel, empty]) => {
+            const el = document.querySelector(sel);
+            if (!el) return false;
+            return empty ? el.value.length === 0 : el.value.length > 0;
+        }""",
+        arg=[selector, empty],
+        timeout=timeout,
+    )
+
+
+async def wait_chart_painted(page, container_selector, timeout=SCRAPER_STEP_TIMEOUT_MS):
+    """컨테이너 안의 차트(SVG 도형 또는 canvas 픽셀)가 그려질 때까지 기다린다.
+
+    차트 애니메이션이 끝나도록 그려진 뒤 두 프레임 동안 도형 수가
+    변하지 않는지까지 확인한다. 직전 프레임 도형 수는 이번 대기 전용 속성에
+    기록하므로 이전 키워드 차트의 값과 비교되지 않는다.
+    """
+    await page.wait_for_function(
+        """([sel, key]) => {
+            const root = document.querySelector(sel);
+            if (!root) return false;
+            const shapes = root.querySelectorAll(
+                'svg path, svg rect, svg circle').length;
+            let painted = shapes > 0;
+            if (!painted) {
+                for (const c of root.querySelectorAll('canvas')) {
+                    if (!c.width || !c.height) continue;
+                    try {
+                        const ctx = c.getContext('2d');
+                        const d = ctx.getImageData(0, 0, c.width, c.height).data;
+                        for (let i = 3; i < d.length; i += 4 * 64) {
+                            if (d[i] !== 0) { painted = true; break; }
+                        }
+                    } catch (e) { painted = true; }
+                    if (painted) break;
+                }
+            }
+            if (!painted) return false;
+            const prev = root[key];
+            root[key] = shapes;
+            if (prev !== shapes) return false;
+            delete root[key];
+            return true;
+        }""",
+        arg=[container_selector, _frame_key("__chartShapeCount")],
+        timeout=timeout,
+        polling="raf",
+    )
+
+
+async def wait_scroll_settled(page, selector, timeout=SCRAPER_STEP_TIMEOUT_MS):
+    """selector 요소(없으면 문서)의 스크롤 위치가 두 프레임 연속 같아질 때까지 기다린다."""
+    await page.wait_for_function(
+        """([sel, key]) => {
+            const el = document.querySelector(sel) || document.scrollingElement;
+            const prev = el[key];
+            el[key] = el.scrollTop;
+            if (prev !== el.scrollTop) return false;
+            delete el[key];
+            return true;
+        }""",
+        arg=[selector, _frame_key("__lastScrollTop")],
+        timeout=timeout,
+        polling="raf",
+    )
+
+
+async def wait_network_quiet(page, timeout=SCRAPER_STEP_TIMEOUT_MS):
+    """networkidle을 기다리되, 폴링 요청 때문에 끝나지 않아도 실패로 보지 않는다."""
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+    except Exception:
+        pass
@@ -1,9 +1,6 @@
 import streamlit as st
 
 from ui.sidebar import render_sidebar
-from ui.tab_keywords import render_keywords_tab
-from ui.tab_autocomplete import render_autocomplete_tab
-from services.keyword_analyzer import analyze_keyword
 
 st.set_page_config(
     page_title="네이버 키워드 분석 도구",
@@ -18,13 +15,26 @@ st.caption("메인 키워드를 입력하면 연관 키워드와 자동완성을
 keyword, credentials = render_sidebar()
 
 if keyword:
+    # 분석/결과 화면 모듈(pandas, plotly 포함)은 첫 분석 때 불러온다.
+    # 빈 화면으로 시작할 때는 사이드바만 그리면 되므로 시작 시간이 짧아진다.
+    from services.keyword_analyzer import analyze_keyword_cached
+    from ui.tab_autocomplete import render_autocomplete_tab
+    from ui.tab_keywords import render_keywords_tab
+
+    refresh = st.session_state.pop("refresh_analysis", False)
     with st.spinner("분석 중..."):
-        result = analyze_keyword(keyword, credentials)
+        result = analyze_keyword_cached(keyword, credentials, refresh=refresh)
 
     # 부분 에러 표시
     for err in result.get("errors", []):
         st.warning(err)
 
+    if st.session_state.get("show_timings"):
+        from ui.timing_waterfall import render_timing_waterfall
+
+        with st.expander("소요 시간 (워터폴)", expanded=True):
+            render_timing_waterfall(result.get("timings", []))
+
     # 2개 탭으로 결과 표시
     tab1, tab2 = st.tabs([
         "연관 키워드 + 검색량",
@@ -32,7 +42,7 @@ if keyword:
     ])
 
     with tab1:
-        render_keywords_tab(result.get("related_keywords"))
+        render_keywords_tab(result.get("related_keywords"), result.get("search_volume"))
     with tab2:
         render_autocomplete_tab(result.get("autocomplete", []))
 else:
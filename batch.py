@@ -0,0 +1,97 @@
+"""키워드 대량 분석 CLI.
+
+사용 예:
+    python batch.py keywords.txt -o results.jsonl
+    cat keywords.txt | python batch.py - -o results.csv --workers 8
+
+중단된 경우 같은 명령을 다시 실행하면 체크포인트(<output>.ckpt)를 읽어
+이미 완료된 키워드는 건너뛰고 이어서 처리한다.
+"""
+import argparse
+import os
+import sys
+
+from services.bulk_analyzer import iter_keywords, run_bulk_analysis
+from utils.credential_pool import extra_key_sets_from_env
+
+# .env 파일 자동 로드 (python-dotenv 설치 필요: pip install python-dotenv)
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+
+def _get_credentials():
+    """환경변수(.env)에서 API 인증 정보를 가져온다."""
+    return {
+        "searchad_api_key": os.getenv("SEARCHAD_API_KEY", ""),
+        "searchad_secret_key": os.getenv("SEARCHAD_SECRET_KEY", ""),
+        "searchad_customer_id": os.getenv("SEARCHAD_CUSTOMER_ID", ""),
+        "datalab_client_id": os.getenv("DATALAB_CLIENT_ID", ""),
+        "datalab_client_secret": os.getenv("DATALAB_CLIENT_SECRET", ""),
+        # 추가 키 세트 (SEARCHAD_API_KEY_2 ... 형식) — 키 풀에서 번갈아 사용
+        "searchad_extra_keys": extra_key_sets_from_env("searchad"),
+        "datalab_extra_keys": extra_key_sets_from_env("datalab"),
+    }
+
+
+def _positive_int(value):
+    """argparse용: 1 이상의 정수만 허용한다."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("1 이상의 정수여야 합니다: {}".format(value))
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="네이버 키워드 대량 분석")
+    parser.add_argument("input", help="키워드 파일 경로 (한 줄에 하나, '-'이면 표준입력)")
+    parser.add_argument("-o", "--output", required=True, help="결과 파일 경로 (.csv 또는 .jsonl)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="출력 형식 (기본: 확장자로 판단)")
+    parser.add_argument("--workers", type=_positive_int, default=4, help="동시 처리 키워드 수 (기본 4)")
+    parser.add_argument("--checkpoint", help="체크포인트 파일 경로 (기본: <output>.ckpt)")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.output.lower().endswith(".csv") else "jsonl")
+
+    def on_progress(keyword, done):
+        print("[{}] {}".format(done, keyword), file=sys.stderr)
+
+    if args.input == "-":
+        source = sys.stdin
+    else:
+        source = open(args.input, encoding="utf-8")
+
+    try:
+        summary = run_bulk_analysis(
+            iter_keywords(source),
+            _get_credentials(),
+            args.output,
+            fmt=fmt,
+            checkpoint_path=args.checkpoint,
+            max_workers=args.workers,
+            progress_callback=on_progress,
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    print(
+        "완료: {}개 처리 (오류 {}개는 다음 실행 때 재시도), "
+        "{}개 건너뜀 (체크포인트), 중복 입력 {}개".format(
+            summary["done"], summary["failed"], summary["skipped"], summary["duplicates"]
+        ),
+        file=sys.stderr,
+    )
+    if summary["quota_error"]:
+        print(
+            "중단: {} 남은 키워드는 같은 명령으로 이어서 처리하세요.".format(summary["quota_error"]),
+            file=sys.stderr,
+        )
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""벤치마크용 로컬 모의 네이버 서버.
+
+하나의 포트에서 세 엔드포인트를 흉내 낸다.
+
+- GET  /keywordstool          검색광고 키워드 도구 (HMAC 서명 헤더 검증)
+- POST /v1/datalab/search     데이터랩 검색어 트렌드
+- GET  /nx/ac                 검색창 자동완성
+
+응답 값은 요청 내용의 해시로 만들어 같은 요청에는 항상 같은 값을 준다.
+지연(latency/jitter), 500 오류 비율, 429 비율을 설정할 수 있고
+엔드포인트별 응답 코드 횟수를 센다. 데이터랩 429는 초당 한도 초과(errorCode 012)로 응답한다.
+"""
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from utils.auth import generate_signature
+
+# 모의 서버가 받아들이는 인증 정보
+SEARCHAD_CREDENTIALS = {
+    "bench-api-key": ("bench-secret", "1234567"),
+}
+DATALAB_CREDENTIALS = {
+    "bench-client-id": "bench-client-secret",
+}
+
+# 서명 타임스탬프 허용 오차 (밀리초)
+SIGNATURE_TOLERANCE_MS = 5 * 60 * 1000
+
+# 데이터랩 초당 한도 초과 응답 본문 (일일 한도 소진은 errorCode 010)
+RATE_LIMIT_ERROR = {"errorCode": "012", "errorMessage": "Rate limit exceeded."}
+
+RELATED_PER_HINT = 30
+AUTOCOMPLETE_SIZE = 10
+
+
+def _seeded(*parts):
+    """요청 내용으로 결정되는 0~1 사이 값."""
+    digest = hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2 ** 64
+
+
+def _periods(start, end, time_unit):
+    start_date = datetime.strptime(start, "%Y-%m-%d")
+    end_date = datetime.strptime(end, "%Y-%m-%d")
+    periods = []
+    current = start_date
+    while current <= end_date:
+        periods.append(current.strftime("%Y-%m-%d"))
+        if time_unit == "month":
+            year, month = divmod(current.month, 12)
+            current = datetime(current.year + year, month + 1, 1)
+        elif time_unit == "week":
+            current += timedelta(days=7)
+        else:
+            current += timedelta(days=1)
+    return periods
+
+
+def keywordstool_response(hints):
+    keyword_list = []
+    for hint in hints:
+        for i in range(RELATED_PER_HINT + 1):
+            keyword = hint if i == 0 else "{} 관련{}".format(hint, i)
+            pc = int(_seeded(keyword, "pc") * 50000)
+            mobile = int(_seeded(keyword, "mobile") * 200000)
+            keyword_list.append({
+                "relKeyword": keyword,
+                "monthlyPcQcCnt": pc if pc >= 10 else "< 10",
+                "monthlyMobileQcCnt": mobile if mobile >= 10 else "< 10",
+                "compIdx": ("높음", "중간", "낮음")[int(_seeded(keyword, "comp") * 3)],
+            })
+    return {"keywordList": keyword_list}
+
+
+def datalab_response(body):
+    filters = {k: body.get(k) for k in ("device", "gender", "ages") if body.get(k)}
+    periods = _periods(body["startDate"], body["endDate"], body.get("timeUnit", "date"))
+    raw = {}
+    for group in body.get("keywordGroups", []):
+        name = group["groupName"]
+        raw[name] = [
+            _seeded(name, json.dumps(filters, sort_keys=True), period) for period in periods
+        ]
+    # 실제 API처럼 요청 안의 최댓값을 100으로 정규화
+    peak = max((v for values in raw.values() for v in values), default=0) or 1
+    return {
+        "startDate": body["startDate"],
+        "endDate": body["endDate"],
+        "timeUnit": body.get("timeUnit", "date"),
+        "results": [
+            {
+                "title": name,
+                "keywords": [name],
+                "data": [
+                    {"period": period, "ratio": round(value / peak * 100, 5)}
+                    for period, value in zip(periods, values)
+                ],
+            }
+            for name, values in raw.items()
+        ],
+    }
+
+
+def autocomplete_response(query):
+    items = [[query]] + [
+        ["{} 추천{}".format(query, i)] for i in range(1, AUTOCOMPLETE_SIZE)
+    ]
+    return {"query": [query], "items": [items]}
+
+
+class MockNaverServer:
+    """모의 서버를 백그라운드 스레드에서 실행한다.
+
+    Args:
+        latency: 응답마다 추가할 지연 (초)
+        jitter: latency에 더할 0~jitter초 무작위 지연
+        error_rate: 500으로 응답할 비율 (0~1)
+        rate_limit_rate: 429로 응답할 비율 (0~1)
+        seed: 지연/오류 주입용 난수 시드
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0,
+                 error_rate=0.0, rate_limit_rate=0.0, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counts = {}
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+    def env(self):
+        """config.settings가 읽는 API 주소 환경변수."""
+        return {
+            "SEARCHAD_BASE_URL": self.base_url,
+            "DATALAB_URL": self.base_url + "/v1/datalab/search",
+            "AUTOCOMPLETE_URL": self.base_url + "/nx/ac",
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def counts(self):
+        """{endpoint: {status: 횟수}}"""
+        with self._lock:
+            return {name: dict(statuses) for name, statuses in self._counts.items()}
+
+    def reset_counts(self):
+        with self._lock:
+            self._counts.clear()
+
+    def _record(self, endpoint, status):
+        with self._lock:
+            statuses = self._counts.setdefault(endpoint, {})
+            statuses[status] = statuses.get(status, 0) + 1
+
+    def _inject(self):
+        """지연을 적용하고 주입할 오류 코드를 정한다. 없으면 None."""
+        with self._lock:
+            delay = self.latency + self._random.random() * self.jitter
+            roll = self._random.random()
+        if delay > 0:
+            time.sleep(delay)
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 500
+        return None
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, endpoint, status, payload=None):
+                server._record(endpoint, status)
+                body = json.dumps(payload or {}, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=UTF-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _check_searchad_signature(self, method, uri):
+                api_key = self.headers.get("X-API-KEY", "")
+                timestamp = self.headers.get("X-Timestamp", "")
+                if api_key not in SEARCHAD_CREDENTIALS or not timestamp.isdigit():
+                    return False
+                secret, customer_id = SEARCHAD_CREDENTIALS[api_key]
+                if self.headers.get("X-Customer") != customer_id:
+                    return False
+                if abs(time.time() * 1000 - int(timestamp)) > SIGNATURE_TOLERANCE_MS:
+                    return False
+                expected = generate_signature(timestamp, method, uri, secret)
+                return self.headers.get("X-Signature") == expected
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                query = parse_qs(url.query)
+                if url.path == "/keywordstool":
+                    if not self._check_searchad_signature("GET", url.path):
+                        return self._send("keywordstool", 401, {"title": "Unauthorized"})
+                    injected = server._inject()
+                    if injected:
+                        return self._send("keywordstool", injected)
+                    hints = query.get("hintKeywords", [""])[0].split(",")
+                    return self._send("keywordstool", 200, keywordstool_response(hints))
+                if url.path == "/nx/ac":
+                    injected = server._inject()
+                    if injected:
+                        return self._send("autocomplete", injected)
+                    q = query.get("q", [""])[0]
+                    return self._send("autocomplete", 200, autocomplete_response(q))
+                self._send("unknown", 404)
+
+            def do_POST(self):
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length)
+                if url.path != "/v1/datalab/search":
+                    return self._send("unknown", 404)
+                client_id = self.headers.get("X-Naver-Client-Id", "")
+                if DATALAB_CREDENTIALS.get(client_id) != self.headers.get("X-Naver-Client-Secret"):
+                    return self._send("datalab", 401, {"errorCode": "024"})
+                injected = server._inject()
+                if injected == 429:
+                    return self._send("datalab", 429, RATE_LIMIT_ERROR)
+                if injected:
+                    return self._send("datalab", injected)
+                try:
+                    body = json.loads(raw)
+                    payload = datalab_response(body)
+                except (ValueError, KeyError):
+                    return self._send("datalab", 400, {"errorCode": "400"})
+                self._send("datalab", 200, payload)
+
+        return Handler
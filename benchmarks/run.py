@@ -0,0 +1,223 @@
+"""로컬 모의 서버를 상대로 주요 경로의 성능을 측정한다.
+
+사용 예:
+    python -m benchmarks.run
+    python -m benchmarks.run --latency 0.05 --jitter 0.02 --iterations 20
+    python -m benchmarks.run --error-rate 0.05 --rate-limit-rate 0.02 --json
+
+측정 대상:
+- analyze_keyword: 자동완성 + keywordstool (키워드마다 1회씩)
+- fetch_demographics: 데이터랩 13회
+- fetch_demographics_by_device: 데이터랩 18회
+- bulk: run_bulk_analysis로 키워드 여러 개를 스트리밍 처리
+
+디스크 응답 캐시는 끄고, 호출 예산은 임시 DB를 쓴다.
+초당 호출 제한(DATALAB_RATE_PER_SEC 등)은 운영 설정 그대로 적용되므로
+결과에는 속도 제한에 따른 대기도 포함된다.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.mock_servers import DATALAB_CREDENTIALS, SEARCHAD_CREDENTIALS, MockNaverServer
+
+BENCHMARKS = ["analyze_keyword", "fetch_demographics", "fetch_demographics_by_device", "bulk"]
+
+
+def _credentials():
+    api_key, (secret, customer_id) = next(iter(SEARCHAD_CREDENTIALS.items()))
+    client_id, client_secret = next(iter(DATALAB_CREDENTIALS.items()))
+    return {
+        "searchad_api_key": api_key,
+        "searchad_secret_key": secret,
+        "searchad_customer_id": customer_id,
+        "datalab_client_id": client_id,
+        "datalab_client_secret": client_secret,
+    }
+
+
+def percentile(sorted_values, p):
+    """정렬된 값에서 p(0~100) 백분위수를 구한다. (최근접 순위)"""
+    if not sorted_values:
+        return None
+    rank = max(1, int(round(p / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _summarize(name, latencies, errors, elapsed, units, server):
+    latencies = sorted(latencies)
+    return {
+        "name": name,
+        "units": units,
+        "errors": errors,
+        "elapsed_sec": round(elapsed, 4),
+        "throughput_per_sec": round(units / elapsed, 2) if elapsed > 0 else None,
+        "p50_ms": _ms(percentile(latencies, 50)),
+        "p95_ms": _ms(percentile(latencies, 95)),
+        "p99_ms": _ms(percentile(latencies, 99)),
+        "calls": server.counts(),
+    }
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+def _time_each(func, keywords):
+    latencies = []
+    errors = 0
+    for keyword in keywords:
+        started = time.perf_counter()
+        try:
+            func(keyword)
+        except Exception:
+            errors += 1
+        latencies.append(time.perf_counter() - started)
+    return latencies, errors
+
+
+def run_benchmark(name, server, iterations, bulk_size, bulk_workers):
+    """벤치마크 하나를 실행하고 요약 dict를 반환한다."""
+    # config.settings가 모의 서버 주소를 읽은 뒤에 가져와야 한다.
+    from api.naver_datalab import fetch_demographics, fetch_demographics_by_device
+    from services.bulk_analyzer import run_bulk_analysis
+    from services.keyword_analyzer import analyze_keyword
+    from utils.credential_pool import pool_from_credentials
+
+    credentials = _credentials()
+    # 앱과 같이 데이터랩 호출도 키 풀을 거친다.
+    datalab_pool = pool_from_credentials(credentials, "datalab")
+    keywords = ["{} 벤치{}".format(name, i) for i in range(iterations)]
+    server.reset_counts()
+
+    started = time.perf_counter()
+    if name == "analyze_keyword":
+        latencies, errors = _time_each(
+            lambda kw: _raise_errors(analyze_keyword(kw, credentials)), keywords
+        )
+        units = iterations
+    elif name == "fetch_demographics":
+        latencies, errors = _time_each(
+            lambda kw: datalab_pool.call(fetch_demographics, kw), keywords
+        )
+        units = iterations
+    elif name == "fetch_demographics_by_device":
+        latencies, errors = _time_each(
+            lambda kw: datalab_pool.call(fetch_demographics_by_device, kw), keywords
+        )
+        units = iterations
+    elif name == "bulk":
+        bulk_keywords = ["대량 벤치{}".format(i) for i in range(bulk_size)]
+        latencies = []
+        last = [started]
+
+        def on_progress(keyword, done):
+            # 완료 간격 (스트리밍 처리에서 행 하나가 나오는 주기)
+            now = time.perf_counter()
+            latencies.append(now - last[0])
+            last[0] = now
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = os.path.join(tmp, "bulk.jsonl")
+            summary = run_bulk_analysis(
+                iter(bulk_keywords), credentials, output_path,
+                max_workers=bulk_workers, progress_callback=on_progress,
+            )
+            with open(output_path, encoding="utf-8") as f:
+                failed_rows = sum(1 for line in f if json.loads(line)["오류"])
+        # 오류가 기록된 행 + 호출 예산 부족으로 처리하지 못한 키워드
+        errors = failed_rows + (bulk_size - summary["done"])
+        units = bulk_size
+    else:
+        raise ValueError("알 수 없는 벤치마크: {}".format(name))
+    elapsed = time.perf_counter() - started
+
+    return _summarize(name, latencies, errors, elapsed, units, server)
+
+
+def _raise_errors(result):
+    if result.get("errors"):
+        raise Exception("; ".join(result["errors"]))
+    return result
+
+
+def _format_table(results):
+    header = "{:<30} {:>6} {:>6} {:>10} {:>9} {:>9} {:>9}  {}".format(
+        "benchmark", "units", "errors", "per_sec", "p50_ms", "p95_ms", "p99_ms", "calls"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        calls = ", ".join(
+            "{} {}".format(endpoint, "/".join("{}:{}".format(s, n) for s, n in sorted(statuses.items())))
+            for endpoint, statuses in sorted(r["calls"].items())
+        )
+        lines.append("{:<30} {:>6} {:>6} {:>10} {:>9} {:>9} {:>9}  {}".format(
+            r["name"], r["units"], r["errors"], r["throughput_per_sec"],
+            r["p50_ms"], r["p95_ms"], r["p99_ms"], calls,
+        ))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="모의 네이버 서버 벤치마크")
+    parser.add_argument("--only", choices=BENCHMARKS, action="append", help="실행할 벤치마크 (여러 번 지정 가능)")
+    parser.add_argument("--iterations", type=int, default=10, help="벤치마크별 반복 횟수 (기본 10)")
+    parser.add_argument("--bulk-size", type=int, default=50, help="bulk 벤치마크 키워드 수 (기본 50)")
+    parser.add_argument("--bulk-workers", type=int, default=4, help="bulk 동시 처리 수 (기본 4)")
+    parser.add_argument("--latency", type=float, default=0.02, help="모의 서버 응답 지연 (초, 기본 0.02)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연 상한 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율 (0~1)")
+    parser.add_argument(
+        "--rate-limit-rate", type=float, default=0.0,
+        help="429(초당 한도 초과) 응답 비율 (0~1). 클라이언트는 대기 후 재시도한다",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="지연/오류 주입 난수 시드")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument(
+        "--metrics", action="store_true",
+        help="클라이언트 측 엔드포인트별 지표(utils/metrics.py)를 Prometheus 형식으로 함께 출력",
+    )
+    args = parser.parse_args(argv)
+
+    if "config.settings" in sys.modules:
+        raise Exception("config.settings가 이미 로드되었습니다. 벤치마크는 별도 프로세스로 실행하세요.")
+
+    server = MockNaverServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+    with server, tempfile.TemporaryDirectory() as tmp:
+        os.environ.update(server.env())
+        os.environ["CACHE_ENABLED"] = "0"
+        os.environ["QUOTA_DB_PATH"] = os.path.join(tmp, "quota.sqlite3")
+
+        results = [
+            run_benchmark(name, server, args.iterations, args.bulk_size, args.bulk_workers)
+            for name in (args.only or BENCHMARKS)
+        ]
+
+        from api import http_client
+        from utils import metrics
+        http_client.close_all()
+
+    if args.json:
+        output = {"config": vars(args), "results": results}
+        if args.metrics:
+            output["metrics"] = metrics.to_dict()
+        print(json.dumps(output, ensure_ascii=False, indent=2))
+    else:
+        print(_format_table(results))
+        if args.metrics:
+            print()
+            print(metrics.to_prometheus(), end="")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,18 @@
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# API 주소는 환경변수로 바꿀 수 있다 (benchmarks/의 로컬 모의 서버 등)
+
 # 네이버 검색광고 API
-SEARCHAD_BASE_URL = "https://api.naver.com"
+SEARCHAD_BASE_URL = os.getenv("SEARCHAD_BASE_URL", "https://api.naver.com")
 SEARCHAD_KEYWORD_URI = "/keywordstool"
 
 # 네이버 데이터랩 API
-DATALAB_URL = "https://openapi.naver.com/v1/datalab/search"
+DATALAB_URL = os.getenv("DATALAB_URL", "https://openapi.naver.com/v1/datalab/search")
 
 # 네이버 자동완성 (비공식)
-AUTOCOMPLETE_URL = "https://ac.search.naver.com/nx/ac"
+AUTOCOMPLETE_URL = os.getenv("AUTOCOMPLETE_URL", "https://ac.search.naver.com/nx/ac")
 
 # 연령대 코드 매핑 (네이버 데이터랩)
 AGE_CODE_MAP = {
@@ -40,3 +46,109 @@ AUTOCOMPLETE_PARAMS = {
 
 # API 요청 타임아웃 (초)
 REQUEST_TIMEOUT = 10
+
+# 데이터랩 동시 호출 설정
+# 세그먼트(성별/연령/디바이스) 호출을 병렬로 실행할 최대 스레드 수 (1이면 순차 실행)
+DATALAB_MAX_WORKERS = 6
+# 데이터랩 API 초당 최대 호출 수 (인증 정보별 토큰 버킷)
+DATALAB_RATE_PER_SEC = 10
+
+# 공용 HTTP 전송 계층 설정 (api/http_client.py)
+# 호스트별 keep-alive 커넥션 풀 크기
+HTTP_POOL_MAXSIZE = 16
+# 연결/응답 타임아웃 (초) — 연결은 짧게, 응답 대기는 REQUEST_TIMEOUT만큼
+HTTP_CONNECT_TIMEOUT = 3.05
+HTTP_READ_TIMEOUT = REQUEST_TIMEOUT
+# HTTP/2 사용 여부 (httpx[http2] 설치 시에만 적용, 미설치 시 HTTP/1.1로 동작)
+HTTP2_ENABLED = False
+
+# 디스크 응답 캐시 설정 (utils/response_cache.py)
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "1") != "0"
+CACHE_DB_PATH = os.path.join(BASE_DIR, "cache", "api_cache.sqlite3")
+# 최대 보관 항목 수 — 초과 시 가장 오래 사용되지 않은 항목부터 삭제 (LRU)
+CACHE_MAX_ENTRIES = 20000
+# 캐시 적중 시 마지막 사용 시각을 모아 두었다가 한 번에 기록하는 개수
+CACHE_ACCESS_FLUSH_SIZE = 256
+# 자동완성 캐시 유지 시간 (초). keywordstool은 월 경계, 데이터랩은 일 경계까지 유지
+AUTOCOMPLETE_CACHE_TTL = 600
+
+# 검색광고 /keywordstool 1회 요청당 최대 힌트 키워드 수
+KEYWORDSTOOL_MAX_HINTS = 5
+# 힌트 묶음 요청을 동시에 보낼 최대 스레드 수 (초당 한도는 utils/quota.py가 지킨다)
+KEYWORDSTOOL_MAX_WORKERS = 4
+
+# 데이터랩 1회 요청당 최대 keywordGroups 수 (앵커 키워드 포함)
+DATALAB_MAX_GROUPS = 5
+
+# 일별 추이 증분 갱신 저장소 (utils/trend_store.py)
+TREND_STORE_PATH = os.path.join(BASE_DIR, "cache", "trends.sqlite3")
+# 증분 갱신 시 저장된 값과 겹치게 다시 받아 스케일을 맞출 일수
+TREND_OVERLAP_DAYS = 7
+
+# 자동완성 확장 크롤러 설정
+# 동시에 진행할 최대 요청 수
+AUTOCOMPLETE_CRAWL_CONCURRENCY = 8
+# 자동완성 호스트(ac.search.naver.com) 초당 최대 호출 수
+AUTOCOMPLETE_RATE_PER_SEC = 20
+
+# 분석 결과 메모리 캐시 (Streamlit 재실행 간 재사용)
+ANALYSIS_CACHE_TTL = 600
+ANALYSIS_CACHE_MAX_ENTRIES = 128
+
+# 백그라운드 작업 (차트 스크래핑) 설정
+# 동시에 실행할 스크래핑 작업 수 (브라우저 인스턴스 수)
+SCRAPE_JOB_WORKERS = 2
+# 작업 상태/결과 저장 디렉터리
+JOB_STATE_DIR = os.path.join(BASE_DIR, "jobs")
+
+# 검색광고 스크래퍼 설정
+# 네이버 광고 시작 페이지 (로컬 테스트용 대체 사이트로 바꿀 수 있음)
+SCRAPER_ADS_URL = os.getenv("SCRAPER_ADS_URL", "https://ads.naver.com/")
+# 로그인된 브라우저 세션(쿠키/로컬 스토리지) 저장 디렉터리
+SCRAPER_STATE_DIR = os.path.join(BASE_DIR, "cache", "browser_state")
+# 단계별 기본 대기 한도 (밀리초)
+SCRAPER_STEP_TIMEOUT_MS = 15000
+# 로그인 완료(2단계 인증 포함) 대기 한도 (밀리초)
+SCRAPER_LOGIN_TIMEOUT_MS = 90000
+# Playwright 동작 사이 인위적 지연 (밀리초, 디버깅 시에만 사용)
+SCRAPER_SLOW_MO = 0
+# 브라우저 창 없이 실행할지 여부 (SCRAPER_HEADLESS=1). 로그인 입력에 OS 키보드를
+# 쓰므로 기본값은 창을 띄우는 모드이며, 세션이 저장된 서버 환경에서만 켠다.
+SCRAPER_HEADLESS = os.getenv("SCRAPER_HEADLESS", "0") == "1"
+# 안내 팝업이 뜨는지 확인하며 기다리는 짧은 한도 (밀리초)
+SCRAPER_POPUP_PROBE_MS = 300
+# 차트 캡처에 동시에 사용할 브라우저 탭 수 (같은 로그인 세션 공유)
+SCRAPER_PARALLEL_PAGES = 3
+
+# 차트 이미지 저장소 (utils/image_store.py)
+IMAGE_STORE_DIR = os.path.join(BASE_DIR, "cache", "images")
+# 디스크 사용 한도 (바이트) — 초과 시 가장 오래 사용되지 않은 이미지부터 삭제
+IMAGE_STORE_MAX_BYTES = 200 * 1024 * 1024
+# 저장 형식 ("webp" 또는 "png"). WebP 인코더가 없으면 최적화 PNG로 저장
+IMAGE_STORE_FORMAT = "webp"
+IMAGE_STORE_QUALITY = 80
+
+# API 호출 예산 (utils/quota.py) — 인증 정보별로 하루 사용량을 기록한다
+QUOTA_DB_PATH = os.getenv("QUOTA_DB_PATH", os.path.join(BASE_DIR, "cache", "quota.sqlite3"))
+# 데이터랩 검색어 트렌드 일일 호출 한도 (애플리케이션당 1,000회)
+DATALAB_DAILY_QUOTA = 1000
+# 검색광고 API 일일 호출 한도 (None이면 제한 없음) / 초당 최대 호출 수
+SEARCHAD_DAILY_QUOTA = None
+SEARCHAD_RATE_PER_SEC = 10
+# 데이터랩 429 응답 중 일일 한도 소진을 뜻하는 errorCode (그 밖의 429는 초당 한도 초과)
+DATALAB_QUOTA_ERROR_CODES = ("010",)
+# 초당 한도 초과(429) 응답 재시도 횟수 / 첫 대기 시간 (초, 재시도마다 2배)
+RATE_LIMIT_RETRIES = 2
+RATE_LIMIT_BACKOFF_SEC = 1.0
+
+# API 키 풀 (utils/credential_pool.py)
+# 환경변수에서 읽을 추가 키 세트 수 (SEARCHAD_API_KEY_2 ... SEARCHAD_API_KEY_N 형식)
+CREDENTIAL_MAX_SETS = 10
+# 초당 한도 초과(429) 응답을 받은 키를 순환에서 빼 두는 시간 (초)
+# 일일 한도가 바닥난 키는 호출 예산(utils/quota.py)에서 따로 제외된다.
+CREDENTIAL_COOLDOWN_SEC = 10
+# 401(인증 실패) 응답을 받은 키를 순환에서 빼 두는 시간 (초)
+CREDENTIAL_AUTH_COOLDOWN_SEC = 3600
+
+# 시작 시 import 시간 한도 (utils/import_budget.py, 밀리초)
+IMPORT_BUDGET_MS = 1500
@@ -0,0 +1,261 @@
+"""키워드 대량 분석 — 파일/표준입력의 키워드를 스트리밍으로 처리한다.
+
+analyze_keyword()와 같은 소스(자동완성 + 검색광고 keywordstool)를 키워드별로
+조회하여 완료되는 순서대로 CSV/JSONL에 한 줄씩 기록한다.
+전체 결과를 메모리에 모으지 않으며, 체크포인트 파일에 완료된 키워드를 남겨
+중단 후 다시 실행하면 이미 끝난 키워드는 건너뛴다.
+오류가 있는 행도 결과 파일에는 기록하지만 체크포인트에는 남기지 않으므로,
+다시 실행하면 그 키워드를 재시도한다. 이때 체크포인트에 없는 이전 행은
+먼저 결과 파일에서 지우므로 키워드당 한 행만 남는다. (비정상 종료 직전에
+기록만 되고 체크포인트에 남지 않은 행도 같은 방식으로 정리된다.)
+
+검색광고 호출은 키 풀(utils/credential_pool.py)을 거치므로 추가 키 세트가 있으면
+여러 키로 나뉜다. 모든 키의 호출 예산(utils/quota.py)이 바닥나면 빈 검색량 행을 쌓지 않고
+새 키워드 제출을 멈춘다. 초당 한도 초과(429)는 멈출 이유가 아니므로
+키가 다시 쓸 수 있게 될 때까지 잠시 기다린 뒤 계속한다. 예산 부족으로 끝나지 못한 키워드는 체크포인트에
+남지 않으므로 예산이 회복된 뒤 같은 명령으로 이어서 처리할 수 있다.
+"""
+import csv
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from services.keyword_analyzer import ANALYSIS_SOURCES, run_sources
+from utils.credential_pool import pool_from_credentials
+from utils.errors import AuthenticationFailed, QuotaExceeded, RateLimited
+
+CSV_FIELDS = [
+    "키워드", "PC검색량", "모바일검색량", "총검색량",
+    "연관키워드수", "연관키워드_상위", "자동완성", "오류",
+]
+
+# 연관 키워드 상위 몇 개를 결과 행에 남길지
+TOP_RELATED = 10
+
+
+def analyze_keyword_row(keyword, credentials):
+    """키워드 1개를 분석해 출력용 평면 dict 한 행을 만든다.
+
+    analyze_keyword()와 같은 소스 단계(ANALYSIS_SOURCES / run_sources)를 사용하고
+    소스별 실패는 "오류" 목록에 모은다.
+    단, 호출 예산 부족(QuotaExceeded)은 행으로 남기지 않고 그대로 전파한다.
+    """
+    result = {"related_keywords": None, "autocomplete": [], "errors": []}
+    run_sources(keyword, credentials, ANALYSIS_SOURCES, result, propagate=(QuotaExceeded,))
+
+    row = {
+        "키워드": keyword,
+        "PC검색량": None,
+        "모바일검색량": None,
+        "총검색량": None,
+        "연관키워드수": 0,
+        "연관키워드_상위": [],
+        "자동완성": result["autocomplete"],
+        "오류": result["errors"],
+    }
+    tool_result = result["related_keywords"]
+    if tool_result is not None:
+        volume = tool_result.volume_of(keyword)
+        row["PC검색량"] = volume["pc"]
+        row["모바일검색량"] = volume["mobile"]
+        row["총검색량"] = volume["pc"] + volume["mobile"]
+        row["연관키워드수"] = len(tool_result)
+        row["연관키워드_상위"] = tool_result.top_keywords(TOP_RELATED)
+    return row
+
+
+def iter_keywords(lines):
+    """입력 줄에서 공백/빈 줄/주석(#)을 걸러 키워드를 하나씩 내보낸다."""
+    for line in lines:
+        keyword = line.strip()
+        if keyword and not keyword.startswith("#"):
+            yield keyword
+
+
+def load_checkpoint(path):
+    """체크포인트 파일에서 완료된 키워드 집합을 읽는다."""
+    if not path or not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+
+def drop_unfinished_rows(path, fmt, completed):
+    """결과 파일에서 체크포인트에 없는 키워드의 행을 지운다.
+
+    오류 행과 비정상 종료 직전에 기록된 행은 체크포인트에 없으므로
+    이어서 실행할 때 다시 분석된다. 새 행을 덧붙이기 전에 이전 행을 지워
+    결과 파일에 같은 키워드가 두 번 남지 않게 한다.
+
+    Returns:
+        지운 행 수
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return 0
+    tmp_path = path + ".tmp"
+    dropped = 0
+    if fmt == "csv":
+        with open(path, encoding="utf-8-sig", newline="") as src, \
+                open(tmp_path, "w", encoding="utf-8-sig", newline="") as dst:
+            reader = csv.DictReader(src)
+            writer = csv.DictWriter(dst, fieldnames=reader.fieldnames or CSV_FIELDS)
+            writer.writeheader()
+            for row in reader:
+                if row["키워드"] in completed:
+                    writer.writerow(row)
+                else:
+                    dropped += 1
+    else:
+        with open(path, encoding="utf-8") as src, \
+                open(tmp_path, "w", encoding="utf-8") as dst:
+            for line in src:
+                if not line.strip():
+                    continue
+                if json.loads(line)["키워드"] in completed:
+                    dst.write(line)
+                else:
+                    dropped += 1
+    os.replace(tmp_path, path)
+    return dropped
+
+
+class _RowWriter:
+    """결과 행을 CSV 또는 JSONL로 한 줄씩 기록한다."""
+
+    def __init__(self, path, fmt):
+        self.fmt = fmt
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        encoding = "utf-8-sig" if fmt == "csv" and is_new else "utf-8"
+        self._file = open(path, "a", encoding=encoding, newline="")
+        if fmt == "csv":
+            self._csv = csv.DictWriter(self._file, fieldnames=CSV_FIELDS)
+            if is_new:
+                self._csv.writeheader()
+
+    def write(self, row):
+        if self.fmt == "csv":
+            flat = dict(row)
+            for key in ("연관키워드_상위", "자동완성", "오류"):
+                flat[key] = " | ".join(row[key])
+            self._csv.writerow(flat)
+        else:
+            self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def run_bulk_analysis(
+    keywords,
+    credentials,
+    output_path,
+    fmt="jsonl",
+    checkpoint_path=None,
+    max_workers=4,
+    progress_callback=None,
+):
+    """키워드 이터러블을 제한된 동시성으로 분석하며 결과를 스트리밍 기록한다.
+
+    Args:
+        keywords: 키워드 이터러블 (지연 평가 — 파일 객체 그대로 넘겨도 됨)
+        output_path: 결과 파일 경로 (이어쓰기)
+        fmt: "csv" 또는 "jsonl"
+        checkpoint_path: 완료 키워드 기록 파일. None이면 output_path + ".ckpt"
+        max_workers: 동시에 처리할 키워드 수
+        progress_callback: 키워드 1개 완료 시 (keyword, done_count)로 호출
+
+    Returns:
+        {"done": 이번 실행에서 기록한 행 수, "failed": 그중 오류가 있어 체크포인트에
+         남기지 않은 수, "skipped": 체크포인트로 건너뛴 수, "duplicates": 입력 안에서
+         중복되어 건너뛴 수, "deferred": 호출 예산 부족으로 미룬 수,
+         "quota_error": 예산 부족 메시지 또는 None}
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers는 1 이상이어야 합니다.")
+    if checkpoint_path is None:
+        checkpoint_path = output_path + ".ckpt"
+    completed = load_checkpoint(checkpoint_path)
+    if os.path.exists(checkpoint_path):
+        # 이어서 실행: 다시 분석할 키워드의 이전 행을 먼저 지운다.
+        drop_unfinished_rows(output_path, fmt, completed)
+
+    writer = _RowWriter(output_path, fmt)
+    checkpoint = open(checkpoint_path, "a", encoding="utf-8")
+    done = 0
+    failed = 0
+    skipped = 0
+    duplicates = 0
+    deferred = 0
+    quota_error = None
+    pool = pool_from_credentials(credentials, "searchad")
+    # 진행 중인 작업 수를 제한해 입력 전체를 한 번에 제출하지 않는다.
+    max_in_flight = max_workers * 2
+
+    def _drain(pending, return_when):
+        nonlocal done, failed, deferred, quota_error
+        finished, pending = wait(pending, return_when=return_when)
+        for future in finished:
+            try:
+                row = future.result()
+            except QuotaExceeded as e:
+                deferred += 1
+                quota_error = str(e)
+                continue
+            writer.write(row)
+            if row["오류"]:
+                # 다음 실행에서 다시 시도하도록 체크포인트에 남기지 않는다.
+                failed += 1
+            else:
+                checkpoint.write(row["키워드"] + "\n")
+                checkpoint.flush()
+            done += 1
+            if progress_callback:
+                progress_callback(row["키워드"], done)
+        return pending
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = set()
+            # 이번 실행에서 이미 제출한 키워드
+            seen = set()
+            for keyword in keywords:
+                if keyword in completed:
+                    skipped += 1
+                    continue
+                if keyword in seen:
+                    duplicates += 1
+                    continue
+                if quota_error is None and pool is not None:
+                    try:
+                        pool.ensure_available()
+                    except QuotaExceeded as e:
+                        quota_error = str(e)
+                    except RateLimited as e:
+                        # 초당 한도 초과는 잠시 쉬었다가 계속 제출한다.
+                        time.sleep(e.retry_after)
+                    except AuthenticationFailed:
+                        # 인증 실패는 행마다 "오류"로 기록된다.
+                        pass
+                if quota_error is not None:
+                    # 예산이 없으면 남은 입력은 읽지 않고 다음 실행으로 미룬다.
+                    break
+                seen.add(keyword)
+                pending.add(executor.submit(analyze_keyword_row, keyword, credentials))
+                if len(pending) >= max_in_flight:
+                    pending = _drain(pending, FIRST_COMPLETED)
+            while pending:
+                pending = _drain(pending, FIRST_COMPLETED)
+    finally:
+        writer.close()
+        checkpoint.close()
+
+    return {
+        "done": done,
+        "failed": failed,
+        "skipped": skipped,
+        "duplicates": duplicates,
+        "deferred": deferred,
+        "quota_error": quota_error,
+    }
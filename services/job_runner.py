@@ -0,0 +1,258 @@
+"""백그라운드 작업 실행기.
+
+Playwright 차트 스크래핑처럼 1~2분 걸리는 작업을 Streamlit 스크립트 스레드 밖의
+워커 스레드에서 실행한다. 작업마다 ID를 발급하고 상태/진행 로그/결과를
+JOB_STATE_DIR에 JSON으로 저장하므로, 사용자가 페이지를 벗어났다가 돌아와도
+작업 ID로 진행 상황과 결과를 다시 조회할 수 있다.
+
+대기열은 소유자(owner)별로 나뉘어 있고 워커는 소유자를 돌아가며 하나씩 꺼내므로,
+한 사용자가 작업을 여러 개 넣어도 다른 사용자의 작업이 뒤로 밀리지 않는다.
+
+작업 인자(비밀번호 등)는 메모리에만 두고 디스크에는 저장하지 않는다.
+실패한 작업은 오류 메시지와 함께 traceback을 레코드에 남기고, 예외에 screenshot_path
+속성이 있으면 그 파일 경로도 남긴다. (해당 작업의 레코드로만 조회된다)
+끝난 작업은 FINISHED_MEMORY_TTL이 지나거나 MAX_FINISHED_IN_MEMORY개를 넘으면
+메모리에서 내리고, 레코드 파일은 JOB_RETENTION_SECONDS가 지나면 삭제한다.
+"""
+import json
+import os
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict, deque
+
+from config.settings import SCRAPE_JOB_WORKERS, JOB_STATE_DIR
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# 작업 레코드에 보관할 최대 진행 로그 줄 수
+MAX_LOG_LINES = 200
+# 끝난 작업 레코드 보관 기간 (초) — 이보다 오래된 레코드 파일은 삭제
+JOB_RETENTION_SECONDS = 7 * 24 * 3600
+# 끝난 작업을 메모리에 두는 기간 (초)과 최대 개수. 넘으면 메모리에서만 내리고
+# 조회 시 파일에서 다시 읽는다.
+FINISHED_MEMORY_TTL = 3600
+MAX_FINISHED_IN_MEMORY = 50
+# 보관 기간이 지난 레코드 파일을 정리하는 주기 (초)
+DISK_PRUNE_INTERVAL = 3600
+
+
+class JobRunner:
+    """소유자별 라운드로빈 대기열을 가진 워커 스레드 풀."""
+
+    def __init__(self, max_workers=SCRAPE_JOB_WORKERS, state_dir=JOB_STATE_DIR):
+        self.state_dir = state_dir
+        os.makedirs(state_dir, exist_ok=True)
+        self._jobs = {}
+        self._queues = OrderedDict()  # owner -> deque[(job_id, func, kwargs)]
+        self._cond = threading.Condition()
+        self._last_disk_prune = 0.0
+        self._recover()
+
+        for i in range(max_workers):
+            thread = threading.Thread(
+                target=self._worker, name="job-worker-{}".format(i), daemon=True
+            )
+            thread.start()
+
+    # ── 저장 ──
+
+    def _path(self, job_id):
+        return os.path.join(self.state_dir, "{}.json".format(job_id))
+
+    def _persist(self, job):
+        tmp_path = self._path(job["id"]) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(job, f, ensure_ascii=False)
+        os.replace(tmp_path, self._path(job["id"]))
+
+    def _prune_disk(self):
+        """보관 기간이 지난 레코드 파일을 삭제하고 남은 레코드를 반환한다."""
+        expire_before = time.time() - JOB_RETENTION_SECONDS
+        self._last_disk_prune = time.time()
+        jobs = []
+        for name in os.listdir(self.state_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.state_dir, name)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    job = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if job.get("status") in (DONE, FAILED) and (
+                (job.get("finished_at") or job.get("created_at") or 0) < expire_before
+            ):
+                screenshot = job.get("error_screenshot")
+                if screenshot and os.path.exists(screenshot):
+                    os.remove(screenshot)
+                os.remove(path)
+                self._jobs.pop(job.get("id"), None)
+                continue
+            jobs.append(job)
+        return jobs
+
+    def _recover(self):
+        """이전 프로세스에서 끝나지 않은 작업은 실패로 표시한다. (인자가 없어 재개 불가)
+
+        보관 기간이 지난 작업 레코드는 삭제한다.
+        """
+        for job in self._prune_disk():
+            if job.get("status") in (QUEUED, RUNNING):
+                job["status"] = FAILED
+                job["error"] = "서버 재시작으로 작업이 중단되었습니다."
+                job["finished_at"] = time.time()
+                self._persist(job)
+            self._jobs[job["id"]] = job
+        self._evict()
+
+    def _evict(self):
+        """끝난 작업 중 오래되었거나 개수 한도를 넘은 것을 메모리에서 내린다.
+
+        (self._cond 보유 상태 또는 초기화 중에 호출)
+        """
+        now = time.time()
+        finished = sorted(
+            (job for job in self._jobs.values() if job["status"] in (DONE, FAILED)),
+            key=lambda job: job.get("finished_at") or 0,
+            reverse=True,
+        )
+        for i, job in enumerate(finished):
+            if i >= MAX_FINISHED_IN_MEMORY or (job.get("finished_at") or 0) < now - FINISHED_MEMORY_TTL:
+                del self._jobs[job["id"]]
+        if now - self._last_disk_prune >= DISK_PRUNE_INTERVAL:
+            self._prune_disk()
+
+    # ── 공개 API ──
+
+    def submit(self, owner, func, kwargs, params=None):
+        """작업을 대기열에 넣고 작업 ID를 반환한다.
+
+        Args:
+            owner: 공정 분배 단위 (예: 네이버 로그인 ID)
+            func: func(**kwargs, progress_callback=...) 형태로 호출된다.
+            kwargs: func 인자 (메모리에만 보관)
+            params: 작업 레코드에 함께 저장할 표시용 정보 (비밀 정보 제외)
+        """
+        job_id = uuid.uuid4().hex
+        job = {
+            "id": job_id,
+            "owner": owner,
+            "params": params or {},
+            "status": QUEUED,
+            "steps": 0,
+            "log": [],
+            "result": None,
+            "error": None,
+            "traceback": None,
+            "error_screenshot": None,
+            "created_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+        }
+        with self._cond:
+            self._evict()
+            self._jobs[job_id] = job
+            self._persist(job)
+            self._queues.setdefault(owner, deque()).append((job_id, func, kwargs))
+            self._cond.notify()
+        return job_id
+
+    def get(self, job_id):
+        """작업 레코드의 사본을 반환한다. 없으면 None.
+
+        메모리에서 내린 끝난 작업은 파일에서 읽어 돌려주며 다시 보관하지 않는다.
+        """
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None:
+                path = self._path(job_id)
+                if not os.path.exists(path):
+                    return None
+                with open(path, encoding="utf-8") as f:
+                    return json.load(f)
+            return json.loads(json.dumps(job))
+
+    def queue_position(self, job_id):
+        """대기 중인 작업이 몇 번째로 실행될지 반환한다 (1부터). 대기 중이 아니면 0."""
+        with self._cond:
+            order = self._dispatch_order()
+            return order.index(job_id) + 1 if job_id in order else 0
+
+    # ── 내부 ──
+
+    def _dispatch_order(self):
+        """현재 대기열이 라운드로빈으로 꺼내질 순서를 계산한다."""
+        queues = [list(q) for q in self._queues.values()]
+        order = []
+        depth = 0
+        while any(depth < len(q) for q in queues):
+            for q in queues:
+                if depth < len(q):
+                    order.append(q[depth][0])
+            depth += 1
+        return order
+
+    def _next(self):
+        """다음 소유자의 대기열에서 작업 하나를 꺼낸다. (self._cond 보유 상태에서 호출)"""
+        while not self._queues:
+            self._cond.wait()
+        owner, queue = next(iter(self._queues.items()))
+        item = queue.popleft()
+        # 꺼낸 소유자는 맨 뒤로 보내 다음 차례를 다른 소유자에게 넘긴다.
+        del self._queues[owner]
+        if queue:
+            self._queues[owner] = queue
+        return item
+
+    def _update(self, job_id, **fields):
+        with self._cond:
+            job = self._jobs[job_id]
+            job.update(fields)
+            self._persist(job)
+            if job["status"] in (DONE, FAILED):
+                self._evict()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                job_id, func, kwargs = self._next()
+
+            self._update(job_id, status=RUNNING, started_at=time.time())
+
+            def on_progress(msg, job_id=job_id):
+                with self._cond:
+                    job = self._jobs[job_id]
+                    job["steps"] += 1
+                    job["log"] = (job["log"] + [msg])[-MAX_LOG_LINES:]
+                    self._persist(job)
+
+            try:
+                result = func(progress_callback=on_progress, **kwargs)
+                self._update(job_id, status=DONE, result=result, finished_at=time.time())
+            except Exception as e:
+                self._update(
+                    job_id,
+                    status=FAILED,
+                    error=str(e),
+                    traceback=traceback.format_exc(),
+                    error_screenshot=getattr(e, "screenshot_path", None),
+                    finished_at=time.time(),
+                )
+
+
+_runner = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner():
+    """프로세스 공용 JobRunner를 반환한다. (Streamlit 세션 간 공유)"""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = JobRunner()
+        return _runner
@@ -1,43 +1,164 @@
-import pandas as pd
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 from api.naver_autocomplete import fetch_autocomplete_suggestions
-from api.naver_searchad import fetch_related_keywords
+from api.naver_searchad import fetch_keywordstool
+from config.settings import ANALYSIS_CACHE_TTL, ANALYSIS_CACHE_MAX_ENTRIES
+from utils.auth import credentials_fingerprint
+from utils import metrics
+from utils.credential_pool import pool_from_credentials
+from utils.response_cache import bypass as bypass_response_cache
+from utils.ttl_cache import TTLCache
 
+# Streamlit 재실행마다 같은 키워드를 다시 조회하지 않도록 결과를 보관한다.
+_analysis_cache = TTLCache(ANALYSIS_CACHE_MAX_ENTRIES, ANALYSIS_CACHE_TTL)
 
-def analyze_keyword(keyword, credentials):
+# 분석 소스 정의
+# - result_key: 결과 dict에 저장할 키
+# - fetch: fetch(keyword, *인증값) → 결과
+# - credential_service: 인증값을 가져올 키 풀 서비스 이름 (utils/credential_pool.py).
+#   None이면 인증 없이 호출하고, 설정된 키 세트가 없으면 건너뜀
+# - error_label: 실패 시 errors에 붙일 문구
+# - missing_message: 인증 정보가 없을 때 errors에 남길 안내 (None이면 생략)
+AnalysisSource = namedtuple(
+    "AnalysisSource",
+    ["result_key", "fetch", "credential_service", "error_label", "missing_message"],
+)
+
+# 서로 독립적인 소스는 모두 동시에 실행된다. 데이터랩 추이/인구통계 등
+# 새 소스도 여기에 한 줄 추가하면 같은 병렬 단계에서 실행된다.
+ANALYSIS_SOURCES = [
+    AnalysisSource(
+        result_key="autocomplete",
+        fetch=fetch_autocomplete_suggestions,
+        credential_service=None,
+        error_label="자동완성 조회 실패",
+        missing_message=None,
+    ),
+    AnalysisSource(
+        result_key="related_keywords",
+        fetch=fetch_keywordstool,
+        credential_service="searchad",
+        error_label="연관 키워드 조회 실패",
+        missing_message=(
+            "검색광고 API 키가 설정되지 않았습니다. "
+            "사이드바에서 API 키를 입력하면 연관 키워드와 검색량을 확인할 수 있습니다."
+        ),
+    ),
+]
+
+
+def analyze_keyword(keyword, credentials, sources=None, refresh=False):
     """메인 키워드에 대해 연관키워드, 자동완성을 분석한다.
 
+    각 소스는 스레드 풀에서 동시에 실행되므로 전체 지연은 소스별 지연의 합이 아니라
+    가장 느린 소스의 지연이 된다. 소스별 실패는 result["errors"]에
+    ANALYSIS_SOURCES 순서대로 모인다.
+
     인구통계(성별/연령대/월별 추이)는 별도의 스크래핑으로 처리된다.
+
+    related_keywords는 압축 형태의 KeywordToolResult이며,
+    표가 필요한 시점에 to_dataframe()으로 변환한다. search_volume은 같은 응답에서 읽은
+    메인 키워드의 현재 PC/모바일 검색량이다. (검색광고 호출 1회)
+
+    인증이 필요한 소스는 키 풀에서 키 세트를 받아 호출하므로, 추가 키 세트가
+    설정되어 있으면 호출이 여러 키로 나뉘고 401/429를 받은 키는 잠시 제외된다.
+
+    소스별 소요 시간과 그 안의 API 호출은 result["timings"]에
+    워터폴용 스팬 목록(utils/metrics.Trace.to_list())으로 남는다.
+
+    Args:
+        sources: 실행할 AnalysisSource 목록. None이면 ANALYSIS_SOURCES
+        refresh: True이면 디스크 응답 캐시(utils/response_cache.py)를 읽지 않고
+                 모든 소스를 새로 조회해 캐시를 갱신한다.
     """
+    if sources is None:
+        sources = ANALYSIS_SOURCES
+
     result = {
         "related_keywords": None,
+        "search_volume": None,
         "autocomplete": [],
         "errors": [],
+        "timings": [],
     }
 
-    # 1. 자동완성 (API 키 불필요)
-    try:
-        result["autocomplete"] = fetch_autocomplete_suggestions(keyword)
-    except Exception as e:
-        result["errors"].append("자동완성 조회 실패: {}".format(e))
-
-    # 2. 연관 키워드 + 검색량 (검색광고 API)
-    searchad_keys = (
-        credentials.get("searchad_api_key"),
-        credentials.get("searchad_secret_key"),
-        credentials.get("searchad_customer_id"),
-    )
-    if all(searchad_keys):
+    with bypass_response_cache(refresh), \
+            metrics.trace("analyze_keyword", keyword=keyword) as trace:
+        run_sources(keyword, credentials, sources, result)
+    if result["related_keywords"] is not None:
+        result["search_volume"] = result["related_keywords"].volume_of(keyword)
+    result["timings"] = trace.to_list()
+    return result
+
+
+def _run_source(source, keyword, pool):
+    """소스 하나를 "source:<result_key>" 스팬 안에서 실행한다."""
+    with metrics.span("source:" + source.result_key):
+        if pool is None:
+            return source.fetch(keyword)
+        return pool.call(source.fetch, keyword)
+
+
+def run_sources(keyword, credentials, sources, result, propagate=()):
+    """실행 가능한 소스를 동시에 실행해 result에 결과/오류를 채운다.
+
+    analyze_keyword()와 대량 분석(services/bulk_analyzer.py)이 함께 쓰는 단계다.
+
+    Args:
+        propagate: result["errors"]에 모으지 않고 그대로 다시 발생시킬 예외 타입
+                   (예: 대량 분석의 QuotaExceeded). 모든 소스가 끝난 뒤 발생한다.
+    """
+    runnable = []
+    for source in sources:
+        if source.credential_service is None:
+            runnable.append((source, None))
+            continue
+        pool = pool_from_credentials(credentials, source.credential_service)
+        if pool is not None:
+            runnable.append((source, pool))
+
+    futures = {}
+    if runnable:
+        with ThreadPoolExecutor(max_workers=len(runnable)) as executor:
+            for source, pool in runnable:
+                futures[source.result_key] = executor.submit(
+                    metrics.bind(_run_source), source, keyword, pool
+                )
+
+    for source in sources:
+        future = futures.get(source.result_key)
+        if future is None:
+            if source.missing_message:
+                result["errors"].append(source.missing_message)
+            continue
         try:
-            result["related_keywords"] = fetch_related_keywords(
-                keyword, *searchad_keys
-            )
+            result[source.result_key] = future.result()
+        except propagate:
+            raise
         except Exception as e:
-            result["errors"].append("연관 키워드 조회 실패: {}".format(e))
-    else:
-        result["errors"].append(
-            "검색광고 API 키가 설정되지 않았습니다. "
-            "사이드바에서 API 키를 입력하면 연관 키워드와 검색량을 확인할 수 있습니다."
-        )
+            result["errors"].append("{}: {}".format(source.error_label, e))
+
+
+def analyze_keyword_cached(keyword, credentials, refresh=False):
+    """analyze_keyword() 결과를 (키워드, 인증 정보) 기준으로 메모리에 재사용한다.
+
+    탭 전환/슬라이더 조작 등으로 Streamlit 스크립트가 다시 실행되어도
+    네트워크 호출 없이 같은 결과를 돌려준다. 오류가 있는 결과는 보관하지 않으므로
+    다음 실행에서 다시 조회한다.
 
+    Args:
+        refresh: True이면 메모리 캐시와 디스크 응답 캐시를 모두 무시하고 다시 조회한다.
+    """
+    key = (keyword, credentials_fingerprint(credentials))
+    if not refresh:
+        cached = _analysis_cache.get(key)
+        if cached is not None:
+            return cached
+
+    result = analyze_keyword(keyword, credentials, refresh=refresh)
+    if result["errors"]:
+        _analysis_cache.invalidate(key)
+    else:
+        _analysis_cache.set(key, result)
     return result
@@ -0,0 +1,56 @@
+"""테스트 공용 fixture.
+
+외부 API와 디스크 상태를 건드리지 않도록 호출 예산과 응답 캐시를
+메모리 전용 인스턴스로 바꾼다.
+"""
+import pytest
+
+from utils import response_cache
+from utils.quota import QuotaScheduler
+
+# 테스트용 한도 (표시 이름, 일일 한도, 초당 한도). 초당 한도는 대기가 생기지 않을 만큼 크게 둔다.
+TEST_LIMITS = {
+    "datalab": ("데이터랩", 20, 10000),
+    "searchad": ("검색광고", None, 10000),
+}
+
+
+class FakeResponse:
+    """http_client 응답 대역. decode_response()는 content만 읽는다."""
+
+    def __init__(self, status_code, content=b"{}"):
+        self.status_code = status_code
+        self.content = content
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError("HTTP {}".format(self.status_code))
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    """메모리 QuotaScheduler를 프로세스 공용 스케줄러 대신 쓰게 한다."""
+    import api.naver_datalab
+    import api.naver_searchad
+    import utils.credential_pool
+
+    instance = QuotaScheduler(":memory:", limits=TEST_LIMITS)
+    for module in (api.naver_datalab, api.naver_searchad, utils.credential_pool):
+        monkeypatch.setattr(module, "get_quota_scheduler", lambda: instance)
+    return instance
+
+
+@pytest.fixture
+def no_cache(monkeypatch):
+    """응답 캐시를 끈다. (cached_call이 매번 fetch를 호출)"""
+    monkeypatch.setattr(response_cache, "get_cache", lambda: None)
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """time.sleep 대신 대기 시간만 기록한다."""
+    import time
+
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    return sleeps
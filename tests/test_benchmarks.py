@@ -0,0 +1,26 @@
+"""benchmarks/run.py 스모크 테스트 (모의 서버 상대로 전체 벤치마크를 한 번씩 실행)."""
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_benchmark_run_smoke():
+    # main()은 config.settings를 새로 읽어야 하므로 별도 프로세스에서 실행한다.
+    proc = subprocess.run(
+        [sys.executable, "-c",
+         "import sys; from benchmarks.run import main; "
+         "sys.exit(main(['--iterations', '1', '--bulk-size', '2', '--latency', '0', '--json']))"],
+        cwd=ROOT, capture_output=True, text=True, timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr
+
+    output = json.loads(proc.stdout)
+    results = {r["name"]: r for r in output["results"]}
+    assert set(results) == {"analyze_keyword", "fetch_demographics", "fetch_demographics_by_device", "bulk"}
+    for name, result in results.items():
+        assert result["errors"] == 0, name
+        assert result["calls"], name
+    assert results["bulk"]["units"] == 2
@@ -0,0 +1,95 @@
+"""대량 분석의 체크포인트/재시도/중복 처리 검사."""
+import json
+
+import pytest
+
+from api.naver_searchad import KeywordToolResult
+from services import bulk_analyzer, keyword_analyzer
+from utils.errors import QuotaExceeded
+
+
+class _FakePool:
+    def __init__(self, fail=(), quota=()):
+        self.fail = set(fail)
+        self.quota = set(quota)
+
+    def ensure_available(self):
+        pass
+
+    def call(self, func, keyword):
+        if keyword in self.quota:
+            raise QuotaExceeded("searchad")
+        if keyword in self.fail:
+            raise RuntimeError("HTTP 500")
+        return KeywordToolResult([{
+            "relKeyword": keyword, "monthlyPcQcCnt": 10,
+            "monthlyMobileQcCnt": 20, "compIdx": "낮음",
+        }])
+
+
+@pytest.fixture
+def run(monkeypatch, tmp_path):
+    sources = [
+        source._replace(fetch=lambda kw: [kw + " 추천"])
+        if source.result_key == "autocomplete" else source
+        for source in keyword_analyzer.ANALYSIS_SOURCES
+    ]
+    monkeypatch.setattr(bulk_analyzer, "ANALYSIS_SOURCES", sources)
+
+    def _run(keywords, pool, fmt="jsonl"):
+        output = tmp_path / "out.{}".format(fmt)
+        for module in (bulk_analyzer, keyword_analyzer):
+            monkeypatch.setattr(module, "pool_from_credentials", lambda creds, service: pool)
+        summary = bulk_analyzer.run_bulk_analysis(
+            keywords, {}, str(output), fmt=fmt, max_workers=2
+        )
+        if fmt == "csv":
+            import csv
+
+            with open(output, encoding="utf-8-sig", newline="") as f:
+                rows = list(csv.DictReader(f))
+        else:
+            rows = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+        checkpoint = set((tmp_path / (output.name + ".ckpt")).read_text(encoding="utf-8").split())
+        return summary, rows, checkpoint
+
+    return _run
+
+
+def test_row_uses_shared_analysis_sources(run):
+    summary, rows, _ = run(["a"], _FakePool())
+
+    assert rows == [{
+        "키워드": "a", "PC검색량": 10, "모바일검색량": 20, "총검색량": 30,
+        "연관키워드수": 1, "연관키워드_상위": ["a"], "자동완성": ["a 추천"], "오류": [],
+    }]
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "csv"])
+def test_failed_rows_are_retried_and_replaced_on_resume(run, fmt):
+    summary, rows, checkpoint = run(["a", "bad", "a", "b"], _FakePool(fail={"bad"}), fmt)
+
+    assert (summary["done"], summary["failed"], summary["duplicates"]) == (3, 1, 1)
+    assert sorted(r["키워드"] for r in rows) == ["a", "b", "bad"]
+    assert checkpoint == {"a", "b"}
+
+    summary, rows, checkpoint = run(["a", "bad", "b"], _FakePool(), fmt)
+
+    assert (summary["done"], summary["failed"], summary["skipped"]) == (1, 0, 2)
+    assert sorted(r["키워드"] for r in rows) == ["a", "b", "bad"]
+    assert [r for r in rows if r["키워드"] == "bad"][0]["오류"] in ([], "")
+    assert checkpoint == {"a", "b", "bad"}
+
+
+def test_quota_exceeded_defers_without_row(run):
+    summary, rows, checkpoint = run(["a", "q"], _FakePool(quota={"q"}))
+
+    assert summary["deferred"] == 1
+    assert summary["quota_error"]
+    assert [r["키워드"] for r in rows] == ["a"]
+    assert checkpoint == {"a"}
+
+
+def test_rejects_non_positive_workers(tmp_path):
+    with pytest.raises(ValueError):
+        bulk_analyzer.run_bulk_analysis(["a"], {}, str(tmp_path / "out.jsonl"), max_workers=0)
@@ -0,0 +1,95 @@
+"""키워드 도구 모달 차트 데이터 추출 검사."""
+import pytest
+
+from api.chart_extract import (
+    extract_from_dom_charts,
+    extract_from_payloads,
+    normalize_age_label,
+)
+
+
+@pytest.mark.parametrize("label, expected", [
+    ("13-19세", "13~19"),
+    ("0 ~ 12", "0~12"),
+    ("50세 이상", "50~"),
+    ("60+", "60~"),
+    ("20대", "20대"),
+    ("남성", None),
+    (30, None),
+])
+def test_normalize_age_label(label, expected):
+    assert normalize_age_label(label) == expected
+
+
+def test_extract_from_payloads_finds_all_sections():
+    payload = {
+        "result": {
+            "gender": [
+                {"name": "m", "value": 30},
+                {"name": "f", "value": "90"},
+            ],
+            "age": {"0~12": 1, "13~19": 1, "20~24": 2},
+            "trend": [
+                {"period": "2025-01", "pcCnt": "1,500", "mobileCnt": "< 10"},
+                {"period": "2025-02", "pcCnt": 2000, "mobileCnt": 12000},
+            ],
+        }
+    }
+
+    found = extract_from_payloads([{"unrelated": "x"}, payload])
+
+    assert found["gender"] == {"남성": 25.0, "여성": 75.0}
+    assert found["age"] == {"0~12": 25.0, "13~19": 25.0, "20~24": 50.0}
+    assert found["monthly"] == [
+        {"period": "2025-01", "pc": 1500, "mobile": 5},
+        {"period": "2025-02", "pc": 2000, "mobile": 12000},
+    ]
+
+
+def test_extract_from_payloads_ignores_non_chart_data():
+    found = extract_from_payloads([
+        {"items": [{"name": "키워드", "value": 3}], "count": 10},
+        {"rows": [{"period": "2025-01", "pc": 1}]},
+    ])
+
+    assert found == {}
+
+
+def test_extract_from_dom_charts():
+    charts = [
+        {
+            "title": "월별 검색량",
+            "categories": ["2025-01", "2025-02"],
+            "series": [
+                {"name": "PC", "points": [{"name": "", "y": 100}, {"name": "", "y": 200}]},
+                {"name": "모바일", "points": [{"name": "", "y": 300}, {"name": "", "y": 400}]},
+            ],
+        },
+        {
+            "title": "성별",
+            "categories": [],
+            "series": [
+                {"name": "비율", "points": [{"name": "남성", "y": 40}, {"name": "여성", "y": 60}]},
+            ],
+        },
+        {
+            "title": "연령",
+            "categories": [],
+            "series": [
+                {"name": "비율", "points": [
+                    {"name": "13-19세", "y": 10},
+                    {"name": "20-24세", "y": 30},
+                    {"name": "50세 이상", "y": 60},
+                ]},
+            ],
+        },
+    ]
+
+    found = extract_from_dom_charts(charts)
+
+    assert found["monthly"] == [
+        {"period": "2025-01", "pc": 100, "mobile": 300},
+        {"period": "2025-02", "pc": 200, "mobile": 400},
+    ]
+    assert found["gender"] == {"남성": 40.0, "여성": 60.0}
+    assert found["age"] == {"13~19": 10.0, "20~24": 30.0, "50~": 60.0}
@@ -0,0 +1,45 @@
+"""스크롤 캡처 이어 붙이기의 겹침 계산 검사."""
+import numpy as np
+import pytest
+
+from api.naver_searchad_scraper import _expected_overlap, _find_row_overlap
+
+
+def _rows(count, seed):
+    return np.random.default_rng(seed).integers(0, 255, size=(count, 4, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("part_height, delta, client_height, expected", [
+    (600, 300, 300, 0),
+    (600, 100, 300, 400),
+    (600, 0, 300, 600),
+    (600, 500, 300, 0),
+    (600, 100, 0, 0),
+])
+def test_expected_overlap_scales_scroll_delta(part_height, delta, client_height, expected):
+    assert _expected_overlap(part_height, delta, client_height) == expected
+
+
+def test_find_row_overlap_confirms_expected():
+    upper = _rows(10, 1)
+    lower = np.concatenate([upper[-3:], _rows(7, 2)])
+
+    assert _find_row_overlap(upper, lower, 3) == 3
+    # 반올림 오차는 tolerance 안에서 바로잡는다.
+    assert _find_row_overlap(upper, lower, 4) == 3
+    assert _find_row_overlap(upper, lower, 2) == 3
+
+
+def test_find_row_overlap_does_not_trim_repeated_blank_rows():
+    blank = np.full((6, 4, 3), 255, dtype=np.uint8)
+    upper = np.concatenate([_rows(4, 3), blank])
+    lower = np.concatenate([blank, _rows(4, 4)])
+
+    # 빈 행이 6줄 겹쳐 보여도 스크롤 이동량이 말하는 겹침(2행)만 잘라낸다.
+    assert _find_row_overlap(upper, lower, 2) == 2
+
+
+def test_find_row_overlap_falls_back_to_expected():
+    assert _find_row_overlap(_rows(10, 5), _rows(10, 6), 3) == 3
+    assert _find_row_overlap(_rows(10, 5), _rows(10, 6), 0) == 0
+    assert _find_row_overlap(_rows(10, 5), np.zeros((10, 5, 3), dtype=np.uint8), 3) == 3
@@ -0,0 +1,111 @@
+"""CredentialPool 키 순환/쿨다운 검사."""
+import pytest
+
+from utils.credential_pool import CredentialPool, extra_key_sets_from_env, pool_from_credentials
+from utils.errors import AuthenticationFailed, QuotaExceeded, RateLimited
+
+KEY_SETS = [("id-a", "secret-a"), ("id-b", "secret-b")]
+
+
+def _pool(**kwargs):
+    return CredentialPool("datalab", KEY_SETS, **kwargs)
+
+
+def test_rotates_between_keys(scheduler):
+    pool = _pool()
+    used = [pool.call(lambda x, cid, secret: (x, cid), 1) for _ in range(4)]
+
+    assert used == [(1, "id-a"), (1, "id-b"), (1, "id-a"), (1, "id-b")]
+
+
+def test_rate_limited_key_cools_down_and_call_retries_other_key(scheduler):
+    pool = _pool(cooldown=60)
+    calls = []
+
+    def func(cid, secret):
+        calls.append(cid)
+        if cid == "id-a":
+            raise RateLimited("datalab")
+        return cid
+
+    assert pool.call(func) == "id-b"
+    assert pool.call(func) == "id-b"
+    assert calls == ["id-a", "id-b", "id-b"]
+    stats = {s["key"]: s for s in pool.stats()}
+    assert stats["id-a"]["cooldown_sec"] > 0
+    assert stats["id-a"]["errors"] == 1
+
+
+def test_all_keys_rate_limited_raises_rate_limited(scheduler):
+    pool = _pool(cooldown=60)
+
+    def func(cid, secret):
+        raise RateLimited("datalab")
+
+    with pytest.raises(RateLimited):
+        pool.call(func)
+    with pytest.raises(RateLimited) as info:
+        pool.ensure_available()
+    assert 0 < info.value.retry_after <= 60
+
+
+def test_all_keys_failing_auth_raises_authentication_failed(scheduler):
+    pool = _pool()
+
+    def func(cid, secret):
+        raise AuthenticationFailed("401")
+
+    with pytest.raises(AuthenticationFailed):
+        pool.call(func)
+    with pytest.raises(AuthenticationFailed):
+        pool.ensure_available()
+
+
+def test_exhausted_budget_excludes_key(scheduler):
+    pool = _pool()
+    scheduler.mark_exhausted("datalab", "id-a")
+
+    assert [pool.call(lambda cid, secret: cid) for _ in range(2)] == ["id-b", "id-b"]
+
+    scheduler.mark_exhausted("datalab", "id-b")
+    with pytest.raises(QuotaExceeded):
+        pool.ensure_available()
+    with pytest.raises(QuotaExceeded):
+        pool.call(lambda cid, secret: cid)
+
+
+def test_other_errors_propagate_without_retry(scheduler):
+    pool = _pool()
+    calls = []
+
+    def func(cid, secret):
+        calls.append(cid)
+        raise ValueError("bad response")
+
+    with pytest.raises(ValueError):
+        pool.call(func)
+    assert calls == ["id-a"]
+    pool.ensure_available()
+
+
+def test_pool_from_credentials_merges_extra_sets(scheduler):
+    credentials = {
+        "datalab_client_id": "id-a",
+        "datalab_client_secret": "secret-a",
+        "datalab_extra_keys": [("id-a", "secret-a"), ("id-b", "secret-b"), ("id-c", "")],
+    }
+
+    pool = pool_from_credentials(credentials, "datalab")
+
+    assert len(pool) == 2
+    assert pool_from_credentials({}, "datalab") is None
+
+
+def test_extra_key_sets_from_env_skips_incomplete_sets():
+    environ = {
+        "DATALAB_CLIENT_ID_2": "id-2",
+        "DATALAB_CLIENT_SECRET_2": "secret-2",
+        "DATALAB_CLIENT_ID_3": "id-3",
+    }
+
+    assert extra_key_sets_from_env("datalab", environ) == [("id-2", "secret-2")]
@@ -0,0 +1,70 @@
+"""공용 HTTP 전송 계층(호스트별 커넥션 풀, 연결/응답 타임아웃 분리) 검사."""
+import time
+
+import pytest
+import requests
+
+from api import http_client
+from benchmarks.mock_servers import MockNaverServer
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(http_client, "_use_http2", lambda: False)
+    http_client.close_all()
+    with MockNaverServer() as mock:
+        yield mock
+    http_client.close_all()
+
+
+def test_one_pooled_session_per_host(server):
+    url = server.base_url + "/nx/ac"
+    other_host = url.replace("127.0.0.1", "localhost")
+
+    assert http_client.get_client(url) is http_client.get_client(url + "?q=a")
+    assert http_client.get_client(url) is not http_client.get_client(other_host)
+
+
+def test_sequential_requests_reuse_one_connection(server):
+    url = server.base_url + "/nx/ac"
+
+    for q in ("a", "b", "c", "d"):
+        resp = http_client.get(url, params={"q": q})
+        assert resp.status_code == 200
+        assert resp.json()["query"] == [q]
+
+    pools = http_client.get_client(url).get_adapter(url).poolmanager.pools
+    assert [pools[key].num_connections for key in pools.keys()] == [1]
+    assert server.counts()["autocomplete"] == {200: 4}
+
+
+def test_timeout_is_split_into_connect_and_read(monkeypatch):
+    seen = []
+
+    class _Client:
+        def request(self, method, url, **kwargs):
+            seen.append(kwargs["timeout"])
+            resp = requests.Response()
+            resp.status_code = 200
+            resp._content = b"{}"
+            return resp
+
+    monkeypatch.setattr(http_client, "_use_http2", lambda: False)
+    monkeypatch.setattr(http_client, "get_client", lambda url: _Client())
+    monkeypatch.setattr(http_client, "HTTP_CONNECT_TIMEOUT", 1.5)
+    monkeypatch.setattr(http_client, "HTTP_READ_TIMEOUT", 7)
+
+    http_client.get("http://example.invalid/")
+    http_client.get("http://example.invalid/", timeout=3)
+
+    assert seen == [(1.5, 7), (3, 3)]
+
+
+def test_read_timeout_applies_to_slow_response(server, monkeypatch):
+    server.latency = 0.5
+    monkeypatch.setattr(http_client, "HTTP_READ_TIMEOUT", 0.1)
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        http_client.get(server.base_url + "/nx/ac", params={"q": "a"})
+    # 끊긴 연결에 응답을 쓰려다 나는 서버 쪽 오류가 다른 테스트 출력에 섞이지 않도록 기다린다.
+    time.sleep(server.latency)
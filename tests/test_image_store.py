@@ -0,0 +1,96 @@
+"""utils/image_store.py 테스트: 내용 주소 중복 제거, PNG 대체 저장, mtime LRU 정리."""
+import os
+from io import BytesIO
+
+import pytest
+
+from utils import image_store
+from utils.image_store import ImageStore
+
+
+@pytest.fixture
+def encode_calls(monkeypatch):
+    """PIL 없이 동작하도록 인코더를 대체한다. 원본 바이트를 그대로 '인코딩'한다."""
+    calls = []
+
+    def fake_encode(raw, fmt, quality):
+        calls.append((raw, fmt))
+        return fmt, raw
+
+    monkeypatch.setattr(image_store, "_encode", fake_encode)
+    return calls
+
+
+def _set_mtime(store, key, mtime):
+    os.utime(store.path(key), (mtime, mtime))
+
+
+def test_same_content_stored_once(tmp_path, encode_calls):
+    store = ImageStore(root=str(tmp_path), max_bytes=1000, fmt="webp")
+    key = store.put(b"chart-a")
+    assert store.put(b"chart-a") == key
+    assert len(encode_calls) == 1
+    assert store.get(key) == b"chart-a"
+    assert store.path(key).endswith(".webp")
+    assert store.stats()["count"] == 1
+
+    other = store.put(b"chart-b")
+    assert other != key
+    assert store.stats() == {"count": 2, "bytes": 14, "max_bytes": 1000}
+
+
+def test_png_fallback_found_by_key(tmp_path, monkeypatch):
+    # WebP 인코더가 없어 PNG로 저장된 경우에도 같은 키로 찾는다.
+    monkeypatch.setattr(image_store, "_encode", lambda raw, fmt, quality: ("png", raw))
+    store = ImageStore(root=str(tmp_path), max_bytes=1000, fmt="webp")
+    key = store.put(b"chart")
+    assert store.path(key).endswith(".png")
+    assert store.get(key) == b"chart"
+
+
+def test_evicts_least_recently_used_over_quota(tmp_path, encode_calls):
+    store = ImageStore(root=str(tmp_path), max_bytes=25, fmt="png")
+    a = store.put(b"a" * 10)
+    b = store.put(b"b" * 10)
+    _set_mtime(store, a, 1000)
+    _set_mtime(store, b, 2000)
+
+    # a를 다시 사용하면 b가 가장 오래된 파일이 된다.
+    assert store.get(a) == b"a" * 10
+    c = store.put(b"c" * 10)
+
+    assert store.get(b) is None
+    assert store.get(a) == b"a" * 10
+    assert store.get(c) == b"c" * 10
+    assert store.stats()["bytes"] == 20
+
+
+def test_duplicate_put_refreshes_lru(tmp_path, encode_calls):
+    store = ImageStore(root=str(tmp_path), max_bytes=25, fmt="png")
+    a = store.put(b"a" * 10)
+    b = store.put(b"b" * 10)
+    _set_mtime(store, a, 1000)
+    _set_mtime(store, b, 2000)
+
+    store.put(b"a" * 10)
+    store.put(b"c" * 10)
+    assert store.path(a) is not None
+    assert store.path(b) is None
+
+
+def test_new_item_kept_even_if_larger_than_quota(tmp_path, encode_calls):
+    store = ImageStore(root=str(tmp_path), max_bytes=5, fmt="png")
+    key = store.put(b"x" * 10)
+    assert store.get(key) == b"x" * 10
+
+
+def test_encode_falls_back_to_png_without_webp(monkeypatch):
+    Image = pytest.importorskip("PIL.Image")
+    from PIL import features
+
+    monkeypatch.setattr(features, "check", lambda name: False)
+    buf = BytesIO()
+    Image.new("P", (4, 4)).save(buf, format="PNG")
+    fmt, encoded = image_store._encode(buf.getvalue(), "webp", 80)
+    assert fmt == "png"
+    assert Image.open(BytesIO(encoded)).format == "PNG"
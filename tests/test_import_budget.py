@@ -0,0 +1,32 @@
+"""utils/import_budget.py 테스트: 지연 로딩 검사에서 외부 패키지가 불러온 모듈 제외."""
+from utils.import_budget import imported_by, lazy_violations, total_us
+
+
+def _row(module, depth, cumulative_us=10):
+    return {"module": module, "self_us": 1, "cumulative_us": cumulative_us, "depth": depth}
+
+
+# -X importtime 출력 순서: 하위 import가 부모보다 먼저 나온다.
+ROWS = [
+    _row("numpy", 2),
+    _row("pandas", 1),
+    _row("streamlit", 0, 500),
+    _row("config.settings", 1),
+    _row("plotly", 1),
+    _row("ui.sidebar", 0, 200),
+]
+
+
+def test_imported_by_collects_subtree():
+    assert imported_by(ROWS, ["streamlit"]) == {"numpy", "pandas", "streamlit"}
+    assert imported_by(ROWS, ["ui.sidebar"]) == {"config.settings", "plotly", "ui.sidebar"}
+
+
+def test_lazy_check_ignores_modules_loaded_by_streamlit():
+    assert lazy_violations(ROWS) == ["plotly"]
+    assert lazy_violations(ROWS[:3]) == []
+    assert lazy_violations(ROWS, external_roots=[]) == ["pandas", "numpy", "plotly"]
+
+
+def test_total_counts_top_level_imports_only():
+    assert total_us(ROWS) == 700
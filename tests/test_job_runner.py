@@ -0,0 +1,117 @@
+"""services/job_runner.py 테스트: 라운드로빈 순서, 재시작 복구, 메모리 정리, 실패 기록."""
+import json
+import os
+import time
+
+from services import job_runner
+from services.job_runner import DONE, FAILED, QUEUED, RUNNING, JobRunner
+
+
+def _noop(progress_callback=None):
+    return None
+
+
+def _wait_finished(runner, job_id, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = runner.get(job_id)
+        if job["status"] in (DONE, FAILED):
+            return job
+        time.sleep(0.01)
+    raise AssertionError("작업이 끝나지 않았습니다: {}".format(job_id))
+
+
+def test_dispatch_round_robins_between_owners(tmp_path):
+    # 워커 없이 만들어 대기열만 확인한다.
+    runner = JobRunner(max_workers=0, state_dir=str(tmp_path))
+    a1 = runner.submit("a", _noop, {})
+    a2 = runner.submit("a", _noop, {})
+    a3 = runner.submit("a", _noop, {})
+    b1 = runner.submit("b", _noop, {})
+
+    assert runner._dispatch_order() == [a1, b1, a2, a3]
+    assert runner.queue_position(b1) == 2
+    assert runner.queue_position(a3) == 4
+
+    with runner._cond:
+        taken = [runner._next()[0] for _ in range(4)]
+    assert taken == [a1, b1, a2, a3]
+    assert runner.queue_position(a1) == 0
+
+
+def test_unfinished_jobs_fail_on_restart(tmp_path):
+    runner = JobRunner(max_workers=0, state_dir=str(tmp_path))
+    queued = runner.submit("a", _noop, {}, params={"keywords": ["x"]})
+    with runner._cond:
+        running = runner._next()[0]
+    runner._update(running, status=RUNNING)
+    assert running == queued
+
+    restarted = JobRunner(max_workers=0, state_dir=str(tmp_path))
+    job = restarted.get(queued)
+    assert job["status"] == FAILED
+    assert job["params"] == {"keywords": ["x"]}
+    assert job["error"]
+    # 복구된 작업은 다시 대기열에 들어가지 않는다.
+    assert restarted._dispatch_order() == []
+
+
+def test_finished_jobs_evicted_from_memory_but_readable(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_runner, "MAX_FINISHED_IN_MEMORY", 1)
+    runner = JobRunner(max_workers=1, state_dir=str(tmp_path))
+    first = runner.submit("a", _noop, {})
+    _wait_finished(runner, first)
+    second = runner.submit("a", _noop, {})
+    _wait_finished(runner, second)
+
+    assert first not in runner._jobs
+    assert second in runner._jobs
+    assert runner.get(first)["status"] == DONE
+
+
+def test_expired_records_pruned_with_screenshot(tmp_path, monkeypatch):
+    screenshot = tmp_path / "error_old.png"
+    screenshot.write_bytes(b"png")
+    old = {
+        "id": "old", "owner": "a", "params": {}, "status": FAILED, "steps": 0,
+        "log": [], "result": None, "error": "x", "traceback": None,
+        "error_screenshot": str(screenshot), "created_at": 0, "started_at": 0,
+        "finished_at": 1,
+    }
+    state_dir = tmp_path / "jobs"
+    state_dir.mkdir()
+    (state_dir / "old.json").write_text(json.dumps(old), encoding="utf-8")
+
+    runner = JobRunner(max_workers=0, state_dir=str(state_dir))
+    assert runner.get("old") is None
+    assert not screenshot.exists()
+
+
+def test_failure_records_traceback_and_own_screenshot(tmp_path):
+    def fail(path, progress_callback=None):
+        progress_callback("시작")
+        e = RuntimeError("차트 없음")
+        e.screenshot_path = path
+        raise e
+
+    runner = JobRunner(max_workers=2, state_dir=str(tmp_path))
+    job_a = runner.submit("a", fail, {"path": "error_a.png"})
+    job_b = runner.submit("b", fail, {"path": "error_b.png"})
+
+    a = _wait_finished(runner, job_a)
+    b = _wait_finished(runner, job_b)
+    assert a["status"] == FAILED
+    assert a["error"] == "차트 없음"
+    assert "RuntimeError" in a["traceback"]
+    assert a["log"] and a["log"][0].endswith("시작")
+    assert a["error_screenshot"] == "error_a.png"
+    assert b["error_screenshot"] == "error_b.png"
+    # 디스크 레코드에도 남는다.
+    with open(os.path.join(str(tmp_path), job_a + ".json"), encoding="utf-8") as f:
+        assert json.load(f)["error_screenshot"] == "error_a.png"
+
+
+def test_queued_status_before_worker_runs(tmp_path):
+    runner = JobRunner(max_workers=0, state_dir=str(tmp_path))
+    job_id = runner.submit("a", _noop, {})
+    assert runner.get(job_id)["status"] == QUEUED
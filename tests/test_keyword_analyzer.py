@@ -0,0 +1,163 @@
+"""analyze_keyword() 소스 실행/결과 재사용 검사."""
+import threading
+
+import pytest
+
+from api import naver_searchad
+from services import keyword_analyzer
+from tests.conftest import FakeResponse
+from utils import response_cache
+from utils.response_cache import ResponseCache
+
+SEARCHAD_CREDENTIALS = {
+    "searchad_api_key": "key",
+    "searchad_secret_key": "secret",
+    "searchad_customer_id": "customer",
+}
+
+
+@pytest.fixture
+def keywordstool(monkeypatch, scheduler):
+    """/keywordstool 호출 대역. 호출된 힌트 목록을 기록한다."""
+    calls = []
+
+    def request(hints, api_key, secret_key, customer_id):
+        calls.append(list(hints))
+        return [
+            {"relKeyword": "캠핑", "monthlyPcQcCnt": 1500,
+             "monthlyMobileQcCnt": 12000, "compIdx": "높음"},
+            {"relKeyword": "캠핑 의자", "monthlyPcQcCnt": "< 10",
+             "monthlyMobileQcCnt": 300, "compIdx": "낮음"},
+        ]
+
+    monkeypatch.setattr(naver_searchad, "_request_keywordstool", request)
+    return calls
+
+
+def _searchad_source():
+    return [s for s in keyword_analyzer.ANALYSIS_SOURCES if s.result_key == "related_keywords"]
+
+
+def test_related_keywords_and_volume_share_one_request(keywordstool):
+    result = keyword_analyzer.analyze_keyword(
+        "캠핑", SEARCHAD_CREDENTIALS, sources=_searchad_source()
+    )
+
+    assert keywordstool == [["캠핑"]]
+    assert result["errors"] == []
+    assert result["search_volume"] == {"pc": 1500, "mobile": 12000}
+    assert result["related_keywords"].to_dataframe()["키워드"].tolist() == ["캠핑", "캠핑 의자"]
+
+
+def test_missing_searchad_keys_leave_volume_empty(keywordstool):
+    result = keyword_analyzer.analyze_keyword("캠핑", {}, sources=_searchad_source())
+
+    assert keywordstool == []
+    assert result["related_keywords"] is None
+    assert result["search_volume"] is None
+    assert len(result["errors"]) == 1
+
+
+KEYWORDSTOOL_BODY = (
+    '{"keywordList": [{"relKeyword": "캠핑", "monthlyPcQcCnt": 1500,'
+    ' "monthlyMobileQcCnt": 12000, "compIdx": "높음"}]}'
+).encode("utf-8")
+
+
+@pytest.fixture
+def searchad_http(monkeypatch, scheduler):
+    """메모리 응답 캐시 + HTTP 대역. 실제로 나간 요청 수를 센다."""
+    requests = []
+
+    def get(url, headers=None, params=None):
+        requests.append(params["hintKeywords"])
+        return FakeResponse(200, KEYWORDSTOOL_BODY)
+
+    cache = ResponseCache(":memory:")
+    monkeypatch.setattr(response_cache, "get_cache", lambda: cache)
+    monkeypatch.setattr(naver_searchad.http_client, "get", get)
+    monkeypatch.setattr(naver_searchad, "get_searchad_headers", lambda *args: {})
+    monkeypatch.setattr(keyword_analyzer, "ANALYSIS_SOURCES", _searchad_source())
+    keyword_analyzer._analysis_cache.clear()
+    yield requests
+    keyword_analyzer._analysis_cache.clear()
+
+
+def test_cached_analysis_is_keyed_by_keyword_and_credentials(searchad_http):
+    first = keyword_analyzer.analyze_keyword_cached("캠핑", SEARCHAD_CREDENTIALS)
+
+    assert keyword_analyzer.analyze_keyword_cached("캠핑", dict(SEARCHAD_CREDENTIALS)) is first
+    other = dict(SEARCHAD_CREDENTIALS, searchad_api_key="other-key")
+    assert keyword_analyzer.analyze_keyword_cached("캠핑", other) is not first
+    assert keyword_analyzer.analyze_keyword_cached("텐트", SEARCHAD_CREDENTIALS) is not first
+    # 다른 키/키워드의 재실행은 메모리 캐시를 거치지 않지만, 같은 요청은 응답 캐시가 받는다.
+    assert searchad_http == ["캠핑", "텐트"]
+
+
+def test_refresh_bypasses_memory_and_response_cache(searchad_http):
+    first = keyword_analyzer.analyze_keyword_cached("캠핑", SEARCHAD_CREDENTIALS)
+
+    refreshed = keyword_analyzer.analyze_keyword_cached(
+        "캠핑", SEARCHAD_CREDENTIALS, refresh=True
+    )
+
+    assert refreshed is not first
+    assert searchad_http == ["캠핑", "캠핑"]
+    assert keyword_analyzer.analyze_keyword_cached("캠핑", SEARCHAD_CREDENTIALS) is refreshed
+
+
+def test_results_with_errors_are_not_memoised(searchad_http, monkeypatch):
+    failing = [source._replace(fetch=_raise) for source in _searchad_source()]
+    monkeypatch.setattr(keyword_analyzer, "ANALYSIS_SOURCES", failing)
+
+    first = keyword_analyzer.analyze_keyword_cached("캠핑", SEARCHAD_CREDENTIALS)
+
+    assert first["errors"]
+    assert keyword_analyzer.analyze_keyword_cached("캠핑", SEARCHAD_CREDENTIALS) is not first
+
+
+def _raise(keyword, *credentials):
+    raise RuntimeError("HTTP 500")
+
+
+def _source(result_key, fetch, credential_service=None, missing_message=None):
+    return keyword_analyzer.AnalysisSource(
+        result_key=result_key,
+        fetch=fetch,
+        credential_service=credential_service,
+        error_label="{} 실패".format(result_key),
+        missing_message=missing_message,
+    )
+
+
+def test_sources_run_concurrently_and_failures_are_isolated():
+    # 두 소스가 동시에 실행되지 않으면 barrier가 시간 초과로 깨진다.
+    barrier = threading.Barrier(2, timeout=2)
+
+    def meet(keyword):
+        barrier.wait()
+        return [keyword]
+
+    sources = [
+        _source("first", meet),
+        _source("broken", _raise),
+        _source("second", meet),
+        _source("keyed", meet, credential_service="searchad", missing_message="키 없음"),
+    ]
+    result = {"errors": []}
+
+    keyword_analyzer.run_sources("k", {}, sources, result)
+
+    assert result["first"] == ["k"]
+    assert result["second"] == ["k"]
+    assert "broken" not in result
+    assert result["errors"] == ["broken 실패: HTTP 500", "키 없음"]
+
+
+def test_analyze_keyword_records_source_spans():
+    sources = [_source("autocomplete", lambda keyword: [keyword + " 추천"])]
+
+    result = keyword_analyzer.analyze_keyword("k", {}, sources=sources)
+
+    assert result["autocomplete"] == ["k 추천"]
+    assert "source:autocomplete" in [span["name"] for span in result["timings"]]
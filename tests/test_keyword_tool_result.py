@@ -0,0 +1,100 @@
+"""/keywordstool 응답 파싱(KeywordToolResult) 검사."""
+import io
+
+import pandas as pd
+
+from api.naver_searchad import KeywordToolResult, _parse_search_count, _parse_search_counts
+
+
+def _item(keyword, pc, mobile, comp="중간"):
+    return {
+        "relKeyword": keyword,
+        "monthlyPcQcCnt": pc,
+        "monthlyMobileQcCnt": mobile,
+        "compIdx": comp,
+    }
+
+
+def test_parse_search_counts_matches_scalar_version():
+    values = [1500, "1,500", "< 10", " 30 ", None, "abc", 12.0]
+
+    counts, under_ten = _parse_search_counts(values)
+
+    assert counts.dtype == "int32"
+    assert counts.tolist() == [1500, 1500, 5, 30, 0, 0, 12]
+    assert counts.tolist() == [_parse_search_count(v) for v in values]
+    assert under_ten.tolist() == [False, False, True, False, False, False, False]
+
+
+def test_volume_of_uses_normalized_exact_match():
+    result = KeywordToolResult([
+        _item("캠핑 의자", 100, 900),
+        _item("캠핑", "< 10", "2,000"),
+    ])
+
+    assert result.volume_of("캠핑의자") == {"pc": 100, "mobile": 900}
+    assert result.volume_of("캠핑") == {"pc": 5, "mobile": 2000}
+    assert result.volume_of("텐트") == {"pc": 0, "mobile": 0}
+
+
+def test_duplicates_keep_first_row_and_dedupe_drops_rest():
+    items = [_item("A", 1, 1), _item("a", 50, 50), _item("b", 10, 10)]
+
+    kept = KeywordToolResult(items)
+    deduped = KeywordToolResult(items, dedupe=True)
+
+    assert len(kept) == 3
+    assert kept.volume_of("a") == {"pc": 1, "mobile": 1}
+    assert deduped.keywords == ["A", "b"]
+    assert deduped.volume_of("b") == {"pc": 10, "mobile": 10}
+
+
+def test_top_keywords_orders_by_total_stably():
+    result = KeywordToolResult([
+        _item("x", 10, 10),
+        _item("y", 100, 0),
+        _item("z", 0, 20),
+    ])
+
+    assert result.top_keywords(2) == ["y", "x"]
+
+
+def test_to_dataframe_keeps_raw_counts_numeric():
+    result = KeywordToolResult([
+        _item("small", "< 10", 12345, "낮음"),
+        _item("big", 1500, "< 10", "높음"),
+    ])
+
+    df = result.to_dataframe()
+
+    assert df["키워드"].tolist() == ["small", "big"]
+    assert df["총검색량"].tolist() == [12350, 1505]
+    assert str(df["PC검색량_원본"].dtype) == "Int64"
+    assert df["PC검색량_원본"].isna().tolist() == [True, False]
+    assert df["PC검색량_원본"].tolist()[1] == 1500
+    assert df["모바일검색량_원본"].isna().tolist() == [False, True]
+    assert df["모바일검색량_원본"].tolist()[0] == 12345
+    assert df["PC검색량_10미만"].tolist() == [True, False]
+    assert df["모바일검색량_10미만"].tolist() == [False, True]
+
+
+def test_csv_export_is_numeric_and_lossless():
+    df = KeywordToolResult([
+        _item("small", "< 10", "12,345"),
+        _item("big", 1500, 20),
+    ]).to_dataframe()
+
+    exported = pd.read_csv(io.StringIO(df.to_csv(index=False)))
+
+    assert exported["PC검색량_원본"].isna().tolist() == [True, False]
+    assert exported["PC검색량_원본"].tolist()[1] == 1500
+    assert exported["모바일검색량_원본"].tolist() == [12345, 20]
+    assert exported["PC검색량_10미만"].tolist() == [True, False]
+
+
+def test_to_dataframe_empty():
+    df = KeywordToolResult([]).to_dataframe()
+
+    assert isinstance(df, pd.DataFrame)
+    assert df.empty
+    assert "PC검색량_원본" in df.columns
@@ -0,0 +1,73 @@
+"""utils/metrics.py 테스트: 누적 히스토그램, to_dict, 스레드 풀로의 문맥 전달."""
+from concurrent.futures import ThreadPoolExecutor
+
+from utils import metrics
+from utils.metrics import MetricsRegistry, Span
+
+
+def _span(duration, **attrs):
+    s = Span("call", attrs, None)
+    s.start, s.end = 0.0, duration
+    return s
+
+
+def _observed_registry():
+    registry = MetricsRegistry(buckets=(0.01, 0.1, 1.0))
+    registry.observe("keywordstool", _span(0.005, status=200, bytes=100))
+    registry.observe("keywordstool", _span(0.05, status=200, bytes=50, attempts=3))
+    registry.observe("keywordstool", _span(5.0, status=500))
+    registry.observe("keywordstool", _span(0.001, cache="hit"))
+    return registry
+
+
+def test_prometheus_histogram_buckets_are_cumulative():
+    text = _observed_registry().to_prometheus()
+
+    name = "naver_api_request_duration_seconds"
+    assert '{}_bucket{{endpoint="keywordstool",le="0.01"}} 2'.format(name) in text
+    assert '{}_bucket{{endpoint="keywordstool",le="0.1"}} 3'.format(name) in text
+    assert '{}_bucket{{endpoint="keywordstool",le="1.0"}} 3'.format(name) in text
+    assert '{}_bucket{{endpoint="keywordstool",le="+Inf"}} 4'.format(name) in text
+    assert '{}_count{{endpoint="keywordstool"}} 4'.format(name) in text
+    assert '{}_sum{{endpoint="keywordstool"}} 5.056000'.format(name) in text
+    assert 'naver_api_requests_total{endpoint="keywordstool",status="cached",cache="hit"} 1' in text
+    assert 'naver_api_response_bytes_total{endpoint="keywordstool"} 150' in text
+    assert 'naver_api_retries_total{endpoint="keywordstool"} 2' in text
+
+
+def test_to_dict_matches_observations():
+    data = _observed_registry().to_dict()
+
+    latency = data["latency_seconds"]["keywordstool"]
+    assert latency["buckets"] == {"0.01": 2, "0.1": 3, "1.0": 3, "+Inf": 4}
+    assert latency["count"] == 4
+    assert latency["sum"] == 5.056
+    assert data["requests"] == [
+        {"endpoint": "keywordstool", "status": "200", "cache": "off", "count": 2},
+        {"endpoint": "keywordstool", "status": "500", "cache": "off", "count": 1},
+        {"endpoint": "keywordstool", "status": "cached", "cache": "hit", "count": 1},
+    ]
+    assert data["response_bytes"] == {"keywordstool": 150}
+    assert data["retries"] == {"keywordstool": 2}
+
+
+def test_bind_carries_trace_into_pool_threads():
+    def work(i):
+        with metrics.span("segment", index=i):
+            return metrics.current_span().parent.name
+
+    with metrics.trace("analyze") as t:
+        with metrics.span("datalab"):
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                bound = metrics.bind(work)
+                parents = list(executor.map(bound, range(3)))
+            # 감싸지 않은 함수는 문맥을 잃는다.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                assert executor.submit(metrics.current_span).result() is None
+
+    assert parents == ["datalab"] * 3
+    rows = t.to_list()
+    segments = [r for r in rows if r["name"] == "segment"]
+    assert sorted(r["attrs"]["index"] for r in segments) == [0, 1, 2]
+    assert all(r["depth"] == 2 for r in segments)
+    assert rows[0]["name"] == "analyze"
@@ -0,0 +1,87 @@
+"""자동완성 확장 크롤러(crawl_autocomplete_iter) 검사."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from api import naver_autocomplete
+
+# 질의 → 자동완성 결과. 없는 질의는 빈 목록.
+SUGGESTIONS = {
+    "s": ["s", "s 1"],
+    "s x": ["s"] + ["s x{}".format(i) for i in range(9)],
+    "s y": ["s y", "s 1"],
+    "s xx": ["s xx 1", "s 1"],
+}
+
+
+class _Limiter:
+    def __init__(self):
+        self.acquired = 0
+
+    async def acquire_async(self, tokens=1.0):
+        self.acquired += 1
+
+
+@pytest.fixture
+def autocomplete(monkeypatch):
+    state = {"queries": [], "active": 0, "peak": 0, "limiter": _Limiter()}
+    lock = threading.Lock()
+
+    def fetch(q):
+        with lock:
+            state["queries"].append(q)
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.01)
+        with lock:
+            state["active"] -= 1
+        return list(SUGGESTIONS.get(q, []))
+
+    monkeypatch.setattr(naver_autocomplete, "fetch_autocomplete_suggestions", fetch)
+    monkeypatch.setattr(naver_autocomplete, "get_limiter", lambda name, rate: state["limiter"])
+    return state
+
+
+def _crawl(**kwargs):
+    async def collect():
+        return [s async for s in naver_autocomplete.crawl_autocomplete_iter("s", **kwargs)]
+
+    return asyncio.run(collect())
+
+
+def test_expands_only_saturated_queries(autocomplete):
+    found = _crawl(depth=2, suffixes=["x", "y"], saturation=10)
+
+    assert sorted(autocomplete["queries"]) == ["s", "s x", "s xx", "s xy", "s y"]
+    assert len(found) == len(set(found))
+    assert set(found) == {
+        "s", "s 1", "s y", "s xx 1", *("s x{}".format(i) for i in range(9)),
+    }
+    assert found[:2] == ["s", "s 1"]
+
+
+def test_depth_zero_queries_seed_only(autocomplete):
+    assert _crawl(depth=0) == ["s", "s 1"]
+    assert autocomplete["queries"] == ["s"]
+
+
+def test_concurrency_and_rate_limit(autocomplete):
+    suffixes = [str(i) for i in range(12)]
+
+    _crawl(depth=1, suffixes=suffixes, max_concurrency=3)
+
+    assert len(autocomplete["queries"]) == 13
+    assert autocomplete["limiter"].acquired == 13
+    assert 1 < autocomplete["peak"] <= 3
+
+
+def test_max_queries_caps_requests(autocomplete):
+    _crawl(depth=1, suffixes=[str(i) for i in range(12)], max_queries=5)
+
+    assert len(autocomplete["queries"]) == 5
+
+
+def test_sync_wrapper_collects_in_discovery_order(autocomplete):
+    assert naver_autocomplete.crawl_autocomplete("s", depth=0) == ["s", "s 1"]
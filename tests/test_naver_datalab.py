@@ -0,0 +1,201 @@
+"""데이터랩 호출(세그먼트 동시 실행, 429 처리, 묶음 비교) 검사."""
+import json
+import threading
+import time
+
+import pytest
+
+from api import naver_datalab
+from config.settings import RATE_LIMIT_BACKOFF_SEC, RATE_LIMIT_RETRIES
+from tests.conftest import FakeResponse
+from utils.errors import AuthenticationFailed, QuotaExceeded, RateLimited
+
+OK = FakeResponse(200, json.dumps({"results": [{"title": "k", "data": []}]}).encode())
+DAILY_QUOTA_429 = FakeResponse(429, b'{"errorCode": "010", "errorMessage": "quota"}')
+RATE_LIMIT_429 = FakeResponse(429, b'{"errorCode": "012", "errorMessage": "rate"}')
+
+
+@pytest.fixture
+def segment_api(monkeypatch, scheduler, no_cache):
+    """본문의 "value"를 ratio로 돌려주는 가짜 호출. 동시 실행 수의 최댓값을 기록한다."""
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def call(body, client_id, client_secret):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        try:
+            # 앞 세그먼트일수록 늦게 끝나게 해서 완료 순서를 뒤집는다.
+            time.sleep(0.005 * (10 - body["value"]))
+            if body["value"] < 0:
+                raise RuntimeError("HTTP 500")
+            return {"results": [{"title": "k", "data": [{"ratio": body["value"]}]}]}
+        finally:
+            with lock:
+                state["active"] -= 1
+
+    monkeypatch.setattr(naver_datalab, "_call_datalab_api", call)
+    return state
+
+
+def test_segments_run_concurrently_and_keep_order(segment_api):
+    bodies = {("seg", i): {"value": i} for i in range(8)}
+
+    sums = naver_datalab._fetch_segment_ratio_sums(bodies, "id", "secret", max_workers=4)
+
+    assert list(sums) == list(bodies)
+    assert list(sums.values()) == [float(i) for i in range(8)]
+    assert segment_api["peak"] > 1
+
+
+def test_failed_segment_yields_default(segment_api):
+    bodies = {"a": {"value": 1}, "broken": {"value": -1}, "b": {"value": 2}}
+
+    sums = naver_datalab._fetch_segment_ratio_sums(bodies, "id", "secret", max_workers=3)
+
+    assert sums == {"a": 1.0, "broken": 0.0, "b": 2.0}
+
+
+def test_sequential_mode_matches_concurrent(segment_api):
+    bodies = {i: {"value": i} for i in range(4)}
+
+    assert naver_datalab._fetch_segment_ratio_sums(bodies, "id", "secret", max_workers=1) == \
+        naver_datalab._fetch_segment_ratio_sums(bodies, "id", "secret", max_workers=4)
+
+
+@pytest.mark.parametrize("error", [QuotaExceeded("datalab"), RateLimited("datalab")])
+def test_segment_budget_errors_propagate(monkeypatch, error):
+    # 예산/한도 오류는 0.0으로 바꾸지 않는다. (0으로 채운 인구통계가 정상 결과처럼 보이지 않도록)
+    def call(body, client_id, client_secret):
+        if body["value"] == 2:
+            raise error
+        return {"results": [{"title": "k", "data": [{"ratio": body["value"]}]}]}
+
+    monkeypatch.setattr(naver_datalab, "_call_datalab_api", call)
+    bodies = {i: {"value": i} for i in range(4)}
+
+    with pytest.raises(type(error)):
+        naver_datalab._fetch_segment_ratio_sums(bodies, "id", "secret", max_workers=2)
+
+
+@pytest.fixture
+def responses(monkeypatch, scheduler, no_cache, no_sleep):
+    """http_client.post가 돌려줄 응답 목록. 보낸 요청 수는 len(posted)."""
+    queue = []
+    posted = []
+
+    def post(url, json=None, headers=None):
+        posted.append(json)
+        return queue.pop(0)
+
+    monkeypatch.setattr(naver_datalab.http_client, "post", post)
+    return queue, posted
+
+
+def test_daily_quota_429_marks_exhausted_without_retry(responses, scheduler, no_sleep):
+    queue, posted = responses
+    queue.append(DAILY_QUOTA_429)
+
+    with pytest.raises(QuotaExceeded):
+        naver_datalab._call_datalab_api({"q": 1}, "client-a", "secret")
+
+    assert len(posted) == 1
+    assert no_sleep == []
+    assert scheduler.remaining("datalab", "client-a") == 0
+
+
+def test_rate_limit_429_backs_off_and_retries(responses, scheduler, no_sleep):
+    queue, posted = responses
+    queue.extend([RATE_LIMIT_429, RATE_LIMIT_429, OK])
+
+    assert naver_datalab._call_datalab_api({"q": 1}, "client-a", "secret")["results"]
+
+    assert len(posted) == 3
+    assert no_sleep == [RATE_LIMIT_BACKOFF_SEC, RATE_LIMIT_BACKOFF_SEC * 2]
+    assert scheduler.usage("datalab", "client-a")["exhausted"] is False
+
+
+def test_rate_limit_429_raises_rate_limited_after_retries(responses, scheduler):
+    queue, posted = responses
+    queue.extend([RATE_LIMIT_429] * (RATE_LIMIT_RETRIES + 1))
+
+    with pytest.raises(RateLimited):
+        naver_datalab._call_datalab_api({"q": 1}, "client-a", "secret")
+
+    assert len(posted) == RATE_LIMIT_RETRIES + 1
+    assert scheduler.remaining("datalab", "client-a") > 0
+
+
+def test_fetch_segment_propagates_pool_errors_but_defaults_others(responses):
+    queue, _ = responses
+    extract = naver_datalab._extract_ratio_sum
+
+    queue.append(FakeResponse(401))
+    with pytest.raises(AuthenticationFailed):
+        naver_datalab._fetch_segment({"q": 1}, "client-a", "secret", extract, -1)
+
+    queue.append(FakeResponse(500))
+    assert naver_datalab._fetch_segment({"q": 2}, "client-a", "secret", extract, -1) == -1
+
+
+# 앵커 묶음 비교용 가짜 실제 검색량 (기간 전체 상수)
+PACKED_SIGNAL = {"anchor": 10.0, "huge": 1e6, "zero": 0.0}
+
+
+@pytest.fixture
+def packed_api(monkeypatch, scheduler, no_cache):
+    """요청 안의 최댓값을 100으로 맞추고 소수 둘째 자리에서 반올림하는 가짜 데이터랩."""
+    requests = []
+
+    def call(body, client_id, client_secret):
+        names = [g["groupName"] for g in body["keywordGroups"]]
+        requests.append(names)
+        values = {n: PACKED_SIGNAL.get(n, float(len(n))) for n in names}
+        peak = max(values.values()) or 1.0
+        return {"results": [
+            {"title": n, "data": [
+                {"period": p, "ratio": round(values[n] / peak * 100, 2)}
+                for p in ("2025-01-01", "2025-01-02")
+            ]}
+            for n in names
+        ]}
+
+    monkeypatch.setattr(naver_datalab, "_call_datalab_api", call)
+    return requests
+
+
+def _scale(series, keyword):
+    return {round(d["ratio"] / PACKED_SIGNAL.get(keyword, len(keyword)), 6) for d in series}
+
+
+def test_packed_trends_share_the_anchor_scale(packed_api):
+    keywords = ["a", "bb", "ccc", "dddd", "eeeee", "anchor", "ffffff", "a"]
+
+    trends = naver_datalab.fetch_trends_packed(keywords, "anchor", "id", "secret")
+
+    assert len(packed_api) == 2
+    assert all(names[0] == "anchor" for names in packed_api)
+    assert set(trends) == {"anchor", "a", "bb", "ccc", "dddd", "eeeee", "ffffff"}
+    scales = set().union(*(_scale(series, kw) for kw, series in trends.items()))
+    assert len(scales) == 1
+
+
+def test_packed_trends_skip_zero_anchor_chunk_for_reference(packed_api):
+    # 첫 묶음은 huge 때문에 앵커가 0으로 반올림된다 → 두 번째 묶음이 기준 스케일.
+    keywords = ["huge", "a", "bb", "ccc", "dddd", "eeeee"]
+
+    trends = naver_datalab.fetch_trends_packed(keywords, "anchor", "id", "secret")
+
+    for kw in ("huge", "a", "bb", "ccc"):
+        assert trends[kw] == []
+    assert trends["dddd"] and trends["eeeee"]
+    assert _scale(trends["dddd"], "dddd") == _scale(trends["anchor"], "anchor")
+
+
+def test_packed_trends_check_budget_before_calling(packed_api, scheduler):
+    scheduler.mark_exhausted("datalab", "id")
+
+    with pytest.raises(QuotaExceeded):
+        naver_datalab.fetch_trends_packed(["a", "bb"], "anchor", "id", "secret")
+    assert packed_api == []
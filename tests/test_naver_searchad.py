@@ -0,0 +1,111 @@
+"""검색광고 /keywordstool 묶음 조회와 429 처리 검사."""
+import threading
+import time
+
+import pytest
+
+from api import naver_searchad
+from config.settings import KEYWORDSTOOL_MAX_HINTS, RATE_LIMIT_BACKOFF_SEC, RATE_LIMIT_RETRIES
+from tests.conftest import FakeResponse
+from utils.errors import RateLimited
+
+
+@pytest.fixture
+def chunk_api(monkeypatch):
+    """힌트마다 정확 일치 행 + 모든 묶음에 공통으로 나오는 행을 돌려주는 가짜 호출."""
+    state = {"chunks": [], "active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def request(hints, api_key, secret_key, customer_id):
+        with lock:
+            state["chunks"].append(list(hints))
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.01)
+        with lock:
+            state["active"] -= 1
+        rows = [
+            {"relKeyword": hint, "monthlyPcQcCnt": len(hint) * 100,
+             "monthlyMobileQcCnt": len(hint) * 1000, "compIdx": "중간"}
+            for hint in hints
+        ]
+        rows.append({"relKeyword": "공통", "monthlyPcQcCnt": hints[0],
+                     "monthlyMobileQcCnt": 0, "compIdx": "낮음"})
+        return rows
+
+    monkeypatch.setattr(naver_searchad, "_request_keywordstool", request)
+    return state
+
+
+def test_batch_normalizes_dedupes_and_chunks_hints(chunk_api):
+    keywords = ["캠핑 의자", "캠핑의자", "텐트,팩", "Tent"] + ["kw{}".format(i) for i in range(8)]
+
+    result = naver_searchad.fetch_keywordstool_batch(keywords, "key", "secret", "customer")
+
+    hints = sorted(h for chunk in chunk_api["chunks"] for h in chunk)
+    assert hints == sorted(["캠핑의자", "텐트팩", "tent"] + ["kw{}".format(i) for i in range(8)])
+    assert all(len(chunk) <= KEYWORDSTOOL_MAX_HINTS for chunk in chunk_api["chunks"])
+    assert len(chunk_api["chunks"]) == -(-len(hints) // KEYWORDSTOOL_MAX_HINTS)
+    assert chunk_api["peak"] > 1
+    # 여러 묶음에 나온 연관 키워드는 한 행만 남는다.
+    assert result.keywords.count("공통") == 1
+    assert len(result) == 11 + 1
+
+
+def test_batch_sequential_matches_concurrent(chunk_api):
+    keywords = [str(100 + i) for i in range(12)]
+
+    sequential = naver_searchad.fetch_keywordstool_batch(
+        keywords, "key", "secret", "customer", max_workers=1
+    )
+    concurrent = naver_searchad.fetch_keywordstool_batch(keywords, "key", "secret", "customer")
+
+    assert sequential.keywords == concurrent.keywords
+    assert sequential.pc.tolist() == concurrent.pc.tolist()
+    # 공통 행은 첫 번째 묶음 응답의 값이 남는다.
+    assert concurrent.volume_of("공통")["pc"] == 100
+
+
+def test_search_volumes_keep_input_order(chunk_api):
+    keywords = ["b", "캠핑 의자", "a", "b", "없음,"]
+
+    volumes = naver_searchad.fetch_search_volumes(keywords, "key", "secret", "customer")
+
+    assert list(volumes) == ["b", "캠핑 의자", "a", "없음,"]
+    assert volumes["캠핑 의자"] == {"pc": 400, "mobile": 4000}
+    assert volumes["a"] == {"pc": 100, "mobile": 1000}
+
+
+@pytest.fixture
+def responses(monkeypatch, scheduler, no_cache, no_sleep):
+    queue = []
+
+    def get(url, headers=None, params=None):
+        return queue.pop(0)
+
+    monkeypatch.setattr(naver_searchad.http_client, "get", get)
+    monkeypatch.setattr(naver_searchad, "get_searchad_headers", lambda *args: {})
+    return queue
+
+
+def test_429_retries_then_succeeds(responses, no_sleep):
+    responses.extend([
+        FakeResponse(429),
+        FakeResponse(200, '{"keywordList": [{"relKeyword": "k", "monthlyPcQcCnt": 10,'
+                          ' "monthlyMobileQcCnt": 20, "compIdx": "낮음"}]}'.encode()),
+    ])
+
+    result = naver_searchad.fetch_keywordstool("k", "key", "secret", "customer")
+
+    assert result.volume_of("k") == {"pc": 10, "mobile": 20}
+    assert no_sleep == [RATE_LIMIT_BACKOFF_SEC]
+
+
+def test_429_raises_rate_limited_without_exhausting_budget(responses, scheduler):
+    responses.extend([FakeResponse(429)] * (RATE_LIMIT_RETRIES + 1))
+
+    with pytest.raises(RateLimited):
+        naver_searchad.fetch_keywordstool("k", "key", "secret", "customer")
+
+    assert responses == []
+    assert scheduler.usage("searchad", "key")["exhausted"] is False
@@ -0,0 +1,57 @@
+"""QuotaScheduler 일일 호출 예산 검사."""
+import pytest
+
+from tests.conftest import TEST_LIMITS
+from utils.errors import QuotaExceeded
+
+LIMIT = TEST_LIMITS["datalab"][1]
+
+
+def test_acquire_counts_usage_until_daily_limit(scheduler):
+    for _ in range(LIMIT):
+        scheduler.acquire("datalab", "client-a")
+
+    usage = scheduler.usage("datalab", "client-a")
+    assert (usage["used"], usage["limit"], usage["remaining"]) == (LIMIT, LIMIT, 0)
+    with pytest.raises(QuotaExceeded):
+        scheduler.acquire("datalab", "client-a")
+    # 다른 인증 정보는 따로 센다.
+    assert scheduler.remaining("datalab", "client-b") == LIMIT
+
+
+def test_admit_checks_cost_without_spending(scheduler):
+    scheduler.acquire("datalab", "client-a")
+
+    remaining = LIMIT - 1
+    assert scheduler.admit("datalab", "client-a", cost=remaining) == remaining
+    assert scheduler.remaining("datalab", "client-a") == remaining
+    with pytest.raises(QuotaExceeded) as info:
+        scheduler.admit("datalab", "client-a", cost=LIMIT)
+    assert (info.value.remaining, info.value.needed) == (remaining, LIMIT)
+
+
+def test_mark_exhausted_zeroes_today(scheduler):
+    scheduler.mark_exhausted("datalab", "client-a")
+
+    assert scheduler.remaining("datalab", "client-a") == 0
+    assert scheduler.usage("datalab", "client-a")["exhausted"] is True
+    with pytest.raises(QuotaExceeded):
+        scheduler.admit("datalab", "client-a")
+
+
+def test_unlimited_service(scheduler):
+    for _ in range(10):
+        scheduler.acquire("searchad", "key-a")
+
+    usage = scheduler.usage("searchad", "key-a")
+    assert usage["limit"] is None
+    assert usage["remaining"] is None
+    assert usage["used"] == 10
+    assert scheduler.admit("searchad", "key-a", cost=1000) is None
+
+
+def test_usage_is_stored_per_credential_hash(scheduler):
+    scheduler.acquire("datalab", "secret-client-id")
+
+    stored = scheduler._conn.execute("SELECT credential FROM quota_usage").fetchall()
+    assert stored and all("secret-client-id" not in row[0] for row in stored)
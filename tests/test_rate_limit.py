@@ -0,0 +1,53 @@
+"""TokenBucket 속도 제한 검사 (가짜 시계 사용)."""
+import pytest
+
+from utils import rate_limit
+from utils.rate_limit import TokenBucket, get_limiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_burst_up_to_capacity_then_waits(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    # 대기 중인 예약이 쌓이면 호출 순서대로 간격이 벌어진다.
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_refills_over_time_up_to_capacity(clock):
+    bucket = TokenBucket(rate=2, capacity=2)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock[0] += 0.5
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+    clock[0] += 100
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() > 0
+
+
+def test_acquire_sleeps_for_reserved_wait(clock, no_sleep):
+    bucket = TokenBucket(rate=4, capacity=1)
+    bucket.acquire()
+    bucket.acquire()
+
+    assert no_sleep == [pytest.approx(0.25)]
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_get_limiter_shares_by_name():
+    assert get_limiter("test:shared", 5) is get_limiter("test:shared", 5)
+    assert get_limiter("test:shared", 5) is not get_limiter("test:other", 5)
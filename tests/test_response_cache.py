@@ -0,0 +1,114 @@
+"""디스크 응답 캐시(TTL + LRU)와 새로고침 우회 검사."""
+import pytest
+
+from utils import response_cache
+from utils.response_cache import ResponseCache, bypass, cached_call, is_cached
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    instance = ResponseCache(":memory:", max_entries=2)
+    monkeypatch.setattr(response_cache, "get_cache", lambda: instance)
+    return instance
+
+
+def test_get_returns_stored_value_until_expiry(clock, cache):
+    cache.set("ns", {"q": 1}, {"value": [1, 2]}, expires_at=clock[0] + 10)
+
+    assert cache.get("ns", {"q": 1}) == {"value": [1, 2]}
+    assert cache.get("ns", {"q": 2}) is None
+
+    clock[0] += 10
+    assert cache.get("ns", {"q": 1}) is None
+    assert cache.stats() == {"entries": 0, "hits": {"ns": 1}, "misses": {"ns": 2}}
+
+
+def test_key_ignores_param_order(cache):
+    cache.set("ns", {"a": 1, "b": 2}, "x", expires_at=float("inf"))
+
+    assert cache.get("ns", {"b": 2, "a": 1}) == "x"
+
+
+def test_evicts_least_recently_used(clock, cache):
+    cache.set("ns", {"q": 1}, "one", expires_at=clock[0] + 100)
+    clock[0] += 1
+    cache.set("ns", {"q": 2}, "two", expires_at=clock[0] + 100)
+    clock[0] += 1
+    cache.get("ns", {"q": 1})
+    clock[0] += 1
+    cache.set("ns", {"q": 3}, "three", expires_at=clock[0] + 100)
+
+    assert cache.contains("ns", {"q": 1})
+    assert not cache.contains("ns", {"q": 2})
+    assert cache.contains("ns", {"q": 3})
+
+
+def test_hits_do_not_write_until_flushed(clock, cache, monkeypatch):
+    cache.set("ns", {"q": 1}, "one", expires_at=clock[0] + 100)
+    writes = cache._conn.total_changes
+
+    for _ in range(5):
+        assert cache.get("ns", {"q": 1}) == "one"
+    assert cache._conn.total_changes == writes
+
+    monkeypatch.setattr(response_cache, "CACHE_ACCESS_FLUSH_SIZE", 2)
+    clock[0] += 1
+    cache.get("ns", {"q": 1})
+    cache.set("ns", {"q": 2}, "two", expires_at=clock[0] + 100)
+    clock[0] += 1
+    cache.get("ns", {"q": 1})
+    cache.get("ns", {"q": 2})
+    last_access = dict(cache._conn.execute("SELECT value, last_access FROM responses"))
+    assert last_access == {'"one"': clock[0], '"two"': clock[0]}
+
+
+def test_cached_call_fetches_once(cache):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"n": len(calls)}
+
+    expires = lambda: float("inf")
+    assert cached_call("ns", {"q": 1}, expires, fetch) == {"n": 1}
+    assert cached_call("ns", {"q": 1}, expires, fetch) == {"n": 1}
+    assert len(calls) == 1
+
+
+def test_cached_call_does_not_store_errors(cache):
+    def fetch():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cached_call("ns", {"q": 1}, lambda: float("inf"), fetch)
+    assert not cache.contains("ns", {"q": 1})
+
+
+def test_refresh_and_bypass_skip_read_and_overwrite(cache):
+    values = iter(["old", "new", "newer"])
+    fetch = lambda: next(values)
+    expires = lambda: float("inf")
+
+    assert cached_call("ns", {"q": 1}, expires, fetch) == "old"
+    assert cached_call("ns", {"q": 1}, expires, fetch, refresh=True) == "new"
+    assert cached_call("ns", {"q": 1}, expires, fetch) == "new"
+
+    with bypass():
+        assert not is_cached("ns", {"q": 1})
+        assert cached_call("ns", {"q": 1}, expires, fetch) == "newer"
+    assert is_cached("ns", {"q": 1})
+    assert cached_call("ns", {"q": 1}, expires, fetch) == "newer"
+
+
+def test_bypass_disabled_reads_cache(cache):
+    cached_call("ns", {"q": 1}, lambda: float("inf"), lambda: "cached")
+
+    with bypass(False):
+        assert cached_call("ns", {"q": 1}, lambda: float("inf"), lambda: "fresh") == "cached"
@@ -0,0 +1,165 @@
+"""검색광고 스크래퍼의 로그인 세션 저장/재사용 검사.
+
+Playwright가 설치되어 있으면 로컬 대체 사이트(광고 사이트 헤더의 로그인 버튼만 흉내 냄)로
+세션 재사용과 만료 감지를 확인한다. 실제 로그인 폼 입력(osascript)은 다루지 않는다.
+"""
+import asyncio
+import os
+import stat
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from api import naver_searchad_scraper as scraper
+
+LOGGED_OUT_PAGE = (
+    '<html><body><div id="header">'
+    '<a class="AccountBox_login__No4av" href="/login">로그인</a>'
+    "</div></body></html>"
+)
+LOGGED_IN_PAGE = (
+    '<html><body><div id="header"><span class="user">테스트 님</span></div></body></html>'
+)
+
+
+class StandInAdsSite:
+    """세션 쿠키가 유효하면 로그인된 헤더를, 아니면 로그인 버튼을 보여주는 사이트."""
+
+    def __init__(self):
+        self.tokens = set()
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _cookie_token(self):
+                for part in (self.headers.get("Cookie") or "").split(";"):
+                    name, _, value = part.strip().partition("=")
+                    if name == "NID_SES":
+                        return value
+                return None
+
+            def do_GET(self):
+                if self.path == "/login":
+                    token = uuid.uuid4().hex
+                    site.tokens.add(token)
+                    self.send_response(302)
+                    self.send_header("Set-Cookie", "NID_SES={}; Path=/; Max-Age=3600".format(token))
+                    self.send_header("Location", "/")
+                    self.end_headers()
+                    return
+                logged_in = self._cookie_token() in site.tokens
+                body = (LOGGED_IN_PAGE if logged_in else LOGGED_OUT_PAGE).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return "http://{}:{}/".format(host, port)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class _FakeContext:
+    def __init__(self, state):
+        self.state = state
+
+    async def storage_state(self):
+        return self.state
+
+
+def test_is_login_page():
+    assert scraper._is_login_page("https://nid.naver.com/nidlogin.login?url=x")
+    assert not scraper._is_login_page("https://manage.searchad.naver.com/customers/1")
+
+
+def test_save_session_is_owner_only(tmp_path):
+    state_path = str(tmp_path / "state" / "storage_state.json")
+    # 이미 있던 파일이 누구나 읽을 수 있는 권한이어도 0600으로 바뀌어야 한다.
+    os.makedirs(os.path.dirname(state_path))
+    with open(state_path, "w") as f:
+        f.write("{}")
+    os.chmod(state_path, 0o644)
+
+    state = {"cookies": [{"name": "NID_SES", "value": "secret"}], "origins": []}
+    asyncio.run(scraper._save_session(_FakeContext(state), state_path, lambda msg: None))
+
+    assert stat.S_IMODE(os.stat(state_path).st_mode) == 0o600
+    assert not os.path.exists(state_path + ".tmp")
+    with open(state_path, encoding="utf-8") as f:
+        assert "secret" in f.read()
+
+
+@pytest.fixture
+def chromium():
+    async_api = pytest.importorskip("playwright.async_api")
+
+    async def _launch():
+        p = await async_api.async_playwright().start()
+        try:
+            browser = await p.chromium.launch()
+        except Exception as e:
+            await p.stop()
+            pytest.skip("chromium을 실행할 수 없습니다: {}".format(e))
+        return p, browser
+
+    return _launch
+
+
+def test_saved_session_skips_login_until_it_expires(chromium, tmp_path):
+    state_path = str(tmp_path / "storage_state.json")
+    logs = []
+
+    async def _run(site):
+        p, browser = await chromium()
+        try:
+            # 첫 실행: 저장된 세션이 없으므로 로그인 필요
+            context = await scraper._new_context(browser, state_path, logs.append)
+            page = await context.new_page()
+            await page.goto(site.url)
+            assert await scraper._needs_login(page, state_path, logs.append)
+
+            # 로그인 후 세션 저장
+            await page.goto(site.url + "login")
+            assert not await scraper._needs_login(page, state_path, logs.append)
+            await scraper._save_session(context, state_path, logs.append)
+            await context.close()
+
+            # 두 번째 실행: 저장된 세션으로 로그인 생략
+            context = await scraper._new_context(browser, state_path, logs.append)
+            page = await context.new_page()
+            await page.goto(site.url)
+            assert not await scraper._needs_login(page, state_path, logs.append)
+            await context.close()
+
+            # 서버 쪽 세션 만료: 로그인이 다시 필요하고 저장 파일은 지워진다
+            site.tokens.clear()
+            context = await scraper._new_context(browser, state_path, logs.append)
+            page = await context.new_page()
+            await page.goto(site.url)
+            assert await scraper._needs_login(page, state_path, logs.append)
+            assert not os.path.exists(state_path)
+            await context.close()
+        finally:
+            await browser.close()
+            await p.stop()
+
+    with StandInAdsSite() as site:
+        asyncio.run(_run(site))
+    assert any("만료" in msg for msg in logs)
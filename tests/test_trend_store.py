@@ -0,0 +1,133 @@
+"""일별 추이 저장소(TrendStore)와 증분 갱신 검사."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from api import naver_datalab
+from utils.errors import QuotaExceeded
+from utils.trend_store import TrendStore, make_series_key
+
+
+def test_note_window_keeps_longest_window():
+    store = TrendStore(":memory:")
+
+    assert store.note_window("k", 31) == 31
+    assert store.note_window("k", 365) == 365
+    assert store.note_window("k", 31) == 365
+    assert store.note_window("other", 7) == 7
+
+
+def test_save_replace_and_prune():
+    store = TrendStore(":memory:")
+    store.save("k", [("2025-01-01", 1.0), ("2025-01-02", 2.0)])
+    store.save("k", [("2025-01-02", 3.0), ("2025-01-03", 4.0)])
+
+    assert store.load("k") == [("2025-01-01", 1.0), ("2025-01-02", 3.0), ("2025-01-03", 4.0)]
+    assert store.load("k", start="2025-01-02", end="2025-01-02") == [("2025-01-02", 3.0)]
+
+    store.prune("k", "2025-01-02")
+    assert [p for p, _ in store.load("k")] == ["2025-01-02", "2025-01-03"]
+
+    store.replace("k", [("2025-02-01", 5.0)])
+    assert store.load("k") == [("2025-02-01", 5.0)]
+
+
+def _signal(period):
+    """가짜 실제 검색량. 날짜마다 다르고 0이 아니다."""
+    return 1 + datetime.strptime(period, "%Y-%m-%d").toordinal() % 7
+
+
+def _dates(start, end):
+    day = datetime.strptime(start, "%Y-%m-%d")
+    last = datetime.strptime(end, "%Y-%m-%d")
+    while day <= last:
+        yield day.strftime("%Y-%m-%d")
+        day += timedelta(days=1)
+
+
+@pytest.fixture
+def datalab(monkeypatch):
+    """요청 기간 안의 최댓값을 100으로 맞춘 ratio를 돌려주는 가짜 데이터랩."""
+    requests = []
+
+    def call(body, client_id, client_secret):
+        requests.append((body["startDate"], body["endDate"]))
+        periods = list(_dates(body["startDate"], body["endDate"]))
+        peak = max(_signal(p) for p in periods)
+        name = body["keywordGroups"][0]["groupName"]
+        return {"results": [{"title": name, "data": [
+            {"period": p, "ratio": _signal(p) / peak * 100} for p in periods
+        ]}]}
+
+    monkeypatch.setattr(naver_datalab, "_call_datalab_api", call)
+    return requests
+
+
+def _fetch(store, days):
+    return naver_datalab.fetch_daily_trend_incremental("k", "id", "secret", days=days, store=store)
+
+
+def _scales(series):
+    return {round(d["ratio"] / _signal(d["period"]), 9) for d in series}
+
+
+def test_incremental_trend_backfills_head_on_stored_scale(datalab):
+    store = TrendStore(":memory:")
+
+    short = _fetch(store, 31)
+    assert len(short) == 32
+    assert len(datalab) == 1
+
+    long = _fetch(store, 365)
+    assert len(long) == 366
+    assert len(datalab) == 2
+    # 앞부분만 받아 붙여도 모든 날짜가 처음 저장한 스케일을 따른다.
+    assert len(_scales(long)) == 1
+    assert long[-32:] == short
+
+    assert _fetch(store, 31) == short
+    assert _fetch(store, 365) == long
+    assert len(datalab) == 2
+    # 짧은 기간 조회가 긴 기간 조회의 저장분을 지우지 않는다.
+    assert len(store.load(make_series_key("k"))) == 366
+
+
+def test_incremental_trend_appends_tail(datalab):
+    store = TrendStore(":memory:")
+    key = make_series_key("k")
+    end = datetime.now() - timedelta(days=1)
+    start = (end - timedelta(days=31)).strftime("%Y-%m-%d")
+    stale_end = (end - timedelta(days=3)).strftime("%Y-%m-%d")
+    store.save(key, [(p, _signal(p) * 2.0) for p in _dates(start, stale_end)])
+
+    series = _fetch(store, 31)
+
+    assert len(datalab) == 1
+    assert datalab[0][1] == end.strftime("%Y-%m-%d")
+    assert len(series) == 32
+    assert _scales(series) == {2.0}
+
+
+def test_incremental_trend_replaces_when_overlap_is_zero(datalab):
+    store = TrendStore(":memory:")
+    key = make_series_key("k")
+    end = datetime.now() - timedelta(days=1)
+    start = (end - timedelta(days=31)).strftime("%Y-%m-%d")
+    stale_end = (end - timedelta(days=3)).strftime("%Y-%m-%d")
+    store.save(key, [(p, 0.0) for p in _dates(start, stale_end)])
+
+    series = _fetch(store, 31)
+
+    assert len(datalab) == 2
+    assert len(series) == 32
+    assert len(_scales(series)) == 1
+
+
+def test_incremental_trend_propagates_api_errors(monkeypatch):
+    def call(body, client_id, client_secret):
+        raise QuotaExceeded("datalab")
+
+    monkeypatch.setattr(naver_datalab, "_call_datalab_api", call)
+
+    with pytest.raises(QuotaExceeded):
+        _fetch(TrendStore(":memory:"), 31)
@@ -0,0 +1,49 @@
+"""메모리 TTL + LRU 캐시 검사 (가짜 시계 사용)."""
+import pytest
+
+from utils import ttl_cache
+from utils.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_values_expire_after_ttl(clock):
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("k", "v")
+
+    clock[0] += 59
+    assert cache.get("k") == "v"
+    clock[0] += 1
+    assert cache.get("k") is None
+    assert cache.get("k", "default") == "default"
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used_over_maxsize(clock):
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_set_renews_ttl_and_invalidate_removes(clock):
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    clock[0] += 50
+    cache.set("a", 2)
+    clock[0] += 50
+
+    assert cache.get("a") == 2
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert cache.get("a") is None
@@ -3,6 +3,9 @@ from typing import Optional, Tuple
 
 import streamlit as st
 
+from utils.credential_pool import extra_key_sets_from_env, pool_from_credentials
+from utils.quota import get_quota_scheduler
+
 # .env 파일 자동 로드 (python-dotenv 설치 필요: pip install python-dotenv)
 try:
     from dotenv import load_dotenv
@@ -31,6 +34,9 @@ def _get_credentials() -> dict:
         ),
         "datalab_client_id": os.getenv("DATALAB_CLIENT_ID", ""),
         "datalab_client_secret": os.getenv("DATALAB_CLIENT_SECRET", ""),
+        # 추가 키 세트 (SEARCHAD_API_KEY_2 ... 형식) — 키 풀에서 번갈아 사용
+        "searchad_extra_keys": extra_key_sets_from_env("searchad"),
+        "datalab_extra_keys": extra_key_sets_from_env("datalab"),
     }
 
 
@@ -55,13 +61,21 @@ def render_sidebar() -> Tuple[Optional[str], dict]:
         analyze_clicked = st.button(
             "분석 시작",
             type="primary",
-            use_container_width=True,
+            width="stretch",
         )
 
         # 분석 버튼 클릭 시 session_state에 저장
         if analyze_clicked and st.session_state.get("keyword_input", "").strip():
             st.session_state["run_keyword"] = st.session_state["keyword_input"].strip()
 
+        # 같은 키워드 결과는 재사용되므로 최신 데이터가 필요할 때만 다시 조회
+        if st.session_state.get("run_keyword"):
+            if st.button("결과 새로고침", width="stretch"):
+                st.session_state["refresh_analysis"] = True
+
+        # 소스/API 호출별 소요 시간 워터폴 표시 여부
+        st.checkbox("소요 시간 표시", key="show_timings")
+
         st.divider()
         st.caption("API 연결 상태")
 
@@ -74,6 +88,13 @@ def render_sidebar() -> Tuple[Optional[str], dict]:
         # 데이터랩 API 상태
         if credentials["datalab_client_id"]:
             st.success("데이터랩 API: 연결됨", icon="✅")
+            usage = get_quota_scheduler().usage("datalab", credentials["datalab_client_id"])
+            if usage["limit"] is None:
+                st.caption("데이터랩 오늘 남은 호출: 제한 없음")
+            else:
+                st.caption("데이터랩 오늘 남은 호출: {:,} / {:,}회".format(
+                    usage["remaining"], usage["limit"]
+                ))
         else:
             st.info("데이터랩 API: 미설정 (선택사항)", icon="ℹ️")
 
@@ -84,6 +105,18 @@ def render_sidebar() -> Tuple[Optional[str], dict]:
             st.text(f"Secret: ...{credentials['searchad_secret_key'][-8:]}")
             st.caption("키 변경은 .env 파일을 수정하세요.")
 
+            # 추가 키 세트가 있으면 키별 사용 현황 표시
+            for service, label in (("searchad", "검색광고"), ("datalab", "데이터랩")):
+                pool = pool_from_credentials(credentials, service)
+                if pool is None or len(pool) < 2:
+                    continue
+                st.caption("{} 키 풀 ({}개)".format(label, len(pool)))
+                for stat in pool.stats():
+                    status = "대기 {}초".format(stat["cooldown_sec"]) if stat["cooldown_sec"] else "사용 가능"
+                    st.text("{} - 호출 {}회, 오류 {}회, {}".format(
+                        stat["key"], stat["calls"], stat["errors"], status
+                    ))
+
     keyword = st.session_state.get("run_keyword")
     if keyword:
         return keyword, credentials
@@ -1,9 +1,106 @@
 import os
+import time
 
 import streamlit as st
-from PIL import Image
 
-from api.naver_searchad_scraper import scrape_keyword_charts
+from services.job_runner import get_job_runner, QUEUED, RUNNING, DONE, FAILED
+from utils.image_store import get_image_store
+
+# 작업 진행 상황 확인 주기 (초)
+JOB_POLL_INTERVAL = 2
+
+
+def _render_chart_data(data):
+    """스크래핑한 성별/연령대/월별 수치를 차트로 표시한다."""
+    import pandas as pd
+    import plotly.express as px
+
+    if not data:
+        st.warning("수치 데이터를 찾지 못했습니다.")
+        return
+
+    col1, col2 = st.columns(2)
+    if data.get("gender"):
+        with col1:
+            fig = px.pie(
+                names=list(data["gender"]),
+                values=list(data["gender"].values()),
+                title="성별 비중 (%)",
+            )
+            st.plotly_chart(fig, width="stretch")
+    if data.get("age"):
+        with col2:
+            fig = px.bar(
+                x=list(data["age"]),
+                y=list(data["age"].values()),
+                labels={"x": "연령대", "y": "비중 (%)"},
+                title="연령대 비중 (%)",
+            )
+            st.plotly_chart(fig, width="stretch")
+    if data.get("monthly"):
+        monthly = pd.DataFrame(data["monthly"]).rename(columns={"pc": "PC", "mobile": "모바일"})
+        fig = px.line(
+            monthly,
+            x="period",
+            y=["PC", "모바일"],
+            labels={"period": "월", "value": "검색량", "variable": "기기"},
+            title="월별 검색량",
+        )
+        st.plotly_chart(fig, width="stretch")
+
+
+def _render_job_status(job_id):
+    """백그라운드 스크래핑 작업의 진행 상황을 표시하고, 끝나면 결과를 세션에 저장한다."""
+    runner = get_job_runner()
+    job = runner.get(job_id)
+    if job is None:
+        st.session_state.pop("demo_job_id", None)
+        return
+
+    log_lines = job["log"]
+    num_keywords = job["params"].get("num_keywords", 3)
+    total_steps = 15 + num_keywords * 3
+
+    if job["status"] == QUEUED:
+        st.info("대기 중입니다... (대기열 {}번째)".format(runner.queue_position(job_id)))
+    elif job["status"] == RUNNING:
+        st.progress(min(job["steps"] / total_steps, 0.99))
+        st.text(log_lines[-1] if log_lines else "시작 중...")
+        st.caption("네이버 검색광고에서 차트를 가져오는 중... (약 1~2분 소요, 페이지를 벗어나도 계속 진행됩니다)")
+
+    if job["status"] in (QUEUED, RUNNING):
+        with st.expander("진행 로그 (상세)", expanded=False):
+            st.text("\n".join(log_lines))
+        time.sleep(JOB_POLL_INTERVAL)
+        st.rerun()
+
+    st.session_state.pop("demo_job_id", None)
+
+    if job["status"] == DONE:
+        chart_results = job["result"]
+        if chart_results:
+            st.session_state["demo_chart_results"] = chart_results
+            st.success("{}개 키워드 차트를 가져왔습니다.".format(len(chart_results)))
+        else:
+            st.warning(
+                "차트를 가져오지 못했습니다.\n\n"
+                "아래 **진행 로그**에서 어느 단계에서 멈췄는지 확인해주세요."
+            )
+            with st.expander("진행 로그 (상세)", expanded=True):
+                st.text("\n".join(log_lines))
+
+    elif job["status"] == FAILED:
+        st.error("차트 가져오기 실패: {}".format(job["error"]))
+
+        if log_lines:
+            with st.expander("실패 시점 로그", expanded=True):
+                for line in log_lines:
+                    st.text(line)
+
+        # 이 작업이 남긴 스크린샷만 보여준다. (다른 사용자의 화면이 섞이지 않도록)
+        err_path = job.get("error_screenshot")
+        if err_path and os.path.exists(err_path):
+            st.image(err_path, caption="오류 발생 시 화면", width="stretch")
 
 
 def render_demographics_tab(related_keywords_df, credentials):
@@ -37,81 +134,60 @@ def render_demographics_tab(related_keywords_df, credentials):
         key="demo_num_keywords",
     )
 
+    capture_labels = {"image": "차트 이미지", "data": "수치 데이터", "both": "둘 다"}
+    capture = st.radio(
+        "수집 방식",
+        options=list(capture_labels),
+        format_func=capture_labels.get,
+        index=0,
+        horizontal=True,
+        key="demo_capture_mode",
+    )
+
     if st.button("인구통계 차트 가져오기", type="primary", key="demo_scrape_btn"):
         keyword = st.session_state.get("run_keyword", "")
         if not keyword:
             st.warning("먼저 키워드를 입력하고 분석을 시작해주세요.")
             return
 
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        log_container = st.expander("진행 로그 (상세)", expanded=True)
-        log_lines = []
-
-        step_count = [0]
-        total_steps = 15 + num_keywords * 3
-
-        def on_progress(msg):
-            step_count[0] += 1
-            pct = min(step_count[0] / total_steps, 0.99)
-            progress_bar.progress(pct)
-            status_text.text(msg)
-            log_lines.append(msg)
-            with log_container:
-                st.text("\n".join(log_lines))
+        # 스크래퍼(Playwright 등)는 처음 요청할 때 불러온다.
+        from api.naver_searchad_scraper import scrape_keyword_charts
+
+        # 스크래핑은 백그라운드 워커에서 실행하고 작업 ID만 세션에 보관한다.
+        st.session_state["demo_job_id"] = get_job_runner().submit(
+            owner=naver_id,
+            func=scrape_keyword_charts,
+            kwargs={
+                "keyword": keyword,
+                "naver_id": naver_id,
+                "naver_pw": naver_pw,
+                "num_keywords": num_keywords,
+                "capture": capture,
+            },
+            params={"keyword": keyword, "num_keywords": num_keywords, "capture": capture},
+        )
 
-        try:
-            with st.spinner("네이버 검색광고에서 차트를 가져오는 중... (약 1~2분 소요)"):
-                chart_results = scrape_keyword_charts(
-                    keyword=keyword,
-                    naver_id=naver_id,
-                    naver_pw=naver_pw,
-                    num_keywords=num_keywords,
-                    progress_callback=on_progress,
-                )
-
-            progress_bar.progress(1.0)
-            status_text.text("완료!")
-
-            if chart_results:
-                st.session_state["demo_chart_results"] = chart_results
-                st.success("{}개 키워드 차트를 가져왔습니다.".format(len(chart_results)))
-            else:
-                st.warning(
-                    "차트를 가져오지 못했습니다.\n\n"
-                    "위의 **진행 로그**에서 어느 단계에서 멈췄는지 확인해주세요."
-                )
-
-        except Exception as e:
-            progress_bar.empty()
-            status_text.empty()
-            st.error("차트 가져오기 실패: {}".format(e))
-
-            if log_lines:
-                with st.expander("실패 시점 로그", expanded=True):
-                    for line in log_lines:
-                        st.text(line)
-
-            err_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)),
-                "screenshots", "error_screenshot.png",
-            )
-            if os.path.exists(err_path):
-                st.image(err_path, caption="오류 발생 시 화면", use_container_width=True)
+    job_id = st.session_state.get("demo_job_id")
+    if job_id:
+        _render_job_status(job_id)
 
     # 저장된 결과 표시
     if "demo_chart_results" in st.session_state and st.session_state["demo_chart_results"]:
         st.divider()
         for item in st.session_state["demo_chart_results"]:
             kw_name = item.get("keyword", "")
-            img_path = item.get("image_path", "")
+            image_key = item.get("image_key")
 
             st.markdown("### {}".format(kw_name))
 
-            if img_path and os.path.exists(img_path):
-                img = Image.open(img_path)
-                st.image(img, caption="{} - 인구통계 차트".format(kw_name), use_container_width=True)
-            else:
+            if "data" in item:
+                _render_chart_data(item["data"])
+
+            # 저장소의 인코딩된 바이트를 디코딩 없이 그대로 전달
+            image_bytes = get_image_store().get(image_key) if image_key else None
+            if image_bytes:
+                st.image(image_bytes, caption="{} - 인구통계 차트".format(kw_name), width="stretch")
+            elif "data" not in item:
                 st.warning("'{}' 차트 이미지를 찾을 수 없습니다.".format(kw_name))
 
             st.markdown("---")
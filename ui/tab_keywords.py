@@ -1,36 +1,68 @@
-from typing import Optional
-
 import streamlit as st
-import plotly.express as px
-import pandas as pd
+
+# 화면에 보여줄 열 (원본 열 → 표시 이름)
+DISPLAY_COLUMNS = {
+    "키워드": "키워드",
+    "PC검색량_원본": "PC 검색량",
+    "모바일검색량_원본": "모바일 검색량",
+    "총검색량": "총 검색량",
+    "경쟁도": "경쟁도",
+}
+COUNT_COLUMNS = ["PC 검색량", "모바일 검색량", "총 검색량"]
+
+
+def _format_count(value):
+    """검색량을 천 단위 구분 기호로 표시한다. 결측(<NA>)은 '< 10'."""
+    import pandas as pd
+
+    if pd.isna(value):
+        return "< 10"
+    return "{:,}".format(int(value))
 
 
-def render_keywords_tab(df: Optional[pd.DataFrame]):
-    """연관 키워드 + 검색량 탭을 렌더링한다."""
-    if df is None:
+def render_keywords_tab(related_keywords, search_volume=None):
+    """연관 키워드 + 검색량 탭을 렌더링한다.
+
+    Args:
+        related_keywords: KeywordToolResult 또는 DataFrame (None이면 API 키 미설정)
+        search_volume: 메인 키워드의 현재 검색량 {"pc": 1500, "mobile": 12000}.
+                       related_keywords와 같은 응답에서 읽은 값 (없으면 None)
+    """
+    # pandas/plotly는 탭을 처음 그릴 때 불러온다 (앱 시작 시간 단축).
+    import pandas as pd
+    import plotly.express as px
+
+    if related_keywords is None:
         st.info(
             "검색광고 API 키를 설정하면 연관 키워드와 월간 검색량을 확인할 수 있습니다.\n\n"
             "사이드바의 **API 키 설정**에서 검색광고 API 키를 입력해주세요."
         )
         return
 
+    if isinstance(related_keywords, pd.DataFrame):
+        df = related_keywords
+    else:
+        df = related_keywords.to_dataframe()
+
     if df.empty:
         st.warning("연관 키워드가 없습니다.")
         return
 
+    if search_volume:
+        col1, col2, col3 = st.columns(3)
+        col1.metric("PC 월간 검색량", "{:,}".format(search_volume["pc"]))
+        col2.metric("모바일 월간 검색량", "{:,}".format(search_volume["mobile"]))
+        col3.metric("총 월간 검색량", "{:,}".format(search_volume["pc"] + search_volume["mobile"]))
+
     st.subheader(f"총 {len(df)}개의 연관 키워드")
 
-    # 표시용 DataFrame (원본 검색량 문자열 사용)
-    display_df = df[["키워드", "PC검색량_원본", "모바일검색량_원본", "총검색량", "경쟁도"]].copy()
-    display_df.columns = ["키워드", "PC 검색량", "모바일 검색량", "총 검색량", "경쟁도"]
+    # 표시용 DataFrame — 값은 숫자로 두어 정렬이 되게 하고, 표시 형식만 입힌다.
+    display_df = df[list(DISPLAY_COLUMNS)].rename(columns=DISPLAY_COLUMNS)
 
     st.dataframe(
-        display_df,
+        display_df.style.format(_format_count, subset=COUNT_COLUMNS),
         width="stretch",
         hide_index=True,
-        column_config={
-            "총 검색량": st.column_config.NumberColumn(format="%d"),
-        },
     )
 
     # 상위 20개 바 차트
@@ -54,9 +86,8 @@ def render_keywords_tab(df: Optional[pd.DataFrame]):
     st.plotly_chart(fig, width="stretch")
 
     # CSV 다운로드
-    csv = df[["키워드", "PC검색량_원본", "모바일검색량_원본", "총검색량", "경쟁도"]].to_csv(
-        index=False, encoding="utf-8-sig"
-    )
+    # 숫자 열은 형식 없이 그대로 내보낸다. ('< 10'은 _원본 빈칸 + _10미만 True)
+    csv = df.to_csv(index=False, encoding="utf-8-sig")
     st.download_button(
         label="CSV 다운로드",
         data=csv,
@@ -0,0 +1,46 @@
+import streamlit as st
+
+
+def _label(row):
+    attrs = row["attrs"]
+    detail = []
+    if "cache" in attrs:
+        detail.append("캐시 {}".format(attrs["cache"]))
+    if "status" in attrs:
+        detail.append(str(attrs["status"]))
+    if attrs.get("attempts", 0) > 1:
+        detail.append("재시도 {}회".format(attrs["attempts"] - 1))
+    name = "  " * row["depth"] + row["name"]
+    return "{} ({})".format(name, ", ".join(detail)) if detail else name
+
+
+def render_timing_waterfall(timings: list):
+    """분석 1회의 소스/API 호출별 소요 시간을 워터폴 차트로 표시한다."""
+    import plotly.graph_objects as go
+
+    if not timings:
+        st.info("기록된 소요 시간이 없습니다.")
+        return
+
+    # 위에서 아래로 시작 순서가 되도록 뒤집어 그린다.
+    rows = list(reversed(timings))
+    labels = ["{}. {}".format(len(rows) - i, _label(row)) for i, row in enumerate(rows)]
+    fig = go.Figure(go.Bar(
+        x=[row["duration_ms"] for row in rows],
+        base=[row["start_ms"] for row in rows],
+        y=labels,
+        orientation="h",
+        text=["{:.0f}ms".format(row["duration_ms"]) for row in rows],
+        textposition="auto",
+        hovertext=[row["thread"] for row in rows],
+    ))
+    fig.update_layout(
+        xaxis_title="경과 시간 (ms)",
+        height=max(240, 28 * len(rows) + 80),
+        margin=dict(l=10, r=10, t=30, b=40),
+        showlegend=False,
+    )
+    st.plotly_chart(fig, width="stretch")
+
+    total = timings[0]["duration_ms"]
+    st.caption("전체 {:.0f}ms | 같은 결과를 캐시에서 다시 보여줄 때는 처음 조회한 시점의 기록입니다.".format(total))
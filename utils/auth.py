@@ -32,3 +32,11 @@ def get_searchad_headers(
         "X-Customer": customer_id,
         "X-Signature": signature,
     }
+
+
+def credentials_fingerprint(credentials: dict) -> str:
+    """인증 정보 dict를 식별하는 해시를 만든다. (캐시 키용, 원문은 남기지 않음)"""
+    material = "\n".join(
+        "{}={}".format(key, credentials.get(key) or "") for key in sorted(credentials)
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
@@ -0,0 +1,242 @@
+"""여러 API 키 세트를 번갈아 사용하는 키 풀.
+
+키 하나의 호출 한도에 처리량이 묶이지 않도록 같은 서비스의 키 세트 N개를 모아
+요청마다 진행 중인 호출이 가장 적은 키를 고른다 (같으면 순서대로 돌아가며 선택).
+
+- 초당 한도 초과(RateLimited) 응답을 받은 키는 CREDENTIAL_COOLDOWN_SEC 동안 제외
+- 401(AuthenticationFailed) 응답을 받은 키는 CREDENTIAL_AUTH_COOLDOWN_SEC 동안 제외
+- 오늘 호출 예산(utils/quota.py)이 바닥난 키도 제외
+
+API 함수는 모두 인증값을 마지막 위치 인자로 받으므로
+pool.call(fetch_keywordstool, keyword)처럼 그대로 감싸 호출할 수 있다.
+
+키 세트는 환경변수에서 읽는다. 기본 이름(SEARCHAD_API_KEY 등)이 첫 번째 세트이고
+추가 세트는 _2, _3 ... 접미사를 붙인다.
+"""
+import os
+import threading
+import time
+
+from config.settings import (
+    CREDENTIAL_MAX_SETS,
+    CREDENTIAL_COOLDOWN_SEC,
+    CREDENTIAL_AUTH_COOLDOWN_SEC,
+)
+from utils.errors import AuthenticationFailed, QuotaExceeded, RateLimited
+from utils.quota import get_quota_scheduler
+
+# 서비스별 credentials dict 키 (API 함수 인자 순서와 같음)
+SERVICE_FIELDS = {
+    "searchad": ("searchad_api_key", "searchad_secret_key", "searchad_customer_id"),
+    "datalab": ("datalab_client_id", "datalab_client_secret"),
+}
+
+# 서비스별 추가 키 세트를 담는 credentials dict 키
+EXTRA_KEYS_FIELD = "{}_extra_keys"
+
+
+def extra_key_sets_from_env(service, environ=None):
+    """환경변수의 추가 키 세트(_2 ~ _N 접미사)를 [(값, ...), ...]로 읽는다.
+
+    예: SEARCHAD_API_KEY_2, SEARCHAD_SECRET_KEY_2, SEARCHAD_CUSTOMER_ID_2
+    하나라도 비어 있는 세트는 건너뛴다.
+    """
+    environ = os.environ if environ is None else environ
+    names = [field.upper() for field in SERVICE_FIELDS[service]]
+    key_sets = []
+    for n in range(2, CREDENTIAL_MAX_SETS + 1):
+        values = tuple(environ.get("{}_{}".format(name, n), "") for name in names)
+        if all(values):
+            key_sets.append(values)
+    return key_sets
+
+
+def _mask(identity):
+    return "..." + identity[-6:] if len(identity) > 6 else identity
+
+
+class _Entry:
+    __slots__ = (
+        "key_set", "in_flight", "calls", "errors", "cooldown_until", "last_error", "auth_failed",
+    )
+
+    def __init__(self, key_set):
+        self.key_set = key_set
+        self.in_flight = 0
+        self.calls = 0
+        self.errors = 0
+        self.cooldown_until = 0.0
+        self.last_error = None
+        self.auth_failed = False
+
+
+class CredentialPool:
+    """같은 서비스의 키 세트 여러 개를 부하에 따라 나눠 쓴다. 스레드 안전."""
+
+    def __init__(self, service, key_sets, cooldown=CREDENTIAL_COOLDOWN_SEC,
+                 auth_cooldown=CREDENTIAL_AUTH_COOLDOWN_SEC):
+        if not key_sets:
+            raise ValueError("key_sets가 비어 있습니다.")
+        self.service = service
+        self.cooldown = cooldown
+        self.auth_cooldown = auth_cooldown
+        self._entries = [_Entry(tuple(key_set)) for key_set in key_sets]
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _has_budget(self, entry):
+        remaining = get_quota_scheduler().remaining(self.service, entry.key_set[0])
+        return remaining is None or remaining > 0
+
+    def _usable(self, entry, now):
+        return entry.cooldown_until <= now and self._has_budget(entry)
+
+    def _unavailable_error(self, now):
+        """사용할 키가 없을 때 발생시킬 예외.
+
+        모두 인증 실패면 AuthenticationFailed, 인증 실패가 아닌 키가 모두 일일 예산을
+        소진했으면 QuotaExceeded, 그 밖에는 (초당 한도 쿨다운 중) RateLimited.
+        """
+        if all(entry.auth_failed for entry in self._entries):
+            return AuthenticationFailed(
+                "사용 가능한 API 키가 없습니다: 모든 키가 인증에 실패했습니다."
+            )
+        waiting = [
+            entry.cooldown_until - now
+            for entry in self._entries
+            if not entry.auth_failed and self._has_budget(entry)
+        ]
+        if not waiting:
+            return QuotaExceeded(self.service)
+        return RateLimited(self.service, retry_after=max(0.0, min(waiting)))
+
+    def _acquire(self):
+        now = time.monotonic()
+        count = len(self._entries)
+        with self._lock:
+            candidates = [
+                (entry.in_flight, (idx - self._next) % count, idx)
+                for idx, entry in enumerate(self._entries)
+                if self._usable(entry, now)
+            ]
+            if not candidates:
+                raise self._unavailable_error(now)
+            _, _, idx = min(candidates)
+            self._next = (idx + 1) % count
+            entry = self._entries[idx]
+            entry.in_flight += 1
+            entry.calls += 1
+            return entry
+
+    def _release(self, entry, error=None):
+        with self._lock:
+            entry.in_flight -= 1
+            if error is None:
+                entry.auth_failed = False
+                return
+            entry.errors += 1
+            entry.last_error = str(error)
+            if isinstance(error, AuthenticationFailed):
+                entry.auth_failed = True
+                entry.cooldown_until = time.monotonic() + self.auth_cooldown
+            elif isinstance(error, (QuotaExceeded, RateLimited)):
+                entry.cooldown_until = time.monotonic() + self.cooldown
+
+    def ensure_available(self):
+        """지금 쓸 수 있는 키가 하나라도 있는지 확인한다.
+
+        Raises:
+            QuotaExceeded / RateLimited / AuthenticationFailed: 모든 키가 제외된 상태일 때
+        """
+        now = time.monotonic()
+        with self._lock:
+            if not any(self._usable(entry, now) for entry in self._entries):
+                raise self._unavailable_error(now)
+
+    def call(self, func, *args, **kwargs):
+        """func(*args, *키 세트, **kwargs)를 호출한다.
+
+        401/429로 실패하면 해당 키를 쉬게 하고 다른 키로 다시 시도한다.
+        그 밖의 예외는 그대로 전파한다.
+        """
+        last_error = None
+        for _ in range(len(self._entries)):
+            try:
+                entry = self._acquire()
+            except (QuotaExceeded, RateLimited, AuthenticationFailed) as e:
+                raise last_error or e
+            try:
+                result = func(*args, *entry.key_set, **kwargs)
+            except (QuotaExceeded, RateLimited, AuthenticationFailed) as e:
+                self._release(entry, e)
+                last_error = e
+                continue
+            except Exception as e:
+                self._release(entry, e)
+                raise
+            self._release(entry)
+            return result
+        raise last_error
+
+    def stats(self):
+        """키별 사용 현황을 반환한다. 키 원문은 끝 몇 자리만 남긴다.
+
+        Returns:
+            [{"key": "...a1b2c3", "calls": 10, "errors": 1, "in_flight": 0,
+              "cooldown_sec": 0, "quota_remaining": 880, "last_error": None}, ...]
+        """
+        now = time.monotonic()
+        scheduler = get_quota_scheduler()
+        with self._lock:
+            return [
+                {
+                    "key": _mask(entry.key_set[0]),
+                    "calls": entry.calls,
+                    "errors": entry.errors,
+                    "in_flight": entry.in_flight,
+                    "cooldown_sec": max(0, int(entry.cooldown_until - now)),
+                    "quota_remaining": scheduler.remaining(self.service, entry.key_set[0]),
+                    "last_error": entry.last_error,
+                }
+                for entry in self._entries
+            ]
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_credential_pool(service, key_sets):
+    """같은 키 세트 구성이면 프로세스 전체에서 같은 CredentialPool을 반환한다.
+
+    Streamlit 재실행 사이에도 키별 사용량/쿨다운 상태가 유지된다.
+    """
+    key = (service, tuple(tuple(key_set) for key_set in key_sets))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = CredentialPool(service, key[1])
+            _pools[key] = pool
+        return pool
+
+
+def pool_from_credentials(credentials, service):
+    """credentials dict의 기본 키 세트와 추가 키 세트로 풀을 만든다.
+
+    Returns:
+        CredentialPool. 사용할 수 있는 키 세트가 하나도 없으면 None
+    """
+    key_sets = []
+    primary = tuple(credentials.get(field) for field in SERVICE_FIELDS[service])
+    if all(primary):
+        key_sets.append(primary)
+    for key_set in credentials.get(EXTRA_KEYS_FIELD.format(service)) or []:
+        key_set = tuple(key_set)
+        if all(key_set) and key_set not in key_sets:
+            key_sets.append(key_set)
+    if not key_sets:
+        return None
+    return get_credential_pool(service, key_sets)
@@ -0,0 +1,55 @@
+"""네이버 API 호출 공용 예외.
+
+api/ 모듈이 발생시키고 키 풀(utils/credential_pool.py), 호출 예산(utils/quota.py),
+분석 서비스가 함께 처리하는 예외를 한곳에 모은다.
+
+- QuotaExceeded: 오늘 호출 예산이 부족함 → 작업 중단, 내일 다시 시도
+- RateLimited: 초당 호출 한도 초과(429) → retry_after초 뒤 다시 시도
+- AuthenticationFailed: 인증 실패(401) → 다른 키 세트로 시도
+"""
+from config.settings import RATE_LIMIT_BACKOFF_SEC
+
+# 서비스별 표시 이름
+SERVICE_LABELS = {
+    "datalab": "데이터랩",
+    "searchad": "검색광고",
+}
+
+
+class QuotaExceeded(Exception):
+    """호출 예산이 부족해 요청을 보내지 않았을 때 발생한다.
+
+    일반 API 오류와 구분해, 호출한 쪽이 0 같은 기본값으로 대체하지 않고
+    작업을 중단하거나 다음에 다시 시도하도록 한다.
+    """
+
+    def __init__(self, service, remaining=0, needed=1):
+        super().__init__(
+            "{} API 일일 호출 한도가 부족합니다. (남은 호출 {}회, 필요 {}회) "
+            "내일 0시 이후 다시 시도해주세요.".format(
+                SERVICE_LABELS.get(service, service), remaining, needed
+            )
+        )
+        self.service = service
+        self.remaining = remaining
+        self.needed = needed
+
+
+class RateLimited(Exception):
+    """초당 호출 한도를 넘겨 429 응답을 받았을 때 발생한다.
+
+    일일 예산 부족(QuotaExceeded)과 달리 retry_after초 뒤 다시 시도하면 된다.
+    """
+
+    def __init__(self, service, retry_after=RATE_LIMIT_BACKOFF_SEC):
+        super().__init__(
+            "{} API 초당 호출 한도 초과: 잠시 후 다시 시도해주세요.".format(
+                SERVICE_LABELS.get(service, service)
+            )
+        )
+        self.service = service
+        self.retry_after = retry_after
+
+
+class AuthenticationFailed(Exception):
+    """API가 401(인증 실패)로 응답했을 때 발생한다."""
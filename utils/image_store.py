@@ -0,0 +1,163 @@
+"""차트 이미지 저장소 (내용 주소 기반, 디스크 용량 제한).
+
+캡처한 원본 이미지 바이트의 SHA-256을 키로 삼아 한 번만 저장한다.
+저장할 때 WebP(또는 최적화 PNG)로 다시 인코딩해 크기를 줄이고,
+IMAGE_STORE_MAX_BYTES를 넘으면 마지막 사용 시각(mtime)이 가장 오래된 파일부터 삭제한다.
+UI는 get()으로 받은 인코딩된 바이트를 디코딩 없이 그대로 st.image에 넘기면 된다.
+"""
+import asyncio
+import hashlib
+import os
+import threading
+from io import BytesIO
+
+from config.settings import (
+    IMAGE_STORE_DIR,
+    IMAGE_STORE_MAX_BYTES,
+    IMAGE_STORE_FORMAT,
+    IMAGE_STORE_QUALITY,
+)
+
+_EXTENSIONS = {"webp": ".webp", "png": ".png"}
+
+
+def _encode(raw, fmt, quality):
+    """이미지 바이트를 fmt 형식으로 다시 인코딩한다. (형식, 바이트) 반환."""
+    from PIL import Image, features
+
+    image = Image.open(BytesIO(raw))
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGB")
+
+    if fmt == "webp" and not features.check("webp"):
+        fmt = "png"
+
+    out = BytesIO()
+    if fmt == "webp":
+        image.save(out, format="WEBP", quality=quality, method=4)
+    else:
+        image.save(out, format="PNG", optimize=True)
+    return fmt, out.getvalue()
+
+
+class ImageStore:
+    """SHA-256 키로 이미지를 저장하고 용량 한도 안에서 LRU로 정리한다."""
+
+    def __init__(self, root=IMAGE_STORE_DIR, max_bytes=IMAGE_STORE_MAX_BYTES,
+                 fmt=IMAGE_STORE_FORMAT, quality=IMAGE_STORE_QUALITY):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.fmt = fmt
+        self.quality = quality
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+        self._total_bytes = sum(size for _, _, size in self._entries())
+
+    def _entries(self):
+        """저장된 파일을 [(mtime, 경로, 크기), ...]로 반환한다."""
+        entries = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        return entries
+
+    def _find(self, key):
+        for ext in _EXTENSIONS.values():
+            path = os.path.join(self.root, key + ext)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def path(self, key):
+        """키에 해당하는 파일 경로를 반환한다. 없으면 None."""
+        return self._find(key)
+
+    def put(self, raw):
+        """원본 이미지 바이트를 인코딩해 저장하고 키(SHA-256 hex)를 반환한다.
+
+        같은 내용이 이미 있으면 다시 인코딩하지 않고 사용 시각만 갱신한다.
+        """
+        key = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            existing = self._find(key)
+            if existing:
+                os.utime(existing)
+                return key
+
+        fmt, encoded = _encode(raw, self.fmt, self.quality)
+        path = os.path.join(self.root, key + _EXTENSIONS[fmt])
+        tmp_path = "{}.{}.tmp".format(path, threading.get_ident())
+        with open(tmp_path, "wb") as f:
+            f.write(encoded)
+
+        with self._lock:
+            if os.path.exists(path):
+                os.remove(tmp_path)
+                os.utime(path)
+                return key
+            os.replace(tmp_path, path)
+            self._total_bytes += len(encoded)
+            self._evict(keep=path)
+        return key
+
+    async def put_async(self, raw):
+        """put()을 이벤트 루프 밖(스레드 풀)에서 실행한다."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.put, raw)
+
+    def get(self, key):
+        """저장된 인코딩 바이트를 반환한다. 없으면(삭제되었으면) None."""
+        with self._lock:
+            path = self._find(key)
+            if path is None:
+                return None
+            os.utime(path)
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _evict(self, keep=None):
+        """용량 한도를 넘으면 오래 사용되지 않은 파일부터 삭제한다. (잠금 안에서 호출)"""
+        if self._total_bytes <= self.max_bytes:
+            return
+        entries = self._entries()
+        self._total_bytes = sum(size for _, _, size in entries)
+        for _, path, size in sorted(entries):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if path == keep or path.endswith(".tmp"):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._total_bytes -= size
+
+    def stats(self):
+        """저장된 파일 수와 전체 크기를 반환한다."""
+        with self._lock:
+            entries = self._entries()
+        return {
+            "count": len(entries),
+            "bytes": sum(size for _, _, size in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_image_store():
+    """프로세스 공용 ImageStore를 반환한다."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ImageStore()
+        return _store
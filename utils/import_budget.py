@@ -0,0 +1,149 @@
+"""앱 시작(cold start) 시 import 비용 점검.
+
+새 파이썬 프로세스에서 `-X importtime`으로 시작 경로 모듈을 불러와
+모듈별 누적 import 시간을 보고하고, 다음 경우 실패(종료 코드 1)로 처리한다.
+
+- 전체 import 시간이 IMPORT_BUDGET_MS를 넘을 때
+- 첫 사용 시점에 불러와야 하는 무거운 모듈(pandas, plotly 등)이 시작 경로에 섞여 있을 때
+
+streamlit 자체가 pandas/numpy를 불러오므로, 지연 로딩 검사는 EXTERNAL_ROOTS(streamlit)가
+불러온 모듈을 빼고 앱 모듈이 불러온 것만 본다. (-X importtime은 처음 불러온 곳만
+기록하므로 streamlit이 먼저 불러온 모듈을 앱이 다시 import해도 잡히지 않는다)
+
+사용 예:
+    python -m utils.import_budget
+    python -m utils.import_budget --top 30 --budget-ms 800
+    python -m utils.import_budget --module ui.tab_keywords --no-lazy-check
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from config.settings import BASE_DIR, IMPORT_BUDGET_MS
+
+# app.py가 첫 화면(사이드바)을 그리기 전에 불러오는 모듈
+STARTUP_MODULES = ["streamlit", "ui.sidebar"]
+
+# 시작 경로에서 불러오면 안 되는 모듈 (탭/기능을 처음 쓸 때 불러온다)
+LAZY_MODULES = ["pandas", "numpy", "plotly", "PIL", "playwright", "api.naver_searchad_scraper"]
+# 지연 로딩 검사에서 제외할 외부 패키지 (이 패키지가 불러오는 모듈은 앱이 줄일 수 없다)
+EXTERNAL_ROOTS = ["streamlit"]
+
+
+def measure(modules, python=None):
+    """새 프로세스에서 modules를 import하고 -X importtime 결과를 반환한다.
+
+    Returns:
+        (rows, error) — rows는 [{"module", "self_us", "cumulative_us", "depth"}, ...]
+        (import 순서), error는 import 실패 시 stderr 마지막 줄, 성공이면 None
+    """
+    code = "; ".join("import {}".format(m) for m in modules) or "pass"
+    proc = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", code],
+        cwd=BASE_DIR,
+        env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"),
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    other = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            other.append(line)
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 머리글 줄
+        name = parts[2].rstrip()
+        rows.append({
+            "module": name.strip(),
+            "self_us": int(parts[0]),
+            "cumulative_us": int(parts[1]),
+            "depth": (len(name) - len(name.lstrip())) // 2,
+        })
+    error = None
+    if proc.returncode != 0:
+        error = other[-1] if other else "종료 코드 {}".format(proc.returncode)
+    return rows, error
+
+
+def total_us(rows):
+    """최상위 import들의 누적 시간 합계 (마이크로초)."""
+    return sum(r["cumulative_us"] for r in rows if r["depth"] == 0)
+
+
+def imported_by(rows, roots):
+    """roots 모듈이 (간접적으로) 불러온 모듈 이름 집합.
+
+    -X importtime은 하위 import를 부모 줄보다 먼저, 더 깊은 depth로 출력한다.
+    """
+    found = set()
+    for i, r in enumerate(rows):
+        if r["module"] not in roots:
+            continue
+        found.add(r["module"])
+        j = i - 1
+        while j >= 0 and rows[j]["depth"] > r["depth"]:
+            found.add(rows[j]["module"])
+            j -= 1
+    return found
+
+
+def lazy_violations(rows, lazy_modules=LAZY_MODULES, external_roots=EXTERNAL_ROOTS):
+    """앱 모듈이 시작 경로에서 불러온 지연 로딩 대상 모듈 목록."""
+    external = imported_by(rows, external_roots)
+    loaded = {r["module"] for r in rows} - external
+    return [m for m in lazy_modules if m in loaded]
+
+
+def _format_report(rows, top):
+    ranked = sorted(rows, key=lambda r: r["cumulative_us"], reverse=True)[:top]
+    header = "{:>10} {:>10}  {}".format("cum_ms", "self_ms", "module")
+    lines = [header, "-" * len(header)]
+    for r in ranked:
+        lines.append("{:>10.1f} {:>10.1f}  {}".format(
+            r["cumulative_us"] / 1000, r["self_us"] / 1000, r["module"]
+        ))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="앱 시작 import 시간 점검")
+    parser.add_argument(
+        "--module", action="append",
+        help="측정할 모듈 (여러 번 지정 가능, 기본: {})".format(", ".join(STARTUP_MODULES)),
+    )
+    parser.add_argument("--top", type=int, default=20, help="누적 시간 상위 N개 모듈 표시 (기본 20)")
+    parser.add_argument(
+        "--budget-ms", type=float, default=IMPORT_BUDGET_MS,
+        help="전체 import 시간 한도 (밀리초, 기본 {})".format(IMPORT_BUDGET_MS),
+    )
+    parser.add_argument("--no-lazy-check", action="store_true", help="지연 로딩 대상 모듈 검사 생략")
+    args = parser.parse_args(argv)
+
+    modules = args.module or STARTUP_MODULES
+    rows, error = measure(modules)
+    if error:
+        print("import 실패 ({}): {}".format(", ".join(modules), error), file=sys.stderr)
+        return 1
+
+    total_ms = total_us(rows) / 1000
+    print(_format_report(rows, args.top))
+    print()
+    print("모듈 {}개, 전체 {:.1f}ms (한도 {:.0f}ms)".format(len(rows), total_ms, args.budget_ms))
+
+    failed = False
+    if total_ms > args.budget_ms:
+        print("import 시간이 한도를 넘었습니다.", file=sys.stderr)
+        failed = True
+    if not args.no_lazy_check:
+        violations = lazy_violations(rows)
+        if violations:
+            print("시작 경로에서 불러오면 안 되는 모듈: {}".format(", ".join(violations)), file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""API 호출 계측 (타이밍 스팬 + 엔드포인트별 히스토그램).
+
+- span(): 구간 하나의 소요 시간과 속성(상태 코드, 바이트 수, 캐시 적중 등)을 기록한다.
+  endpoint를 주면 끝날 때 엔드포인트별 지연 히스토그램/카운터에 반영된다.
+- trace(): 분석 1회처럼 여러 스팬을 묶어 타이밍 워터폴로 볼 수 있게 모은다.
+- bind(): 스레드 풀에 넘길 함수에 현재 trace/span 문맥을 실어 보낸다.
+  (ThreadPoolExecutor는 contextvars를 자동으로 넘기지 않는다.)
+
+수집된 지표는 to_prometheus()(Prometheus 텍스트 형식) 또는 to_dict()(JSON용)로 내보낸다.
+
+스팬 속성 규칙:
+- API 호출 스팬(response_cache.cached_call): cache = "hit" / "miss" / "refresh" / "off"
+- HTTP 스팬(http_client.request): status, bytes. 부모 스팬의 status/bytes/attempts도 갱신
+"""
+import contextvars
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+# 지연 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_current_span = contextvars.ContextVar("metrics_span", default=None)
+_current_trace = contextvars.ContextVar("metrics_trace", default=None)
+
+
+class Span:
+    """측정 구간 하나."""
+
+    __slots__ = ("name", "attrs", "parent", "start", "end", "thread")
+
+    def __init__(self, name, attrs, parent):
+        self.name = name
+        self.attrs = attrs
+        self.parent = parent
+        self.start = time.perf_counter()
+        self.end = None
+        self.thread = threading.current_thread().name
+
+    @property
+    def duration(self):
+        end = self.end if self.end is not None else time.perf_counter()
+        return end - self.start
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def incr(self, key, amount=1):
+        self.attrs[key] = self.attrs.get(key, 0) + amount
+
+
+class Trace:
+    """한 작업(예: 키워드 분석 1회)에서 끝난 스팬들을 모은다."""
+
+    def __init__(self, name):
+        self.name = name
+        self.start = time.perf_counter()
+        self._spans = []
+        self._lock = threading.Lock()
+
+    def add(self, span):
+        with self._lock:
+            self._spans.append(span)
+
+    def to_list(self):
+        """시작 순서대로 워터폴용 dict 목록을 반환한다.
+
+        Returns:
+            [{"name": "keywordstool", "start_ms": 1.2, "duration_ms": 80.5,
+              "depth": 2, "thread": "...", "attrs": {...}}, ...]
+        """
+        with self._lock:
+            spans = sorted(self._spans, key=lambda s: s.start)
+        rows = []
+        for s in spans:
+            depth = 0
+            parent = s.parent
+            while parent is not None:
+                depth += 1
+                parent = parent.parent
+            rows.append({
+                "name": s.name,
+                "start_ms": round((s.start - self.start) * 1000, 2),
+                "duration_ms": round(s.duration * 1000, 2),
+                "depth": depth,
+                "thread": s.thread,
+                "attrs": dict(s.attrs),
+            })
+        return rows
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join('{}="{}"'.format(k, _escape(v)) for k, v in labels.items()) + "}"
+
+
+class MetricsRegistry:
+    """엔드포인트별 지연 히스토그램과 호출/바이트/재시도 카운터. 스레드 안전."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._histograms = {}   # endpoint → [bucket counts..., +Inf count], sum
+        self._requests = {}     # (endpoint, status, cache) → count
+        self._bytes = {}        # endpoint → bytes
+        self._retries = {}      # endpoint → count
+
+    def observe(self, endpoint, span):
+        attrs = span.attrs
+        cache = attrs.get("cache", "off")
+        status = attrs.get("status")
+        if status is None:
+            status = "cached" if cache == "hit" else "error"
+        duration = span.duration
+        with self._lock:
+            counts, total = self._histograms.get(endpoint, ([0] * (len(self.buckets) + 1), 0.0))
+            for i, bound in enumerate(self.buckets):
+                if duration <= bound:
+                    counts[i] += 1
+            counts[-1] += 1
+            self._histograms[endpoint] = (counts, total + duration)
+
+            key = (endpoint, str(status), cache)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._bytes[endpoint] = self._bytes.get(endpoint, 0) + attrs.get("bytes", 0)
+            retries = max(0, attrs.get("attempts", 0) - 1)
+            if retries:
+                self._retries[endpoint] = self._retries.get(endpoint, 0) + retries
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._requests.clear()
+            self._bytes.clear()
+            self._retries.clear()
+
+    def to_dict(self):
+        """JSON으로 내보낼 수 있는 지표 dict를 반환한다."""
+        with self._lock:
+            return {
+                "latency_seconds": {
+                    endpoint: {
+                        "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], counts)),
+                        "sum": round(total, 6),
+                        "count": counts[-1],
+                    }
+                    for endpoint, (counts, total) in self._histograms.items()
+                },
+                "requests": [
+                    {"endpoint": e, "status": s, "cache": c, "count": n}
+                    for (e, s, c), n in sorted(self._requests.items())
+                ],
+                "response_bytes": dict(self._bytes),
+                "retries": dict(self._retries),
+            }
+
+    def to_prometheus(self, prefix="naver_api"):
+        """Prometheus 텍스트 노출 형식으로 지표를 반환한다."""
+        lines = []
+        with self._lock:
+            name = prefix + "_request_duration_seconds"
+            lines.append("# HELP {} API 호출 지연 시간".format(name))
+            lines.append("# TYPE {} histogram".format(name))
+            for endpoint, (counts, total) in sorted(self._histograms.items()):
+                for bound, count in zip(self.buckets, counts):
+                    lines.append("{}_bucket{} {}".format(name, _labels(endpoint=endpoint, le=bound), count))
+                lines.append("{}_bucket{} {}".format(name, _labels(endpoint=endpoint, le="+Inf"), counts[-1]))
+                lines.append("{}_sum{} {:.6f}".format(name, _labels(endpoint=endpoint), total))
+                lines.append("{}_count{} {}".format(name, _labels(endpoint=endpoint), counts[-1]))
+
+            name = prefix + "_requests_total"
+            lines.append("# HELP {} API 호출 수 (상태 코드, 캐시 적중 여부별)".format(name))
+            lines.append("# TYPE {} counter".format(name))
+            for (endpoint, status, cache), count in sorted(self._requests.items()):
+                lines.append("{}{} {}".format(
+                    name, _labels(endpoint=endpoint, status=status, cache=cache), count
+                ))
+
+            name = prefix + "_response_bytes_total"
+            lines.append("# HELP {} 응답 본문 바이트 수".format(name))
+            lines.append("# TYPE {} counter".format(name))
+            for endpoint, total in sorted(self._bytes.items()):
+                lines.append("{}{} {}".format(name, _labels(endpoint=endpoint), total))
+
+            name = prefix + "_retries_total"
+            lines.append("# HELP {} 재시도 횟수".format(name))
+            lines.append("# TYPE {} counter".format(name))
+            for endpoint, total in sorted(self._retries.items()):
+                lines.append("{}{} {}".format(name, _labels(endpoint=endpoint), total))
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+@contextmanager
+def span(name, endpoint=None, **attrs):
+    """구간 하나를 측정한다. with 블록 안에서 yield된 Span에 속성을 추가할 수 있다.
+
+    Args:
+        endpoint: 주면 끝날 때 이 이름으로 히스토그램/카운터에 반영한다.
+    """
+    s = Span(name, attrs, _current_span.get())
+    token = _current_span.set(s)
+    try:
+        yield s
+    except BaseException as e:
+        s.attrs.setdefault("status", "error")
+        s.attrs["error"] = type(e).__name__
+        raise
+    finally:
+        s.end = time.perf_counter()
+        _current_span.reset(token)
+        if endpoint is not None:
+            registry.observe(endpoint, s)
+        current = _current_trace.get()
+        if current is not None:
+            current.add(s)
+
+
+def current_span():
+    """현재 문맥의 Span. 없으면 None."""
+    return _current_span.get()
+
+
+@contextmanager
+def trace(name, **attrs):
+    """name 스팬을 루트로 하는 Trace를 시작한다. 안쪽 스팬은 모두 여기에 모인다."""
+    t = Trace(name)
+    token = _current_trace.set(t)
+    try:
+        with span(name, **attrs):
+            yield t
+    finally:
+        _current_trace.reset(token)
+
+
+def bind(func):
+    """현재 trace/span 문맥에서 실행되도록 func를 감싼다. (스레드 풀 제출용)
+
+    호출마다 문맥을 복사하므로 같은 함수를 여러 스레드에서 동시에 실행해도 된다.
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def _run(*args, **kwargs):
+        return context.copy().run(func, *args, **kwargs)
+
+    return _run
+
+
+def to_prometheus():
+    return registry.to_prometheus()
+
+
+def to_dict():
+    return registry.to_dict()
@@ -0,0 +1,182 @@
+"""API 호출 예산 관리 (SQLite).
+
+인증 정보(클라이언트 ID / API 키)별로 오늘 사용한 호출 수를 기록해
+일일 한도를 넘기기 전에 작업을 받을지(admit) 미룰지 결정한다.
+초당 호출 수는 인증 정보별 토큰 버킷으로 제한한다.
+
+- admit(): 작업 단위(예: 인구통계 1회 = 13회 호출)를 시작하기 전에 남은 예산을 확인
+- acquire(): 실제 요청 직전에 1회분을 차감하고 초당 한도만큼 대기
+- mark_exhausted(): 일일 한도 소진을 뜻하는 429 응답을 받으면 오늘 남은 예산을 0으로 처리
+
+예산이 부족하면 요청을 보내지 않고 QuotaExceeded를 발생시킨다.
+초당 한도 초과 429는 예산과 무관하므로 RateLimited로 구분한다. (잠시 후 재시도 가능)
+두 예외는 utils/errors.py에 있다.
+사용량은 로컬 날짜 기준으로 0시에 초기화된다.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from config.settings import (
+    QUOTA_DB_PATH,
+    DATALAB_DAILY_QUOTA,
+    DATALAB_RATE_PER_SEC,
+    SEARCHAD_DAILY_QUOTA,
+    SEARCHAD_RATE_PER_SEC,
+)
+from utils.errors import SERVICE_LABELS, QuotaExceeded
+from utils.rate_limit import get_limiter
+from utils.response_cache import next_day_start
+
+# 서비스별 (표시 이름, 일일 한도, 초당 한도). 일일 한도 None은 제한 없음.
+SERVICE_LIMITS = {
+    "datalab": (SERVICE_LABELS["datalab"], DATALAB_DAILY_QUOTA, DATALAB_RATE_PER_SEC),
+    "searchad": (SERVICE_LABELS["searchad"], SEARCHAD_DAILY_QUOTA, SEARCHAD_RATE_PER_SEC),
+}
+
+# 사용량 기록 보관 일수
+_RETENTION_DAYS = 7
+
+
+def credential_key(identity):
+    """클라이언트 ID / API 키를 저장용 식별자로 바꾼다. (원문은 남기지 않음)"""
+    return hashlib.sha256((identity or "").encode("utf-8")).hexdigest()[:16]
+
+
+def _today():
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+class QuotaScheduler:
+    """서비스 + 인증 정보별 일일 사용량을 기록하고 호출을 허가한다."""
+
+    def __init__(self, path=QUOTA_DB_PATH, limits=None):
+        self.path = path
+        self.limits = limits or SERVICE_LIMITS
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS quota_usage ("
+            " service TEXT NOT NULL,"
+            " credential TEXT NOT NULL,"
+            " day TEXT NOT NULL,"
+            " used INTEGER NOT NULL DEFAULT 0,"
+            " exhausted INTEGER NOT NULL DEFAULT 0,"
+            " PRIMARY KEY (service, credential, day))"
+        )
+        cutoff = (datetime.now() - timedelta(days=_RETENTION_DAYS)).strftime("%Y-%m-%d")
+        self._conn.execute("DELETE FROM quota_usage WHERE day < ?", (cutoff,))
+        self._conn.commit()
+
+    def _row(self, service, cred):
+        """오늘의 (used, exhausted)를 반환한다. (잠금 안에서 호출)"""
+        row = self._conn.execute(
+            "SELECT used, exhausted FROM quota_usage"
+            " WHERE service = ? AND credential = ? AND day = ?",
+            (service, cred, _today()),
+        ).fetchone()
+        return row if row else (0, 0)
+
+    def _remaining(self, service, cred):
+        """남은 호출 수. 일일 한도가 없으면 None. (잠금 안에서 호출)"""
+        daily = self.limits[service][1]
+        if daily is None:
+            return None
+        used, exhausted = self._row(service, cred)
+        if exhausted:
+            return 0
+        return max(0, daily - used)
+
+    def remaining(self, service, identity):
+        """오늘 남은 호출 수를 반환한다. 일일 한도가 없는 서비스는 None."""
+        with self._lock:
+            return self._remaining(service, credential_key(identity))
+
+    def usage(self, service, identity):
+        """오늘 사용량을 반환한다.
+
+        Returns:
+            {"used": 120, "limit": 1000, "remaining": 880,
+             "exhausted": False, "resets_at": epoch 초}
+        """
+        cred = credential_key(identity)
+        with self._lock:
+            used, exhausted = self._row(service, cred)
+            remaining = self._remaining(service, cred)
+        return {
+            "used": used,
+            "limit": self.limits[service][1],
+            "remaining": remaining,
+            "exhausted": bool(exhausted),
+            "resets_at": next_day_start(),
+        }
+
+    def admit(self, service, identity, cost=1):
+        """cost회 호출이 필요한 작업을 시작해도 되는지 확인한다.
+
+        예산을 미리 차감하지는 않는다. 동시에 허가된 작업들이 한도를 넘기면
+        나중 요청의 acquire()에서 QuotaExceeded가 발생한다.
+
+        Returns:
+            남은 호출 수 (한도가 없으면 None)
+
+        Raises:
+            QuotaExceeded: 남은 호출 수가 cost보다 적을 때
+        """
+        with self._lock:
+            remaining = self._remaining(service, credential_key(identity))
+        if remaining is not None and remaining < cost:
+            raise QuotaExceeded(service, remaining, cost)
+        return remaining
+
+    def acquire(self, service, identity):
+        """요청 1회분을 차감하고 초당 한도에 맞춰 대기한다.
+
+        Raises:
+            QuotaExceeded: 오늘 남은 호출이 없을 때
+        """
+        cred = credential_key(identity)
+        with self._lock:
+            remaining = self._remaining(service, cred)
+            if remaining is not None and remaining < 1:
+                raise QuotaExceeded(service, 0, 1)
+            self._conn.execute(
+                "INSERT INTO quota_usage (service, credential, day, used) VALUES (?, ?, ?, 1)"
+                " ON CONFLICT (service, credential, day) DO UPDATE SET used = used + 1",
+                (service, cred, _today()),
+            )
+            self._conn.commit()
+        per_sec = self.limits[service][2]
+        get_limiter("{}:{}".format(service, cred), per_sec).acquire()
+
+    def mark_exhausted(self, service, identity):
+        """일일 한도 소진(429) 응답을 받은 인증 정보의 오늘 예산을 0으로 처리한다.
+
+        초당 한도 초과 429에는 호출하지 않는다. (RateLimited로 처리)
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO quota_usage (service, credential, day, exhausted) VALUES (?, ?, ?, 1)"
+                " ON CONFLICT (service, credential, day) DO UPDATE SET exhausted = 1",
+                (service, credential_key(identity), _today()),
+            )
+            self._conn.commit()
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_quota_scheduler():
+    """프로세스 공용 QuotaScheduler를 반환한다."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = QuotaScheduler()
+        return _scheduler
@@ -0,0 +1,59 @@
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """토큰 버킷 방식의 스레드 안전 호출 속도 제한기.
+
+    초당 rate개의 토큰이 채워지고 최대 capacity개까지 쌓인다.
+    토큰이 부족하면 음수로 예약해 두고 그만큼 대기하므로
+    여러 스레드가 동시에 요청해도 호출 순서대로 간격이 벌어진다.
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1.0):
+        """토큰을 예약하고 호출 전까지 기다려야 할 시간(초)을 반환한다."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens=1.0):
+        """토큰을 얻을 때까지 현재 스레드를 대기시킨다."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens=1.0):
+        """토큰을 얻을 때까지 이벤트 루프를 막지 않고 대기한다."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(name, rate, capacity=None):
+    """이름별로 프로세스 전체에서 공유되는 TokenBucket을 반환한다."""
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = TokenBucket(rate, capacity)
+            _limiters[name] = limiter
+        return limiter
@@ -0,0 +1,261 @@
+"""API 응답 디스크 캐시 (SQLite).
+
+요청 파라미터를 정규화한 키로 디코딩된 JSON 응답을 저장한다.
+엔드포인트별 데이터 갱신 주기에 맞춰 만료 시각을 정한다.
+
+- keywordstool: 직전 완료월 기준 데이터 → 다음 달 1일 0시까지 유지
+- 데이터랩: 일 단위 데이터 → 다음 날 0시까지 유지
+- 자동완성: AUTOCOMPLETE_CACHE_TTL(분 단위) 동안 유지
+
+CACHE_MAX_ENTRIES를 넘으면 마지막 사용 시각이 가장 오래된 항목부터 삭제한다.
+캐시 적중 때마다 디스크에 쓰지 않도록 마지막 사용 시각은 메모리에 모아 두었다가
+저장(set) 직전이나 CACHE_ACCESS_FLUSH_SIZE개가 쌓였을 때 한 번에 기록한다.
+
+사용자가 새로고침을 요청하면 bypass() 블록 안에서 호출해 캐시를 읽지 않고
+새로 받은 응답으로 덮어쓴다.
+"""
+import contextvars
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from config.settings import (
+    CACHE_ENABLED,
+    CACHE_DB_PATH,
+    CACHE_MAX_ENTRIES,
+    CACHE_ACCESS_FLUSH_SIZE,
+)
+from utils import json_codec, metrics
+
+
+_bypass = contextvars.ContextVar("response_cache_bypass", default=False)
+
+
+@contextmanager
+def bypass(enabled=True):
+    """이 블록 안의 cached_call()은 캐시를 읽지 않고 새로 받아 덮어쓴다.
+
+    문맥 변수로 전달되므로 스레드 풀에 넘기는 함수는 metrics.bind()로 감싼다.
+    """
+    token = _bypass.set(enabled)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def next_month_start():
+    """다음 달 1일 0시의 epoch 초를 반환한다."""
+    now = datetime.now()
+    if now.month == 12:
+        boundary = datetime(now.year + 1, 1, 1)
+    else:
+        boundary = datetime(now.year, now.month + 1, 1)
+    return boundary.timestamp()
+
+
+def next_day_start():
+    """다음 날 0시의 epoch 초를 반환한다."""
+    tomorrow = datetime.now().date() + timedelta(days=1)
+    return datetime(tomorrow.year, tomorrow.month, tomorrow.day).timestamp()
+
+
+def expires_in(seconds):
+    """지금부터 seconds초 뒤를 만료 시각으로 하는 함수를 반환한다."""
+    return lambda: time.time() + seconds
+
+
+def make_key(namespace, params):
+    """namespace와 파라미터 dict로 정규화된 캐시 키를 만든다."""
+    canonical = json.dumps(params, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return "{}:{}".format(namespace, digest)
+
+
+class ResponseCache:
+    """SQLite 기반 TTL + LRU 응답 캐시. 여러 스레드에서 공유할 수 있다."""
+
+    def __init__(self, path, max_entries=CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._hits = {}
+        self._misses = {}
+        # 아직 기록하지 않은 마지막 사용 시각 {key: epoch 초}
+        self._pending_access = {}
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_last_access"
+            " ON responses (last_access)"
+        )
+        self._conn.commit()
+
+    def _count(self, counter, namespace):
+        counter[namespace] = counter.get(namespace, 0) + 1
+
+    def _flush_access(self):
+        """모아 둔 마지막 사용 시각을 기록한다. (잠금 안에서 호출, 커밋은 호출한 쪽에서)"""
+        if self._pending_access:
+            self._conn.executemany(
+                "UPDATE responses SET last_access = ? WHERE key = ?",
+                [(at, key) for key, at in self._pending_access.items()],
+            )
+            self._pending_access.clear()
+
+    def get(self, namespace, params):
+        """캐시된 값을 반환한다. 없거나 만료되었으면 None."""
+        key = make_key(namespace, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                self._count(self._misses, namespace)
+                return None
+            self._pending_access[key] = now
+            if len(self._pending_access) >= CACHE_ACCESS_FLUSH_SIZE:
+                self._flush_access()
+                self._conn.commit()
+            self._count(self._hits, namespace)
+        return json_codec.loads(row[0])
+
+    def contains(self, namespace, params):
+        """만료되지 않은 값이 있는지 확인한다. (통계/사용 시각에 반영하지 않음)"""
+        key = make_key(namespace, params)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM responses WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return row is not None
+
+    def set(self, namespace, params, value, expires_at):
+        """값을 저장하고 필요하면 LRU 순서로 오래된 항목을 삭제한다."""
+        key = make_key(namespace, params)
+        payload = json_codec.dumps(value)
+        now = time.time()
+        with self._lock:
+            # LRU 삭제 순서가 정확하도록 모아 둔 사용 시각부터 반영한다.
+            self._flush_access()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at, last_access)"
+                " VALUES (?, ?, ?, ?)",
+                (key, payload, expires_at, now),
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    " SELECT key FROM responses ORDER BY last_access ASC LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            self._conn.commit()
+
+    def purge_expired(self):
+        """만료된 항목을 모두 삭제하고 삭제 개수를 반환한다."""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+            )
+            self._conn.commit()
+            return cur.rowcount
+
+    def clear(self):
+        """모든 항목과 통계를 초기화한다."""
+        with self._lock:
+            self._pending_access.clear()
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._hits.clear()
+            self._misses.clear()
+
+    def stats(self):
+        """namespace별 hit/miss 횟수와 전체 항목 수를 반환한다.
+
+        Returns:
+            {"entries": 120, "hits": {"keywordstool": 10}, "misses": {...}}
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return {
+                "entries": entries,
+                "hits": dict(self._hits),
+                "misses": dict(self._misses),
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """프로세스 공용 캐시를 반환한다. CACHE_ENABLED가 꺼져 있으면 None."""
+    global _cache
+    if not CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(CACHE_DB_PATH)
+        return _cache
+
+
+def is_cached(namespace, params):
+    """캐시에서 바로 응답할 수 있는 요청인지 확인한다. bypass() 안에서는 항상 False."""
+    cache = get_cache()
+    return cache is not None and not _bypass.get() and cache.contains(namespace, params)
+
+
+def cached_call(namespace, params, expires_at, fetch, refresh=False):
+    """캐시에 있으면 캐시 값을, 없으면 fetch()를 호출해 저장 후 반환한다.
+
+    Args:
+        namespace: 엔드포인트 구분자 (예: "keywordstool")
+        params: 응답을 결정하는 요청 파라미터 (인증 정보 제외)
+        expires_at: 만료 시각(epoch 초)을 반환하는 함수
+        fetch: 실제 API를 호출해 JSON으로 직렬화 가능한 값을 반환하는 함수.
+               예외가 발생하면 캐시에 저장하지 않고 그대로 전파한다.
+        refresh: True이면 (또는 bypass() 블록 안이면) 캐시를 읽지 않고
+                 fetch() 결과로 덮어쓴다.
+
+    호출 1회는 namespace 이름의 계측 스팬(utils/metrics.py)으로 기록된다.
+    """
+    with metrics.span(namespace, endpoint=namespace) as span:
+        cache = get_cache()
+        if cache is None:
+            span.set(cache="off")
+            return fetch()
+
+        if refresh or _bypass.get():
+            span.set(cache="refresh")
+        else:
+            value = cache.get(namespace, params)
+            if value is not None:
+                span.set(cache="hit")
+                return value
+            span.set(cache="miss")
+
+        value = fetch()
+        if value is not None:
+            cache.set(namespace, params, value, expires_at())
+        return value
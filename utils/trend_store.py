@@ -0,0 +1,123 @@
+"""키워드별 일별 ratio 시계열 저장소 (SQLite).
+
+데이터랩 일별 추이를 매일 전체 기간으로 다시 받지 않고,
+새로 생긴 날짜만 받아 이어 붙일 수 있도록 이전에 받은 값을 보관한다.
+시리즈 키는 키워드와 필터(성별/연령/디바이스)를 합쳐 만든다.
+
+같은 시리즈를 서로 다른 기간(days)으로 조회할 수 있으므로 시리즈별로
+지금까지 요청된 가장 긴 기간을 기록하고, 오래된 값은 그 기간 밖만 삭제한다.
+"""
+import json
+import os
+import sqlite3
+import threading
+
+from config.settings import TREND_STORE_PATH
+
+
+def make_series_key(keyword, filters=None):
+    """키워드 + 필터 조합으로 시리즈 키를 만든다."""
+    return json.dumps(
+        {"keyword": keyword, "filters": filters or {}},
+        sort_keys=True, ensure_ascii=False, separators=(",", ":"),
+    )
+
+
+class TrendStore:
+    """시리즈 키별 {period: ratio}를 저장한다. 여러 스레드에서 공유할 수 있다."""
+
+    def __init__(self, path=TREND_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS daily_ratios ("
+            " series_key TEXT NOT NULL,"
+            " period TEXT NOT NULL,"
+            " ratio REAL NOT NULL,"
+            " PRIMARY KEY (series_key, period))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS series_windows ("
+            " series_key TEXT PRIMARY KEY,"
+            " max_days INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    def note_window(self, series_key, days):
+        """이 시리즈에 요청된 기간(days)을 기록하고 지금까지의 최대 기간을 반환한다."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO series_windows (series_key, max_days) VALUES (?, ?)"
+                " ON CONFLICT (series_key) DO UPDATE"
+                " SET max_days = MAX(max_days, excluded.max_days)",
+                (series_key, days),
+            )
+            self._conn.commit()
+            return self._conn.execute(
+                "SELECT max_days FROM series_windows WHERE series_key = ?", (series_key,)
+            ).fetchone()[0]
+
+    def load(self, series_key, start=None, end=None):
+        """기간 내 저장된 값을 period 오름차순 [(period, ratio), ...]로 반환한다."""
+        query = "SELECT period, ratio FROM daily_ratios WHERE series_key = ?"
+        args = [series_key]
+        if start:
+            query += " AND period >= ?"
+            args.append(start)
+        if end:
+            query += " AND period <= ?"
+            args.append(end)
+        query += " ORDER BY period"
+        with self._lock:
+            return self._conn.execute(query, args).fetchall()
+
+    def save(self, series_key, points):
+        """[(period, ratio), ...]를 저장한다. 같은 period는 덮어쓴다."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO daily_ratios (series_key, period, ratio)"
+                " VALUES (?, ?, ?)",
+                [(series_key, period, ratio) for period, ratio in points],
+            )
+            self._conn.commit()
+
+    def replace(self, series_key, points):
+        """시리즈를 통째로 교체한다. (스케일을 새로 잡을 때 사용)"""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM daily_ratios WHERE series_key = ?", (series_key,)
+            )
+            self._conn.executemany(
+                "INSERT INTO daily_ratios (series_key, period, ratio) VALUES (?, ?, ?)",
+                [(series_key, period, ratio) for period, ratio in points],
+            )
+            self._conn.commit()
+
+    def prune(self, series_key, before):
+        """before(YYYY-MM-DD)보다 이전 값을 삭제한다.
+
+        다른 호출이 더 긴 기간을 쓰고 있을 수 있으므로 before는
+        note_window()가 반환한 최대 기간으로 계산해야 한다.
+        """
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM daily_ratios WHERE series_key = ? AND period < ?",
+                (series_key, before),
+            )
+            self._conn.commit()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_trend_store():
+    """프로세스 공용 TrendStore를 반환한다."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = TrendStore()
+        return _store